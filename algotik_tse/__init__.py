@@ -41,24 +41,52 @@ Quick Start
     # Live market snapshot
     att.get_market_snapshot()
 
+    # Whole-market daily closing data for recent sessions (one request)
+    att.get_market_history(start='1404-11-01')
+
+    # Poll only the changes of the live snapshot
+    session = att.MarketWatchSession()
+    session.update()
+
+    # Only the new trades of several symbols on every poll
+    candles = att.CandleAggregator(['1min', '5min'])
+    for trades in att.TickStream(['شتران', 'فولاد'], interval=1):
+        print(candles.update_trades(trades))   # candles closed by these trades
+
+    # Trading calendar (holidays from the overall index sessions)
+    att.is_session('1404-01-02')         # False — Nowruz
+    att.sessions_between('1404-11-01', '1404-11-30')
+
     # Options chain
     att.list_options(underlying='اهرم')
     att.get_options_chain('اهرم')
+    att.get_all_option_chains()          # every underlying, one pass
+    att.option_greeks(att.get_options_chain('اهرم'))   # IV, delta, gamma...
 
     # ETFs with NAV
     att.list_etfs()
 
     # Bonds & treasury bills
     att.list_bonds()
+    att.get_yield_curve()                # treasury bill YTM curve
 
     # Investment funds — NAV, returns, portfolio, manager
     att.list_funds()
     att.list_funds(fund_type='equity')
+    att.get_fund_nav_history(11378)      # from recorded list_funds() snapshots
 
     # Configure settings
     att.settings.ssl_verify = True    # Enable SSL verification
     att.settings.timeout = 15         # Request timeout (seconds)
     att.settings.rate_limit_delay = 0.5  # Delay between requests (seconds)
+    att.settings.max_workers = 4      # Parallel multi-symbol fetching
+    att.settings.cache_enabled = True  # Cache responses on disk
+    att.clear_cache()                 # Drop cached responses
+    att.settings.symbol_index = True  # Resolve symbols from a local index
+    att.refresh_symbol_index()        # Rebuild the local symbol → InsCode index
+    att.settings.history_store = True  # Keep daily history in local Parquet files
+    att.settings.intraday_store = True  # Keep past intraday days in local Parquet files
+    att.settings.trading_calendar = True  # Skip market holidays in get_intraday()
 """
 
 __author__ = """Mohsen Alipour"""
@@ -66,6 +94,11 @@ __email__ = "alipour@algotik.ir"
 __version__ = "1.0.1"
 
 from algotik_tse.settings import settings
+from algotik_tse.http_cache import clear_cache
+from algotik_tse.core.symbol_index import refresh_symbol_index
+from algotik_tse.core.history_store import clear_history_store
+from algotik_tse.core.fund_store import clear_fund_store
+from algotik_tse.core.intraday_store import clear_intraday_store
 from algotik_tse.core.stock_detail import (
     stockdetail,
     stock_information,
@@ -76,14 +109,31 @@ from algotik_tse.core.stock import stock, stock_RI, stock_RL, stock_capital_incr
 from algotik_tse.core.shareholders import shareholders
 from algotik_tse.core.currency import currency_coin
 from algotik_tse.core.intraday import stock_intraday
-from algotik_tse.core.market_data import market_watch, market_client_type, market_data
+from algotik_tse.core.live import TickStream, CandleAggregator
+from algotik_tse.core.market_data import (
+    market_watch,
+    market_client_type,
+    market_data,
+    market_history,
+    MarketWatchSession,
+)
 from algotik_tse.core.instruments import (
     list_options,
     get_options_chain,
+    get_all_option_chains,
     list_etfs,
     list_bonds,
+    get_yield_curve,
     list_funds,
 )
+from algotik_tse.core.analytics import option_greeks, implied_volatility
+from algotik_tse.core.fund_store import record_fund_snapshot, get_fund_nav_history
+from algotik_tse.core.trading_calendar import (
+    is_session,
+    sessions_between,
+    trading_sessions,
+    refresh_trading_calendar,
+)
 
 # ── Standard API aliases (recommended) ────────────────────────
 # These are the canonical function names following REST/finance conventions.
@@ -106,6 +156,7 @@ def get_history(
     return_type=None,
     ascending=True,
     save_path=None,
+    max_workers=None,
     **kwargs
 ):
     """Get historical OHLCV price data for one or more symbols."""
@@ -125,6 +176,7 @@ def get_history(
         return_type=return_type,
         ascending=ascending,
         save_path=save_path,
+        max_workers=max_workers,
         **kwargs
     )
 
@@ -142,6 +194,7 @@ def get_client_type(
     dropna=True,
     ascending=True,
     save_path=None,
+    max_workers=None,
     **kwargs
 ):
     """Get retail/institutional (حقیقی/حقوقی) trade data per symbol."""
@@ -158,6 +211,7 @@ def get_client_type(
         dropna=dropna,
         ascending=ascending,
         save_path=save_path,
+        max_workers=max_workers,
         **kwargs
     )
 
@@ -289,9 +343,19 @@ def get_market_client_type(*args, **kwargs):
     return market_client_type(*args, **kwargs)
 
 
+def get_market_history(*args, **kwargs):
+    """Get daily closing data of all instruments for recent sessions."""
+    return market_history(*args, **kwargs)
+
+
 __all__ = [
     # Settings
     "settings",
+    "clear_cache",
+    "refresh_symbol_index",
+    "clear_history_store",
+    "clear_fund_store",
+    "clear_intraday_store",
     # ── Standard API (recommended) ──
     "get_history",
     "get_client_type",
@@ -305,12 +369,26 @@ __all__ = [
     "get_currency",
     "get_market_snapshot",
     "get_market_client_type",
+    "get_market_history",
+    "MarketWatchSession",
+    "TickStream",
+    "CandleAggregator",
+    "is_session",
+    "sessions_between",
+    "trading_sessions",
+    "refresh_trading_calendar",
     # ── Instruments ──
     "list_options",
     "get_options_chain",
+    "get_all_option_chains",
     "list_etfs",
     "list_bonds",
+    "get_yield_curve",
     "list_funds",
+    "record_fund_snapshot",
+    "get_fund_nav_history",
+    "option_greeks",
+    "implied_volatility",
     # ── Legacy names (backward compatible) ──
     "stock",
     "stock_RI",
@@ -325,5 +403,6 @@ __all__ = [
     "currency_coin",
     "market_watch",
     "market_client_type",
+    "market_history",
     "market_data",
 ]
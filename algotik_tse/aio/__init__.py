@@ -0,0 +1,47 @@
+"""Asyncio API for algotik_tse.
+
+Coroutine versions of the public ``get_*`` functions, backed by a
+non-blocking HTTP transport (``httpx``) instead of ``safe_get``. Results
+are identical to the blocking API because both share the same parsers.
+
+Requires the optional ``httpx`` dependency::
+
+    pip install algotik_tse[async]
+
+Example
+-------
+.. code-block:: python
+
+    import asyncio
+    from algotik_tse import aio
+
+    async def main():
+        prices, funds = await asyncio.gather(
+            aio.get_history(['شتران', 'فملی'], limit=100),
+            aio.list_funds(fund_type='equity'),
+        )
+        await aio.aclose()
+
+    asyncio.run(main())
+"""
+
+from algotik_tse.aio.http_client import async_get, aclose
+from algotik_tse.aio.api import (
+    get_history,
+    get_client_type,
+    get_intraday,
+    get_market_snapshot,
+    get_currency,
+    list_funds,
+)
+
+__all__ = [
+    "get_history",
+    "get_client_type",
+    "get_intraday",
+    "get_market_snapshot",
+    "get_currency",
+    "list_funds",
+    "async_get",
+    "aclose",
+]
@@ -0,0 +1,540 @@
+"""Async versions of the public ``get_*`` functions.
+
+Each coroutine mirrors the signature of its blocking counterpart in
+:mod:`algotik_tse` and only replaces the network layer: responses are
+fetched with :func:`algotik_tse.aio.http_client.async_get` and then handed
+to the same parser functions the blocking API uses, so both return
+identical DataFrames.
+
+Multi-symbol calls fetch every symbol concurrently on the event loop.
+"""
+
+import asyncio
+
+from persiantools import characters
+
+from algotik_tse.settings import settings
+from algotik_tse.aio.http_client import async_get, HTTPError
+from algotik_tse.core import fund_store, intraday_store, symbol_index
+from algotik_tse.core.search import _local_code, _parse_search
+from algotik_tse.core.stock import _history_source, _parse_history, _parse_client_type
+from algotik_tse.core.currency import _build_currency_history
+from algotik_tse.core.market_data import _parse_market_watch
+from algotik_tse.core.intraday import (
+    _validate_interval,
+    _check_web_id,
+    _historical_date_list,
+    _parse_historical_day,
+    _store_historical_day,
+    _parse_today_trades,
+    _build_historical_intraday,
+    _build_today_intraday,
+    _combine_intraday,
+)
+from algotik_tse.core.instruments import (
+    _resolve_fund_types,
+    _build_funds_frame,
+)
+from algotik_tse.core.helper import save_csv, apply_ascending, combine_frames
+from algotik_tse.exceptions import ConnectionError
+
+
+# ── helpers ───────────────────────────────────────────────────
+
+
+async def _search_stock(search_txt):
+    """Async counterpart of :func:`algotik_tse.core.search.search_stock`."""
+    local_id = _local_code(search_txt)
+    if local_id is not None:
+        return local_id
+    if settings.symbol_index:
+        # Read-only: building the index would block the event loop
+        ins_code = symbol_index.lookup(search_txt, build=False)
+        if ins_code is not None:
+            return ins_code
+    try:
+        response = await async_get(settings.url_search.format(search_txt))
+        return _parse_search(response.json())
+    except HTTPError:
+        print("Connection Error!")
+        return None
+    except (ValueError, KeyError, IndexError, TypeError) as e:
+        print("Search Error: {}".format(e))
+        return None
+
+
+def _normalize_symbol(symbol):
+    return characters.ar_to_fa(symbol).strip("\u200c").strip()
+
+
+async def _collect(
+    names,
+    fetch_one,
+    is_list,
+    describe,
+    progress,
+    save_to_file,
+    save_path,
+    file_suffix,
+    dropna,
+    ascending,
+    none_found_msg,
+):
+    """Fetch every name concurrently and assemble like the blocking API.
+
+    A single name returns its DataFrame as-is; a list returns the
+    ``(column, symbol)`` MultiIndex frame built by :func:`combine_frames`.
+    """
+    total = len(names) if is_list else 1
+    if progress:
+        for n, name in enumerate(names, start=1):
+            print("{}/{}: {} {}".format(n, total, describe, name))
+
+    frames = await asyncio.gather(*(fetch_one(name) for name in names))
+
+    if not is_list:
+        df = frames[0]
+        if progress and df is not None:
+            print("1/1: Completed!")
+        if save_to_file and df is not None:
+            if progress:
+                print("Saving to file: {}{}".format(names[0], file_suffix))
+            save_csv(df, names[0] + file_suffix, save_path)
+        return apply_ascending(df, ascending)
+
+    df_dict = {}
+    for name, df in zip(names, frames):
+        if df is not None:
+            df_dict[name] = df
+        else:
+            print("{} not Found!".format(name))
+    if progress:
+        print("{}/{} Completed!".format(total, total))
+
+    if len(df_dict) == 0:
+        print(none_found_msg)
+        return None
+    if len(df_dict) == 1:
+        df = next(iter(df_dict.values()))
+    else:
+        df = combine_frames(df_dict, dropna=dropna)
+    if save_to_file:
+        file_name = "-".join(df_dict.keys())
+        if progress:
+            print("Saving to file: {}{}".format(file_name, file_suffix))
+        save_csv(df, file_name + file_suffix, save_path)
+    return apply_ascending(df, ascending)
+
+
+# ══════════════════════════════════════════════════════════════
+#  Price history / client type
+# ══════════════════════════════════════════════════════════════
+
+
+async def get_history(
+    symbol="",
+    start=None,
+    end=None,
+    limit=0,
+    raw=False,
+    auto_adjust=True,
+    output_type="standard",
+    date_format="jalali",
+    progress=True,
+    save_to_file=False,
+    dropna=True,
+    adjust_volume=False,
+    return_type=None,
+    ascending=True,
+    save_path=None,
+    **kwargs
+):
+    """Async version of :func:`algotik_tse.get_history`."""
+    if not symbol and "stock" in kwargs:
+        symbol = kwargs.pop("stock")
+    if "values" in kwargs:
+        limit = kwargs.pop("values")
+    if "tse_format" in kwargs:
+        raw = kwargs.pop("tse_format")
+    if "multi_stock_drop" in kwargs:
+        dropna = kwargs.pop("multi_stock_drop")
+    if output_type == "complete":
+        output_type = "full"
+
+    async def _fetch_one(stock_name):
+        web_id = await _search_stock(stock_name)
+        web_id, kind, url = _history_source(web_id)
+        try:
+            content = (await async_get(url)).content
+        except HTTPError:
+            print("Connection Error!")
+            return None
+        return _parse_history(
+            content,
+            web_id,
+            kind,
+            stock_name,
+            start,
+            end,
+            limit,
+            raw,
+            auto_adjust,
+            output_type,
+            date_format,
+            return_type=return_type,
+            adjust_volume=adjust_volume,
+        )
+
+    is_list = isinstance(symbol, list)
+    names = [_normalize_symbol(s) for s in (symbol if is_list else [symbol or "شتران"])]
+    return await _collect(
+        names,
+        _fetch_one,
+        is_list,
+        "Getting historical price of",
+        progress,
+        save_to_file,
+        save_path,
+        ".csv",
+        dropna,
+        ascending,
+        "None of the entered stocks exist!!",
+    )
+
+
+async def get_client_type(
+    symbol="",
+    start=None,
+    end=None,
+    limit=0,
+    raw=False,
+    output_type="standard",
+    date_format="jalali",
+    progress=True,
+    save_to_file=False,
+    dropna=True,
+    ascending=True,
+    save_path=None,
+    **kwargs
+):
+    """Async version of :func:`algotik_tse.get_client_type`."""
+    if not symbol and "stock" in kwargs:
+        symbol = kwargs.pop("stock")
+    if "values" in kwargs:
+        limit = kwargs.pop("values")
+    if "tse_format" in kwargs:
+        raw = kwargs.pop("tse_format")
+    if "multi_stock_drop" in kwargs:
+        dropna = kwargs.pop("multi_stock_drop")
+    if output_type == "complete":
+        output_type = "full"
+
+    async def _fetch_one(stock_name):
+        web_id = await _search_stock(stock_name)
+        if web_id[-5:] == "index" or web_id[-8:] == "industry":
+            print("{} is an index, Please enter a valid stock name!".format(stock_name))
+            return None
+        try:
+            response = await async_get(settings.url_client_type.format(web_id))
+        except HTTPError:
+            print("Connection Error!")
+            return None
+        return _parse_client_type(
+            response.content,
+            stock_name,
+            start,
+            end,
+            limit,
+            raw,
+            output_type,
+            date_format,
+        )
+
+    is_list = isinstance(symbol, list)
+    names = [_normalize_symbol(s) for s in (symbol if is_list else [symbol or "شتران"])]
+    return await _collect(
+        names,
+        _fetch_one,
+        is_list,
+        "Getting historical retail/institutional of",
+        progress,
+        save_to_file,
+        save_path,
+        "-حقیقی-حقوقی.csv",
+        dropna,
+        ascending,
+        "None of the entered stocks exist!!",
+    )
+
+
+# ══════════════════════════════════════════════════════════════
+#  Intraday
+# ══════════════════════════════════════════════════════════════
+
+
+async def _fetch_json(url):
+    """GET a JSON endpoint, returning None on HTTP or decode errors."""
+    try:
+        response = await async_get(url)
+        if response.status_code != 200:
+            return None
+        return response.json()
+    except (HTTPError, ValueError, KeyError):
+        return None
+
+
+async def _fetch_historical_day(web_id, greg_date_str):
+    if settings.intraday_store:
+        found, frame = intraday_store.load(web_id, greg_date_str)
+        if found:
+            return frame
+    data = await _fetch_json(settings.url_intraday_history.format(web_id, greg_date_str))
+    if data is None:
+        return None
+    frame = _parse_historical_day(data, greg_date_str)
+    if settings.intraday_store:
+        _store_historical_day(web_id, greg_date_str, data, frame)
+    return frame
+
+
+async def _today_intraday(web_id, symbol, interval, resample_freq, progress):
+    data = await _fetch_json(settings.url_intraday_trades.format(web_id))
+    trades = _parse_today_trades(data) if data is not None else None
+    return _build_today_intraday(trades, symbol, interval, resample_freq, progress)
+
+
+async def _multi_intraday(
+    symbols, interval, resample_freq, start, end, progress, layout
+):
+    """:func:`get_intraday` for a list of symbols."""
+    if layout not in ("wide", "long"):
+        print("please select layout between 'wide', 'long' ")
+        return None
+    if progress:
+        print(
+            "Getting {}intraday data for {} symbols...".format(
+                "historical " if start is not None else "", len(symbols)
+            ),
+            flush=True,
+        )
+
+    web_ids = await asyncio.gather(*(_search_stock(name) for name in symbols))
+    web_ids = [_check_web_id(web_id) for web_id in web_ids]
+    found = [(name, web_id) for name, web_id in zip(symbols, web_ids) if web_id]
+    for name, web_id in zip(symbols, web_ids):
+        if not web_id:
+            print("{} not Found!".format(name))
+    if not found:
+        print("None of the entered stocks exist!!")
+        return None
+
+    if start is not None:
+        date_list = _historical_date_list(start, end, progress)
+        if date_list is None:
+            return None
+        frames = await asyncio.gather(
+            *(
+                _fetch_historical_day(web_id, day)
+                for _, web_id in found
+                for day in date_list
+            )
+        )
+        days = len(date_list)
+        results = [
+            _build_historical_intraday(
+                frames[days * i: days * (i + 1)],
+                date_list,
+                name,
+                interval,
+                resample_freq,
+                progress=False,
+            )
+            for i, (name, _) in enumerate(found)
+        ]
+    else:
+        results = await asyncio.gather(
+            *(
+                _today_intraday(web_id, name, interval, resample_freq, False)
+                for name, web_id in found
+            )
+        )
+
+    df = _combine_intraday(
+        {name: df for (name, _), df in zip(found, results) if df is not None},
+        resample_freq,
+        layout,
+    )
+    if progress and df is not None:
+        print("{}/{} Completed!".format(len(symbols), len(symbols)))
+    return df
+
+
+async def get_intraday(
+    symbol="شتران",
+    interval="1min",
+    start=None,
+    end=None,
+    progress=True,
+    layout="wide",
+    **kwargs
+):
+    """Async version of :func:`algotik_tse.get_intraday`.
+
+    Historical days in a ``start``/``end`` range (of every symbol, for a
+    list) are fetched concurrently.
+    """
+    if symbol == "شتران" and "stock_name" in kwargs:
+        symbol = kwargs.pop("stock_name")
+
+    resample_freq = _validate_interval(interval)
+    if resample_freq is None:
+        return None
+
+    if isinstance(symbol, list):
+        return await _multi_intraday(
+            symbol, interval, resample_freq, start, end, progress, layout
+        )
+
+    if progress:
+        if start is not None:
+            msg = "Getting historical intraday data for {}...".format(symbol)
+        else:
+            msg = "Getting intraday data for {}...".format(symbol)
+        print(msg, flush=True)
+
+    web_id = _check_web_id(await _search_stock(symbol))
+    if web_id is None:
+        return None
+
+    if start is not None:
+        date_list = _historical_date_list(start, end, progress)
+        if date_list is None:
+            return None
+        day_frames = await asyncio.gather(
+            *(_fetch_historical_day(web_id, d) for d in date_list)
+        )
+        return _build_historical_intraday(
+            day_frames, date_list, symbol, interval, resample_freq, progress
+        )
+
+    return await _today_intraday(web_id, symbol, interval, resample_freq, progress)
+
+
+# ══════════════════════════════════════════════════════════════
+#  Market snapshot
+# ══════════════════════════════════════════════════════════════
+
+
+async def get_market_snapshot():
+    """Async version of :func:`algotik_tse.get_market_snapshot`."""
+    url = settings.url_market_watch_init
+    try:
+        response = await async_get(url)
+    except HTTPError as e:
+        raise ConnectionError(f"Failed to fetch market watch data from {url}") from e
+    return _parse_market_watch(response.text)
+
+
+# ══════════════════════════════════════════════════════════════
+#  Currency / coin
+# ══════════════════════════════════════════════════════════════
+
+
+async def get_currency(
+    name="",
+    start=None,
+    end=None,
+    limit=0,
+    output_type="standard",
+    date_format="jalali",
+    progress=True,
+    save_to_file=False,
+    dropna=True,
+    return_type=None,
+    ascending=True,
+    save_path=None,
+    **kwargs
+):
+    """Async version of :func:`algotik_tse.get_currency`."""
+    if not name and "currency_coin_name" in kwargs:
+        name = kwargs.pop("currency_coin_name")
+    if "values" in kwargs:
+        limit = kwargs.pop("values")
+    if "multi_currencies_drop" in kwargs:
+        dropna = kwargs.pop("multi_currencies_drop")
+
+    async def _fetch_one(currency_name):
+        url_word = settings.currency_web_word[currency_name]["web_word"]
+        response = await async_get(settings.url_currency_from_tgju.format(url_word))
+        if response.status_code != 200:
+            print("Connection Error!!!")
+            return None
+        return _build_currency_history(
+            response.json()["data"],
+            currency_name,
+            start,
+            end,
+            limit,
+            date_format,
+            output_type,
+            return_type,
+        )
+
+    is_list = isinstance(name, list)
+    names = [
+        n if n.isascii() else settings.currency_persian[n]
+        for n in (name if is_list else [name or "dollar"])
+    ]
+    return await _collect(
+        names,
+        _fetch_one,
+        is_list,
+        "Getting historical price of",
+        progress,
+        save_to_file,
+        save_path,
+        ".csv",
+        dropna,
+        ascending,
+        "None of the entered currencies exist!!",
+    )
+
+
+# ══════════════════════════════════════════════════════════════
+#  Funds
+# ══════════════════════════════════════════════════════════════
+
+
+async def list_funds(fund_type=None, progress=True):
+    """Async version of :func:`algotik_tse.list_funds`.
+
+    All requested fund categories are fetched concurrently.
+    """
+    types_to_fetch = _resolve_fund_types(fund_type)
+    if types_to_fetch is None:
+        return None
+    type_labels = settings.fund_type_labels
+
+    async def _fetch_type(type_id):
+        label = type_labels.get(type_id, str(type_id))
+        try:
+            response = await async_get(settings.url_fund_list.format(type_id))
+            return label, response.json().get("funds", [])
+        except Exception as e:
+            if progress:
+                print(f"    Warning: failed to fetch {label}: {e}")
+            return label, None
+
+    if progress:
+        print(f"Fetching {len(types_to_fetch)} fund categories...", flush=True)
+    results = await asyncio.gather(*(_fetch_type(t) for t in types_to_fetch))
+
+    if progress:
+        for label, funds_list in results:
+            if funds_list:
+                print(f"    {label} → {len(funds_list)} funds")
+
+    df = _build_funds_frame(results, progress)
+    if settings.fund_store and not df.empty:
+        fund_store.record_quietly(df)
+    return df
@@ -0,0 +1,147 @@
+"""Async HTTP client with retry, timeout, rate limiting, and configurable SSL.
+
+The asyncio counterpart of :mod:`algotik_tse.http_client`. It provides
+``async_get``, which wraps ``httpx.AsyncClient.get`` with:
+
+- Automatic retry on transient failures (429, 500, 502, 503, 504)
+- Configurable timeout (from settings.timeout)
+- Per-host rate limiting shared with the blocking ``safe_get``
+- Configurable SSL verification (from settings.ssl_verify)
+- Connection pooling via one ``httpx.AsyncClient`` per event loop
+- The on-disk response cache shared with ``safe_get`` (settings.cache_enabled)
+
+``httpx`` is an optional dependency::
+
+    pip install algotik_tse[async]
+"""
+
+import asyncio
+import weakref
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from algotik_tse import http_cache
+from algotik_tse.rate_limiter import limiter
+
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# One client per event loop — an AsyncClient cannot be shared across loops.
+_clients = weakref.WeakKeyDictionary()
+
+if httpx is not None:
+    HTTPError = httpx.HTTPError
+else:
+
+    class HTTPError(Exception):
+        """Placeholder so ``except HTTPError`` works without httpx."""
+
+
+def _require_httpx():
+    if httpx is None:
+        raise ImportError(
+            "The asyncio API requires 'httpx'. "
+            "Install it with: pip install algotik_tse[async]"
+        )
+
+
+def _get_client():
+    """Return the AsyncClient of the running loop, creating it if needed."""
+    from algotik_tse.settings import settings
+
+    _require_httpx()
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is not None and entry[1] == settings.ssl_verify:
+        return entry[0]
+
+    client = httpx.AsyncClient(
+        headers=settings.headers,
+        verify=settings.ssl_verify,
+        follow_redirects=True,
+    )
+    _clients[loop] = (client, settings.ssl_verify)
+    return client
+
+
+async def async_get(url, **kwargs):
+    """Make an async GET request with rate limiting, timeout, SSL config, and retry.
+
+    Uses defaults from ``algotik_tse.settings.settings``. Any explicit kwarg
+    passed will override the corresponding setting.
+
+    Parameters
+    ----------
+    url : str
+        The URL to request.
+    **kwargs
+        Additional keyword arguments passed to ``AsyncClient.get()``.
+        Common overrides: ``headers``, ``timeout``.
+
+    Returns
+    -------
+    httpx.Response
+        The HTTP response object. Exposes ``status_code``, ``text``,
+        ``content`` and ``json()`` like ``requests.Response``.
+
+    Raises
+    ------
+    httpx.HTTPError
+        After all retries are exhausted.
+    """
+    from algotik_tse.settings import settings
+
+    use_cache = settings.cache_enabled and "params" not in kwargs
+    if use_cache:
+        cached = http_cache.get(url)
+        if cached is not None:
+            status_code, headers, content = cached
+            return httpx.Response(
+                status_code,
+                headers=headers,
+                content=content,
+                request=httpx.Request("GET", url),
+            )
+
+    kwargs.setdefault("headers", settings.headers)
+    kwargs.setdefault("timeout", settings.timeout)
+    client = _get_client()
+
+    attempt = 0
+    while True:
+        # Same per-host buckets as the blocking client
+        wait = limiter.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        try:
+            response = await client.get(url, **kwargs)
+        except httpx.TransportError:
+            if attempt >= settings.max_retries:
+                raise
+        else:
+            if (
+                response.status_code not in _RETRY_STATUS
+                or attempt >= settings.max_retries
+            ):
+                if use_cache:
+                    http_cache.put(
+                        url, response.status_code, response.headers, response.content
+                    )
+                return response
+
+        await asyncio.sleep(settings.retry_backoff_factor * (2**attempt))
+        attempt += 1
+
+
+async def aclose():
+    """Close the HTTP client of the running event loop.
+
+    Call this before the loop shuts down to release pooled connections.
+    A new client is created automatically on the next request.
+    """
+    entry = _clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[0].aclose()
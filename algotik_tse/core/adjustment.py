@@ -0,0 +1,124 @@
+"""Vectorized price-adjustment engine.
+
+TSETMC daily history reports, for every session, the final price
+(``<CLOSE>``) and the reference price the next session started from
+(``<OPEN>``, "Yesterday-Final"). When a capital increase or dividend
+happens, the reference price drops below the previous final price; the
+ratio between the two is the adjustment factor for all earlier sessions.
+
+All functions operate on NumPy arrays ordered from oldest to newest
+session and reproduce the original row-by-row pandas implementation
+exactly (same floating-point operations in the same order).
+"""
+
+import numpy as np
+
+# Yesterday-Final values TSETMC uses as placeholders (first session, IPO)
+_PLACEHOLDER_REFERENCE = (0, 1000)
+
+
+def fix_reference_prices(yesterday_final, final):
+    """Replace placeholder reference prices with the previous final price.
+
+    A ``Yesterday-Final`` of ``0`` or ``1000`` is not a real reference
+    price; it is replaced with the previous session's ``Final`` when one
+    exists.
+
+    Parameters
+    ----------
+    yesterday_final : array-like
+        Reference price of each session.
+    final : array-like
+        Final (closing) price of each session.
+
+    Returns
+    -------
+    np.ndarray
+        Corrected reference prices as float64.
+    """
+    yesterday_final = np.asarray(yesterday_final, dtype="float64")
+    final = np.asarray(final, dtype="float64")
+    prev_final = np.empty_like(final)
+    prev_final[:1] = np.nan
+    prev_final[1:] = final[:-1]
+    keep = (
+        (yesterday_final != _PLACEHOLDER_REFERENCE[0])
+        & (yesterday_final != _PLACEHOLDER_REFERENCE[1])
+    ) | np.isnan(prev_final)
+    return np.where(keep, yesterday_final, prev_final)
+
+
+def adjustment_factors(yesterday_final, final):
+    """Cumulative backward adjustment factor of each session.
+
+    The factor of a session is the product of every later
+    ``Yesterday-Final[t+1] / Final[t]`` ratio; the latest session's
+    factor is ``1.0``.
+
+    Parameters
+    ----------
+    yesterday_final : array-like
+        Reference prices, already passed through
+        :func:`fix_reference_prices`.
+    final : array-like
+        Final prices.
+
+    Returns
+    -------
+    np.ndarray
+        Float64 factors to multiply historical prices by.
+    """
+    yesterday_final = np.asarray(yesterday_final, dtype="float64")
+    final = np.asarray(final, dtype="float64")
+    next_reference = np.empty_like(yesterday_final)
+    next_reference[:-1] = yesterday_final[1:]
+    next_reference[-1:] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coef = next_reference / final
+    coef[np.isnan(coef)] = 1.0
+    return np.cumprod(coef[::-1])[::-1]
+
+
+def truncate_to_int(values):
+    """Truncate floats toward zero into an int64 array, like ``int(x)``.
+
+    An empty input is returned as float64, matching ``Series.apply(int)``
+    on an empty series.
+
+    Raises
+    ------
+    ValueError
+        If any value is NaN or infinite (``int()`` would fail as well).
+    """
+    values = np.asarray(values, dtype="float64")
+    if values.size == 0:
+        return values
+    if not np.isfinite(values).all():
+        raise ValueError("cannot convert non-finite price to integer")
+    return np.trunc(values).astype("int64")
+
+
+def adjust_history(df):
+    """Add adjusted price columns to a daily price-history DataFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Sessions ordered oldest to newest with ``Open``, ``High``, ``Low``,
+        ``Close``, ``Final``, ``Volume`` and ``Yesterday-Final`` columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same frame with ``Yesterday-Final`` corrected and ``Adj Open``,
+        ``Adj High``, ``Adj Low``, ``Adj Close``, ``Adj Final`` and
+        ``Adj Volume`` (int64) appended. Modified in place.
+    """
+    final = df["Final"].to_numpy(dtype="float64")
+    reference = fix_reference_prices(df["Yesterday-Final"].to_numpy(), final)
+    df["Yesterday-Final"] = reference
+    factor = adjustment_factors(reference, final)
+    for column in ("Close", "Open", "High", "Low", "Final"):
+        df["Adj " + column] = truncate_to_int(df[column].to_numpy() * factor)
+    df["Adj Volume"] = truncate_to_int(df["Volume"].to_numpy() * (1 / factor))
+    return df
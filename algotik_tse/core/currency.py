@@ -1,15 +1,51 @@
-import pandas as pd
 from algotik_tse.settings import settings
 from algotik_tse.providers.tgju_convertor import tgju_convertor
 from algotik_tse.core.helper import (
     date_fix,
+    add_weekday_columns,
     apply_date_format,
     apply_return_type,
     filter_by_date_or_values,
+    save_csv,
+    apply_ascending,
+    combine_frames,
 )
 from algotik_tse.http_client import safe_get
 
 
+def _build_currency_history(
+    data, currency_name, start, end, values, date_format, output_type, return_type
+):
+    """Build the currency/coin history DataFrame from TGJU ``data`` rows.
+
+    Shared by the blocking and the asyncio API.
+    """
+    new_start, new_end = date_fix(start=start, end=end)
+    df = tgju_convertor(data)
+    if values is not None or start is not None or end is not None:
+        df = filter_by_date_or_values(df, values, new_start, new_end)
+
+    add_weekday_columns(df)
+    df["Ticker"] = settings.currency_web_word[currency_name]["persian_word"]
+
+    df = apply_date_format(df, date_format)
+    if df is None:
+        return None
+
+    if output_type == "standard":
+        df = df.loc[:, "Open High Low Close".split()]
+    elif output_type == "full":
+        pass
+    else:
+        print("output_type should select between 'standard' or 'full'")
+        return None
+
+    df = apply_return_type(df, return_type, default_price="Close")
+    if df is None:
+        return None
+    return df
+
+
 def currency_coin(
     name="",
     start=None,
@@ -98,52 +134,20 @@ def currency_coin(
     values = limit
     multi_currencies_drop = dropna
 
-    import os
-
-    def _save_csv(df, filename):
-        if save_path:
-            os.makedirs(save_path, exist_ok=True)
-            filepath = os.path.join(save_path, filename)
-        else:
-            filepath = filename
-        df.to_csv(filepath, encoding="utf-8-sig")
-
-    def _apply_ascending(df):
-        if df is not None and not ascending:
-            return df.iloc[::-1]
-        return df
-
     def __get_currency_history(currency__name):
         url_word = settings.currency_web_word[currency__name]["web_word"]
-        new_start, new_end = date_fix(start=start, end=end)
         detail = safe_get(settings.url_currency_from_tgju.format(url_word))
         if detail.status_code == 200:
-            df = tgju_convertor(detail.json()["data"])
-            if values is not None or start is not None or end is not None:
-                df = filter_by_date_or_values(df, values, new_start, new_end)
-
-            df["Weekday_No"] = df["Date"].dt.weekday
-            df["Weekday"] = df["Weekday_No"].apply(lambda x: settings.en_weekdays[x])
-            df["Weekday_fa"] = df["Weekday_No"].apply(lambda x: settings.fa_weekdays[x])
-            df.drop("Weekday_No", axis=1, inplace=True)
-            df["Ticker"] = settings.currency_web_word[currency__name]["persian_word"]
-
-            df = apply_date_format(df, date_format)
-            if df is None:
-                return None
-
-            if output_type == "standard":
-                df = df.loc[:, "Open High Low Close".split()]
-            elif output_type == "full":
-                pass
-            else:
-                print("output_type should select between 'standard' or 'full'")
-                return None
-
-            df = apply_return_type(df, return_type, default_price="Close")
-            if df is None:
-                return None
-            return df
+            return _build_currency_history(
+                detail.json()["data"],
+                currency__name,
+                start,
+                end,
+                values,
+                date_format,
+                output_type,
+                return_type,
+            )
         else:
             print("Connection Error!!!")
             return None
@@ -158,8 +162,8 @@ def currency_coin(
         if save_to_file and df is not None:
             if progress:
                 print("Saving to file: {}.csv".format(name))
-            _save_csv(df, name + ".csv")
-        return _apply_ascending(df)
+            save_csv(df, name + ".csv", save_path)
+        return apply_ascending(df, ascending)
     else:
         if isinstance(name, str):
             name = name if name.isascii() else settings.currency_persian[name]
@@ -171,8 +175,8 @@ def currency_coin(
             if save_to_file and df is not None:
                 if progress:
                     print("Saving to file: {}.csv".format(name))
-                _save_csv(df, name + ".csv")
-            return _apply_ascending(df)
+                save_csv(df, name + ".csv", save_path)
+            return apply_ascending(df, ascending)
         elif isinstance(name, list):
             n = 1
             df_dict = {}
@@ -203,21 +207,12 @@ def currency_coin(
                 if save_to_file and df is not None:
                     if progress:
                         print("Saving to file: {}.csv".format(file_name_str[1:]))
-                    _save_csv(df, file_name_str[1:] + ".csv")
-                return _apply_ascending(df)
+                    save_csv(df, file_name_str[1:] + ".csv", save_path)
+                return apply_ascending(df, ascending)
             else:
-                df = pd.concat(df_dict, axis=1)
-                multi_assets_columns = df.columns
-                reversed_multi_assets_columns = []
-                for column_index in multi_assets_columns:
-                    reversed_multi_assets_columns.append(column_index[::-1])
-                new_index = pd.MultiIndex.from_tuples(reversed_multi_assets_columns)
-                df.columns = new_index
-
-                if multi_currencies_drop:
-                    df.dropna(inplace=True)
+                df = combine_frames(df_dict, dropna=multi_currencies_drop)
                 if save_to_file and df is not None:
                     if progress:
                         print("Saving to file: {}.csv".format(file_name_str[1:]))
-                    _save_csv(df, file_name_str[1:] + ".csv")
-                return _apply_ascending(df)
+                    save_csv(df, file_name_str[1:] + ".csv", save_path)
+                return apply_ascending(df, ascending)
@@ -0,0 +1,305 @@
+"""Local NAV history of investment funds, recorded from list_funds().
+
+TSETMC's fund API only returns the current NAV, returns and portfolio
+mix of every fund. :func:`record_fund_snapshot` (or every
+:func:`algotik_tse.list_funds` call when ``settings.fund_store = True``)
+appends the snapshot to Parquet files under
+``<settings.data_dir>/funds/`` so NAV time series can be read back later:
+
+- Rows are keyed by ``reg_no`` and the recording date. A fund whose
+  values are the same as in its last stored row is skipped, so polling
+  often does not grow the store.
+- Every recording is written as a new immutable segment file; stored
+  rows are never rewritten. ``latest.parquet`` keeps the last row of
+  every fund for the unchanged-row check.
+- Once there are more than ``settings.fund_store_max_segments``
+  recorded segments they are merged into one file sorted by ``reg_no``,
+  whose row-group statistics let :func:`get_fund_nav_history` read one
+  fund without scanning the others. Merged files are left alone until
+  there are as many of them, and are then merged one tier up, so every
+  row is rewritten only a few times however large the store grows.
+
+Parquet files need ``pyarrow``::
+
+    pip install algotik_tse[store]
+"""
+
+import datetime
+import glob
+import os
+import re
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+from algotik_tse.settings import settings
+from algotik_tse.core import jalali
+from algotik_tse.core.helper import date_fix, storage_path
+
+# list_funds() columns recorded as float64
+_VALUE_COLUMNS = [
+    "nav_redemption",
+    "nav_subscription",
+    "nav_statistical",
+    "net_asset",
+    "units",
+    "return_1d",
+    "return_7d",
+    "return_30d",
+    "return_90d",
+    "return_180d",
+    "return_365d",
+    "return_inception",
+    "pct_stock",
+    "pct_bond",
+    "pct_deposit",
+    "pct_cash",
+    "pct_other",
+    "pct_top5",
+]
+
+# Rows per row group of merged files; small groups keep one-fund reads cheap
+_ROW_GROUP_SIZE = 4096
+
+# Tier suffix of merged segment names: '-merged' (tier 1), '-merged2', ...
+_MERGED_RE = re.compile(r"-merged(\d*)\.parquet$")
+
+_lock = threading.Lock()
+_warned = False
+
+
+def _segment_dir():
+    return storage_path("funds", "segments")
+
+
+def _latest_path():
+    return storage_path("funds", "latest.parquet")
+
+
+def _engine_missing(e):
+    global _warned
+    if not _warned:
+        print("Fund store disabled: {}. Install with: pip install pyarrow".format(e))
+        _warned = True
+
+
+def _write(df, path, **kwargs):
+    """Write *df* to *path* atomically."""
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_parquet(tmp, index=False, **kwargs)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _snapshot_rows(funds, now):
+    """Normalize a list_funds() frame to the stored schema."""
+    reg_no = pd.to_numeric(funds["reg_no"], errors="coerce")
+    keep = reg_no.notna().to_numpy()
+    funds = funds[keep]
+    rows = pd.DataFrame(
+        {
+            "reg_no": reg_no[keep].to_numpy(dtype="int64"),
+            "date": pd.Timestamp(now.date()),
+            "recorded_at": pd.Timestamp(now),
+            "fund_name": funds["fund_name"].fillna("").astype(str).to_numpy(),
+            "fund_type": funds["fund_type"].astype(str).to_numpy(),
+        }
+    )
+    for column in _VALUE_COLUMNS:
+        rows[column] = pd.to_numeric(funds[column], errors="coerce").to_numpy(
+            dtype="float64"
+        )
+    # A fund listed under two categories is recorded once
+    return rows.drop_duplicates("reg_no", keep="last").reset_index(drop=True)
+
+
+def _changed(rows, latest):
+    """Mask of *rows* whose values differ from their *latest* stored row."""
+    if latest is None or latest.empty:
+        return np.ones(len(rows), dtype=bool)
+    previous = latest.set_index("reg_no").reindex(rows["reg_no"])
+    new = rows[_VALUE_COLUMNS].to_numpy()
+    old = previous[_VALUE_COLUMNS].to_numpy()
+    same = (new == old) | (np.isnan(new) & np.isnan(old))
+    known = previous["date"].notna().to_numpy()
+    return ~known | ~same.all(axis=1)
+
+
+def record_fund_snapshot(funds=None, progress=False):
+    """Append a list_funds() snapshot to the local fund store.
+
+    Parameters
+    ----------
+    funds : pd.DataFrame, optional
+        Output of :func:`algotik_tse.list_funds`. If None, all funds are
+        fetched now.
+    progress : bool, default False
+        Print progress messages.
+
+    Returns
+    -------
+    int
+        Number of fund rows written (funds whose values changed since
+        their last stored row).
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> att.record_fund_snapshot()      # e.g. once a day from a scheduler
+    """
+    if funds is None:
+        from algotik_tse.core.instruments import list_funds
+
+        funds = list_funds(progress=progress)
+    if funds is None or funds.empty:
+        return 0
+
+    now = datetime.datetime.now()
+    rows = _snapshot_rows(funds, now)
+    with _lock:
+        try:
+            latest = _read_latest()
+            rows = rows[_changed(rows, latest)]
+            if not rows.empty:
+                name = "{}-{}.parquet".format(now.strftime("%Y%m%d-%H%M%S-%f"), os.getpid())
+                _write(rows, os.path.join(_segment_dir(), name))
+                if latest is not None:
+                    latest = latest[~latest["reg_no"].isin(rows["reg_no"])]
+                _write(pd.concat([latest, rows], ignore_index=True), _latest_path())
+                _compact()
+        except ImportError as e:
+            _engine_missing(e)
+            return 0
+    if progress:
+        print("Recorded {} changed funds.".format(len(rows)))
+    return len(rows)
+
+
+def _read_latest():
+    path = _latest_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except ImportError:
+        raise
+    except Exception:
+        return None  # unreadable file: every fund counts as changed
+
+
+def _segments():
+    return sorted(glob.glob(os.path.join(_segment_dir(), "*.parquet")))
+
+
+def _tier(path):
+    """Merge tier of a segment file (0 for a recorded segment)."""
+    match = _MERGED_RE.search(path)
+    if match is None:
+        return 0
+    return int(match.group(1) or 1)
+
+
+def _compact():
+    """Merge the segments of a tier into one file once there are many.
+
+    Recorded segments are merged into a tier-1 file, tier-1 files into a
+    tier-2 file and so on; files of other tiers are not read or rewritten.
+    """
+    tier = 0
+    while True:
+        paths = [path for path in _segments() if _tier(path) == tier]
+        if len(paths) <= settings.fund_store_max_segments:
+            return
+        merged = pd.read_parquet(paths).sort_values(
+            ["reg_no", "recorded_at"], kind="stable", ignore_index=True
+        )
+        tier += 1
+        # Named after the last merged segment so the files stay in time order
+        name = _MERGED_RE.sub(".parquet", os.path.basename(paths[-1])).replace(
+            ".parquet", "-merged{}.parquet".format(tier if tier > 1 else "")
+        )
+        _write(merged, os.path.join(_segment_dir(), name), row_group_size=_ROW_GROUP_SIZE)
+        for path in paths:
+            os.remove(path)
+
+
+def get_fund_nav_history(reg_no, start=None, end=None, date_format="jalali"):
+    """NAV history of one fund from the local fund store.
+
+    Parameters
+    ----------
+    reg_no : int or str
+        Fund registration number (the ``reg_no`` column of
+        :func:`algotik_tse.list_funds`).
+    start, end : str, optional
+        Date range (inclusive), Jalali (``'1404-11-01'``) or Gregorian.
+    date_format : str
+        ``'jalali'`` (index ``J-Date``), ``'gregorian'`` (``Date``) or
+        ``'both'`` (``Date`` index plus a ``J-Date`` column).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per recorded day (the last recording of the day), sorted
+        by date, with ``fund_name``, ``fund_type``, the NAV, asset, return
+        and portfolio columns of :func:`algotik_tse.list_funds` and
+        ``recorded_at``. Days on which nothing changed have no row. Empty
+        if the fund was never recorded.
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> nav = att.get_fund_nav_history(11378, start='1404-01-01')
+    >>> nav['nav_redemption'].plot()
+    """
+    if date_format not in ("jalali", "gregorian", "both"):
+        print("please select date_format between 'jalali', 'gregorian', 'both' ")
+        return None
+    paths = _segments()
+    if not paths:
+        return pd.DataFrame()
+    try:
+        df = pd.read_parquet(paths, filters=[("reg_no", "==", int(reg_no))])
+    except ImportError as e:
+        _engine_missing(e)
+        return pd.DataFrame()
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df.sort_values("recorded_at", kind="stable")
+    df = df.drop_duplicates("date", keep="last")
+    new_start, new_end = date_fix(start=start, end=end)
+    if new_start is not None:
+        df = df[df["date"] >= pd.Timestamp(new_start)]
+    if new_end is not None:
+        df = df[df["date"] <= pd.Timestamp(new_end)]
+
+    df = df.drop(columns="reg_no").rename(columns={"date": "Date"})
+    df = df[["Date", "fund_name", "fund_type"] + _VALUE_COLUMNS + ["recorded_at"]]
+    if date_format == "gregorian":
+        return df.set_index("Date")
+    j_date = jalali.to_jalali_iso(df["Date"].to_numpy())
+    if date_format == "both":
+        df.insert(1, "J-Date", j_date)
+        return df.set_index("Date")
+    df.insert(0, "J-Date", j_date)
+    return df.drop(columns="Date").set_index("J-Date")
+
+
+def clear_fund_store():
+    """Delete the recorded fund snapshots."""
+    shutil.rmtree(storage_path("funds"), ignore_errors=True)
+
+
+def record_quietly(funds):
+    """list_funds() hook: record *funds*, never failing the caller."""
+    try:
+        record_fund_snapshot(funds)
+    except Exception as e:
+        print("Fund store: failed to record snapshot: {}".format(e))
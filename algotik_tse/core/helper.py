@@ -1,10 +1,11 @@
-import datetime
+import os
 import numpy as np
 import pandas as pd
-from persiantools.jdatetime import JalaliDate
-from typing import Optional, Union, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Optional, Union, List, Tuple
 
 from algotik_tse.settings import settings
+from algotik_tse.core import jalali
 
 
 def date_fix(
@@ -39,15 +40,13 @@ def date_fix(
     if start is not None:
         two_left_char_start = start[:2]
         if two_left_char_start in ["13", "14", "15"]:
-            new_start = JalaliDate.to_gregorian(
-                JalaliDate.fromisoformat(start)
-            ).isoformat()
+            new_start = jalali.jalali_iso_to_gregorian(start).isoformat()
         else:
             new_start = start
     if end is not None:
         two_left_char_end = end[:2]
         if two_left_char_end in ["13", "14", "15"]:
-            new_end = JalaliDate.to_gregorian(JalaliDate.fromisoformat(end)).isoformat()
+            new_end = jalali.jalali_iso_to_gregorian(end).isoformat()
         else:
             new_end = end
     else:
@@ -73,19 +72,28 @@ def add_date_columns(df: pd.DataFrame, stock_name: str) -> pd.DataFrame:
         DataFrame with added date-related columns.
     """
     df["Date"] = df.index
-    df["J-Date"] = df["Date"]
-    df["J-Date"] = df["J-Date"].apply(lambda x: x.strftime("%Y-%m-%d"))
-    df["J-Date"] = df["J-Date"].apply(
-        lambda x: JalaliDate.to_jalali(datetime.datetime.fromisoformat(x)).isoformat()
-    )
-    df["Weekday_No"] = df["Date"].dt.weekday
-    df["Weekday"] = df["Weekday_No"].apply(lambda x: settings.en_weekdays[x])
-    df["Weekday_fa"] = df["Weekday_No"].apply(lambda x: settings.fa_weekdays[x])
-    df.drop("Weekday_No", axis=1, inplace=True)
+    if len(df) == 0:
+        # Empty frames keep the dtype the per-row conversion used to leave
+        df["J-Date"] = df["Date"]
+    else:
+        df["J-Date"] = jalali.to_jalali_iso(df.index)
+    add_weekday_columns(df)
     df["Ticker"] = stock_name
     return df
 
 
+def add_weekday_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add English and Persian ``Weekday`` / ``Weekday_fa`` from the ``Date`` column."""
+    weekday_no = df["Date"].dt.weekday
+    if len(df) == 0:
+        df["Weekday"] = weekday_no
+        df["Weekday_fa"] = weekday_no
+    else:
+        df["Weekday"] = jalali.weekday_names(weekday_no, "en")
+        df["Weekday_fa"] = jalali.weekday_names(weekday_no, "fa")
+    return df
+
+
 def apply_date_format(df: pd.DataFrame, date_format: str) -> Optional[pd.DataFrame]:
     """Set the DataFrame index based on the chosen date format and drop extra columns.
 
@@ -206,3 +214,108 @@ def filter_by_date_or_values(
         else:
             df = df.loc[new_start:new_end]
     return df
+
+
+def storage_path(*parts: str) -> str:
+    """Return a path under ``settings.data_dir`` (default ``~/.algotik_tse``)."""
+    base = settings.data_dir or os.path.join(os.path.expanduser("~"), ".algotik_tse")
+    return os.path.join(base, *parts)
+
+
+def save_csv(df: pd.DataFrame, filename: str, save_path: Optional[str] = None) -> None:
+    """Save a DataFrame to CSV (UTF-8 with BOM), respecting ``save_path``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to save.
+    filename : str
+        File name, e.g. ``'شتران.csv'``.
+    save_path : str, optional
+        Directory to save into. Created if missing. ``None`` saves to the
+        current working directory.
+    """
+    if save_path:
+        os.makedirs(save_path, exist_ok=True)
+        filepath = os.path.join(save_path, filename)
+    else:
+        filepath = filename
+    df.to_csv(filepath, encoding="utf-8-sig")
+
+
+def apply_ascending(
+    df: Optional[pd.DataFrame], ascending: bool
+) -> Optional[pd.DataFrame]:
+    """Reverse the row order when ``ascending`` is False."""
+    if df is not None and not ascending:
+        return df.iloc[::-1]
+    return df
+
+
+def combine_frames(df_dict: dict, dropna: bool = True) -> pd.DataFrame:
+    """Combine per-symbol DataFrames into one wide MultiIndex DataFrame.
+
+    Parameters
+    ----------
+    df_dict : dict
+        Mapping of symbol name to its DataFrame, in output order.
+    dropna : bool
+        Drop rows where any symbol has missing data.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns are a ``(column, symbol)`` MultiIndex.
+    """
+    df = pd.concat(df_dict, axis=1)
+    reversed_columns = [column_index[::-1] for column_index in df.columns]
+    df.columns = pd.MultiIndex.from_tuples(reversed_columns)
+    if dropna:
+        df.dropna(inplace=True)
+    return df
+
+
+def concurrent_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = 1,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[Any]:
+    """Apply ``func`` to every item, optionally on a bounded thread pool.
+
+    Parameters
+    ----------
+    func : callable
+        Function called once per item.
+    items : iterable
+        Items to process.
+    max_workers : int, optional
+        Maximum number of worker threads. ``None``, ``0`` or ``1`` process
+        the items serially in the calling thread, exactly like a plain loop.
+    progress_callback : callable, optional
+        Called as ``progress_callback(done, total)`` in the calling thread
+        each time an item finishes (in completion order).
+
+    Returns
+    -------
+    list
+        Results in the same order as ``items``. An exception raised by
+        ``func`` propagates to the caller.
+    """
+    items = list(items)
+    total = len(items)
+    if not max_workers or max_workers <= 1 or total <= 1:
+        results = []
+        for item in items:
+            results.append(func(item))
+            if progress_callback is not None:
+                progress_callback(len(results), total)
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as pool:
+        if progress_callback is None:
+            return list(pool.map(func, items))
+        futures = [pool.submit(func, item) for item in items]
+        for done, future in enumerate(as_completed(futures), start=1):
+            future.result()  # propagate the first failure right away
+            progress_callback(done, total)
+        return [future.result() for future in futures]
@@ -0,0 +1,109 @@
+"""Local columnar store for daily price and client-type history.
+
+With ``settings.history_store = True``, :func:`algotik_tse.get_history` and
+:func:`algotik_tse.get_client_type` keep the raw TSETMC history of every
+instrument in a Parquet file under ``<settings.data_dir>/history/<kind>/``
+(one file per InsCode) and reuse it on later calls:
+
+- A file refreshed after the most recent market open/close boundary is
+  served as-is without any request.
+- An older price file is brought up to date by downloading only the
+  sessions after its last stored date and merging them in.
+- When incremental data is unavailable (client type, long gaps or
+  inconsistent overlaps) the full history is downloaded and the file is
+  replaced.
+
+The stored frames are the *unadjusted* rows exactly as TSETMC publishes
+them, so the usual adjustment and formatting run on top of them and the
+output is the same as a fresh download.
+
+Parquet files need ``pyarrow``::
+
+    pip install algotik_tse[store]
+"""
+
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+
+from algotik_tse.core.helper import storage_path
+from algotik_tse.http_cache import next_session_boundary
+
+_warned = False
+
+
+def _path(kind, code):
+    return storage_path("history", kind, "{}.parquet".format(code))
+
+
+def _engine_missing(e):
+    global _warned
+    if not _warned:
+        print("History store disabled: {}. Install with: pip install pyarrow".format(e))
+        _warned = True
+
+
+def load(kind, code):
+    """Return ``(frame, updated_at)`` for a stored instrument, or None.
+
+    Parameters
+    ----------
+    kind : str
+        ``'price'`` or ``'client_type'``.
+    code : str
+        Instrument InsCode.
+    """
+    path = _path(kind, code)
+    if not os.path.exists(path):
+        return None
+    try:
+        df = pd.read_parquet(path)
+        updated_at = os.path.getmtime(path)
+    except ImportError as e:
+        _engine_missing(e)
+        return None
+    except Exception:
+        return None  # unreadable file: treat as missing, it will be rewritten
+    return df, updated_at
+
+
+def save(kind, code, df):
+    """Write *df* as the stored history of *code* (atomic replace)."""
+    path = _path(kind, code)
+    # Unique per thread: concurrent get_history() calls may save one code
+    tmp = "{}.{}.{}.tmp".format(path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_parquet(tmp)
+        os.replace(tmp, path)
+    except ImportError as e:
+        _engine_missing(e)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def is_fresh(updated_at, now=None):
+    """True if no market open/close boundary has passed since *updated_at*."""
+    now = now if now is not None else time.time()
+    return next_session_boundary(updated_at) > now
+
+
+def merge(stored, recent):
+    """Merge newly downloaded rows into a stored frame.
+
+    Both frames are indexed by date; rows of *recent* replace stored rows
+    of the same date. The result is sorted newest first, like the TSETMC
+    export.
+    """
+    older = stored[~stored.index.isin(recent.index)]
+    return pd.concat([recent, older]).sort_index(ascending=False)
+
+
+def clear_history_store(kind=None):
+    """Delete stored histories (``kind`` = ``'price'``, ``'client_type'`` or all)."""
+    path = storage_path("history", kind) if kind else storage_path("history")
+    shutil.rmtree(path, ignore_errors=True)
@@ -8,19 +8,21 @@ Also provides ``list_funds()`` which fetches detailed fund information
 (NAV, returns, portfolio composition, manager, etc.) from TSETMC Fund API.
 """
 
+import datetime
+import threading
 import time
 import numpy as np
 import pandas as pd
 
 from algotik_tse.settings import settings
 from algotik_tse.http_client import safe_get
-from algotik_tse.core.market_data import market_watch
+from algotik_tse.core import fund_store
+from algotik_tse.core.helper import concurrent_map
+from algotik_tse.core.market_data import market_watch, _snapshot_max_age
 from algotik_tse.core.parsers import (
-    parse_option_name,
-    parse_option_symbol,
-    parse_bond_name,
-    parse_treasury_name,
-    _days_until,
+    parse_option_names,
+    _OPTION_SYMBOL_PREFIX,
+    parse_bond_names,
 )
 
 
@@ -28,8 +30,22 @@ from algotik_tse.core.parsers import (
 #  Options
 # ══════════════════════════════════════════════════════════════
 
-
-def list_options(underlying=None, progress=True):
+# market_watch() columns copied to every list_options() row
+_OPTION_QUOTE_COLUMNS = [
+    "Last",
+    "Close",
+    "Yesterday",
+    "Volume",
+    "Value",
+    "TradeCount",
+    "Change",
+    "ChangePct",
+    "MaxAllowed",
+    "MinAllowed",
+]
+
+
+def list_options(underlying=None, progress=True, max_age=None, force_refresh=False):
     """List all active option contracts with parsed metadata.
 
     Fetches ``market_watch()`` and filters to option instruments
@@ -43,6 +59,12 @@ def list_options(underlying=None, progress=True):
         If ``None``, returns all options.
     progress : bool, default True
         Print progress messages.
+    max_age : float, optional
+        Reuse a ``market_watch()`` snapshot up to this many seconds old
+        (default ``settings.market_watch_max_age``), so dashboards calling
+        several of these functions download the market only once.
+    force_refresh : bool, default False
+        Always download a fresh snapshot.
 
     Returns
     -------
@@ -79,9 +101,14 @@ def list_options(underlying=None, progress=True):
     if progress:
         print("Fetching market data...")
 
-    data = market_watch()
-    stocks_df = data["stocks"]
+    data = market_watch(
+        max_age=_snapshot_max_age(max_age), force_refresh=force_refresh
+    )
+    return _options_from_snapshot(data["stocks"], underlying, progress)
 
+
+def _options_from_snapshot(stocks_df, underlying, progress):
+    """Option rows of a ``market_watch()`` frame with parsed metadata."""
     # Filter to options only (311=call, 312=put)
     options_df = stocks_df[stocks_df["InstrumentType"].isin([311, 312])].copy()
 
@@ -93,68 +120,37 @@ def list_options(underlying=None, progress=True):
     if progress:
         print(f"Found {len(options_df)} option contracts. Parsing metadata...")
 
-    # Parse Name field for each option
-    parsed_rows = []
-    for _, row in options_df.iterrows():
-        parsed = parse_option_name(row["Name"])
-        if parsed:
-            parsed_rows.append(
-                {
-                    "InsCode": row["InsCode"],
-                    "ISIN": row["ISIN"],
-                    "Symbol": row["Symbol"],
-                    "Name": row["Name"],
-                    "OptionType": parsed["option_type"],
-                    "Underlying": parsed["underlying"],
-                    "Strike": parsed["strike"],
-                    "ExpiryJalali": parsed["expiry_jalali"],
-                    "ExpiryGregorian": parsed["expiry_gregorian"],
-                    "DaysToExpiry": (
-                        _days_until(parsed["expiry_gregorian"])
-                        if parsed["expiry_gregorian"]
-                        else None
-                    ),
-                    "Last": row["Last"],
-                    "Close": row["Close"],
-                    "Yesterday": row["Yesterday"],
-                    "Volume": row["Volume"],
-                    "Value": row["Value"],
-                    "TradeCount": row["TradeCount"],
-                    "Change": row["Change"],
-                    "ChangePct": row["ChangePct"],
-                    "MaxAllowed": row["MaxAllowed"],
-                    "MinAllowed": row["MinAllowed"],
-                }
-            )
-        else:
-            # Fallback: use symbol prefix for type detection
-            opt_type = parse_option_symbol(row["Symbol"]) or "unknown"
-            parsed_rows.append(
-                {
-                    "InsCode": row["InsCode"],
-                    "ISIN": row["ISIN"],
-                    "Symbol": row["Symbol"],
-                    "Name": row["Name"],
-                    "OptionType": opt_type,
-                    "Underlying": None,
-                    "Strike": None,
-                    "ExpiryJalali": None,
-                    "ExpiryGregorian": None,
-                    "DaysToExpiry": None,
-                    "Last": row["Last"],
-                    "Close": row["Close"],
-                    "Yesterday": row["Yesterday"],
-                    "Volume": row["Volume"],
-                    "Value": row["Value"],
-                    "TradeCount": row["TradeCount"],
-                    "Change": row["Change"],
-                    "ChangePct": row["ChangePct"],
-                    "MaxAllowed": row["MaxAllowed"],
-                    "MinAllowed": row["MinAllowed"],
-                }
-            )
-
-    result = pd.DataFrame(parsed_rows)
+    # Parse every Name at once; rows that do not match fall back to the
+    # symbol prefix for the option type
+    parsed = parse_option_names(options_df["Name"])
+    matched = parsed["matched"].to_numpy()
+    symbols = options_df["Symbol"]
+    prefix_type = symbols.str[0].map(_OPTION_SYMBOL_PREFIX).where(symbols.str.len() > 1)
+    option_type = np.where(
+        matched,
+        parsed["option_type"].to_numpy(dtype=object),
+        prefix_type.fillna("unknown").to_numpy(dtype=object),
+    )
+    days = (
+        parsed["expiry"].to_numpy() - np.datetime64(datetime.date.today(), "D")
+    ).astype("timedelta64[D]")
+    days_to_expiry = np.where(np.isnat(days), np.nan, days.astype("float64"))
+
+    columns = {
+        "InsCode": options_df["InsCode"].to_numpy(),
+        "ISIN": options_df["ISIN"].to_numpy(),
+        "Symbol": symbols.to_numpy(),
+        "Name": options_df["Name"].to_numpy(),
+        "OptionType": option_type,
+        "Underlying": parsed["underlying"].to_numpy(dtype=object),
+        "Strike": _int_if_complete(parsed["strike"].to_numpy()),
+        "ExpiryJalali": parsed["expiry_jalali"].to_numpy(dtype=object),
+        "ExpiryGregorian": parsed["expiry_gregorian"].to_numpy(dtype=object),
+        "DaysToExpiry": _int_if_complete(days_to_expiry),
+    }
+    for column in _OPTION_QUOTE_COLUMNS:
+        columns[column] = options_df[column].to_numpy()
+    result = pd.DataFrame(columns)
 
     # Filter by underlying if specified
     if underlying and not result.empty:
@@ -168,7 +164,29 @@ def list_options(underlying=None, progress=True):
     return result.reset_index(drop=True)
 
 
-def get_options_chain(underlying, fetch_oi=False, progress=True):
+def _int_if_complete(values):
+    """Give a float column with NaN gaps the dtype a list of records would.
+
+    int64 when nothing is missing, float64 when some values are, and an
+    object column of None when all are.
+    """
+    missing = np.isnan(values)
+    if not missing.any():
+        return values.astype("int64")
+    if missing.all():
+        return np.full(len(values), None, dtype=object)
+    return values
+
+
+def get_options_chain(
+    underlying,
+    fetch_oi=False,
+    progress=True,
+    max_age=None,
+    force_refresh=False,
+    max_workers=None,
+    progress_callback=None,
+):
     """Get a structured options chain for a specific underlying asset.
 
     Returns calls and puts separated, with the underlying's current price
@@ -181,9 +199,25 @@ def get_options_chain(underlying, fetch_oi=False, progress=True):
     fetch_oi : bool, default False
         If True, makes an additional API call per contract to fetch
         open interest (buyOP/sellOP), contract size, and date range.
-        **Warning:** This is slow for many contracts due to rate limiting.
+        Contracts are fetched concurrently; a contract that fails gets
+        empty (None) values without affecting the others. With
+        ``settings.option_info_max_age`` above 0, details (open interest
+        included) are reused for that many seconds.
     progress : bool, default True
         Print progress messages.
+    max_age : float, optional
+        Reuse a ``market_watch()`` snapshot up to this many seconds old
+        (default ``settings.market_watch_max_age``), so dashboards calling
+        several of these functions download the market only once.
+    force_refresh : bool, default False
+        Always download a fresh snapshot.
+    max_workers : int, optional
+        Concurrent contract requests when ``fetch_oi=True`` (default
+        ``settings.option_info_workers``). Requests are still paced by
+        the rate limiter.
+    progress_callback : callable, optional
+        Called as ``progress_callback(done, total)`` after every contract
+        fetched with ``fetch_oi=True``. Replaces the printed progress.
 
     Returns
     -------
@@ -212,8 +246,13 @@ def get_options_chain(underlying, fetch_oi=False, progress=True):
     >>> print(chain['underlying_price'])
     >>> print(chain['expiry_dates'])
     """
-    # Get all options for this underlying
-    all_options = list_options(underlying=underlying, progress=progress)
+    # One snapshot serves both the option list and the underlying price
+    if progress:
+        print("Fetching market data...")
+    data = market_watch(
+        max_age=_snapshot_max_age(max_age), force_refresh=force_refresh
+    )
+    all_options = _options_from_snapshot(data["stocks"], underlying, progress)
 
     if all_options.empty:
         return {
@@ -225,34 +264,48 @@ def get_options_chain(underlying, fetch_oi=False, progress=True):
             "market_time": None,
         }
 
-    # Get underlying price from market_watch
-    data = market_watch()
-    underlying_price = None
+    # Get underlying price from the same snapshot
     market_time = data.get("market_time", "")
+    underlying_price = _underlying_price(data["stocks"], underlying)
 
-    # Search for underlying in stocks
-    stocks_df = data["stocks"]
+    # Fetch open interest if requested
+    if fetch_oi:
+        if progress:
+            print(f"Fetching open interest for {len(all_options)} contracts...")
+        callback = progress_callback
+        if callback is None and progress:
+
+            def callback(done, total):
+                if done % 10 == 0:
+                    print(f"  ... {done}/{total} contracts fetched")
+
+        workers = settings.option_info_workers if max_workers is None else max_workers
+        oi_data = concurrent_map(
+            _cached_option_info,
+            all_options["ISIN"],
+            max_workers=workers,
+            progress_callback=callback,
+        )
+        oi_df = pd.DataFrame(oi_data)
+        all_options = pd.concat([all_options, oi_df], axis=1)
+
+    return _split_chain(all_options, underlying, underlying_price, market_time)
+
+
+def _underlying_price(stocks_df, underlying):
+    """Last price of *underlying* in a ``market_watch()`` frame, or None."""
     # Try exact symbol match first
     match = stocks_df[stocks_df["Symbol"] == underlying]
     if match.empty:
         # Try partial match in Name
         match = stocks_df[stocks_df["Symbol"].str.contains(underlying, na=False)]
     if not match.empty:
-        underlying_price = int(match.iloc[0]["Last"])
+        return int(match.iloc[0]["Last"])
+    return None
 
-    # Fetch open interest if requested
-    if fetch_oi:
-        if progress:
-            print(f"Fetching open interest for {len(all_options)} contracts...")
-        oi_data = []
-        for i, (_, row) in enumerate(all_options.iterrows()):
-            oi = _fetch_option_info(row["ISIN"])
-            oi_data.append(oi)
-            if progress and (i + 1) % 10 == 0:
-                print(f"  ... {i + 1}/{len(all_options)} contracts fetched")
-        oi_df = pd.DataFrame(oi_data)
-        all_options = pd.concat([all_options, oi_df], axis=1)
 
+def _split_chain(all_options, underlying, underlying_price, market_time):
+    """Build the get_options_chain() dict from one underlying's contracts."""
     # Split into calls and puts
     calls = all_options[all_options["OptionType"] == "call"].copy()
     puts = all_options[all_options["OptionType"] == "put"].copy()
@@ -276,6 +329,124 @@ def get_options_chain(underlying, fetch_oi=False, progress=True):
     }
 
 
+def get_all_option_chains(
+    progress=True, max_age=None, force_refresh=False, as_frame=False
+):
+    """Get the options chain of every underlying from one market snapshot.
+
+    Equivalent to calling :func:`get_options_chain` for each underlying,
+    but the snapshot is downloaded and the option names are parsed only
+    once, then grouped by ``Underlying``. Each chain is joined to its
+    underlying's ``Last`` price from the same snapshot.
+
+    Parameters
+    ----------
+    progress : bool, default True
+        Print progress messages.
+    max_age : float, optional
+        Reuse a ``market_watch()`` snapshot up to this many seconds old
+        (default ``settings.market_watch_max_age``).
+    force_refresh : bool, default False
+        Always download a fresh snapshot.
+    as_frame : bool, default False
+        Return one DataFrame instead of a dict of chains.
+
+    Returns
+    -------
+    dict or pd.DataFrame
+        By default ``{underlying: chain}``, where every chain has the same
+        keys as :func:`get_options_chain` (``calls``, ``puts``,
+        ``underlying_name``, ``underlying_price``, ``expiry_dates``,
+        ``market_time``).
+
+        With ``as_frame=True``, every contract in one DataFrame with an
+        ``UnderlyingPrice`` column, indexed by (``Underlying``,
+        ``ExpiryJalali``, ``Strike``, ``OptionType``) and sorted.
+
+        Contracts whose name cannot be parsed have no underlying and are
+        left out.
+
+    Examples
+    --------
+    >>> chains = att.get_all_option_chains()
+    >>> chains['اهرم']['calls']
+    >>> surface = att.get_all_option_chains(as_frame=True)
+    >>> surface.loc['اهرم']
+    """
+    if progress:
+        print("Fetching market data...")
+    data = market_watch(
+        max_age=_snapshot_max_age(max_age), force_refresh=force_refresh
+    )
+    stocks_df = data["stocks"]
+    market_time = data.get("market_time", "")
+    options = _options_from_snapshot(stocks_df, None, progress)
+    if options.empty or options["Underlying"].isna().all():
+        return pd.DataFrame() if as_frame else {}
+    options = options[options["Underlying"].notna()]
+
+    # Underlying prices: one lookup table for exact symbols, the partial
+    # match of get_options_chain() only for the few that are left
+    underlyings = options["Underlying"].unique()
+    last_by_symbol = stocks_df.drop_duplicates("Symbol").set_index("Symbol")["Last"]
+    prices = {}
+    for name in underlyings:
+        if name in last_by_symbol.index:
+            prices[name] = int(last_by_symbol[name])
+        else:
+            prices[name] = _underlying_price(stocks_df, name)
+
+    if as_frame:
+        frame = options.copy()
+        frame.insert(
+            frame.columns.get_loc("Underlying") + 1,
+            "UnderlyingPrice",
+            frame["Underlying"].map(prices),
+        )
+        frame = frame.set_index(
+            ["Underlying", "ExpiryJalali", "Strike", "OptionType"]
+        ).sort_index()
+        if progress:
+            print(f"Done. {len(underlyings)} chains, {len(frame)} contracts.")
+        return frame
+
+    chains = {}
+    for name, group in options.groupby("Underlying", sort=True):
+        chains[name] = _split_chain(
+            group.reset_index(drop=True), name, prices[name], market_time
+        )
+    if progress:
+        print(f"Done. {len(chains)} chains, {len(options)} contracts.")
+    return chains
+
+
+# ISIN -> (time.monotonic() of the fetch, details) of successful fetches
+_option_info_cache = {}
+_option_info_lock = threading.Lock()
+
+
+def _cached_option_info(isin):
+    """:func:`_fetch_option_info` behind an optional in-memory cache.
+
+    With ``settings.option_info_max_age`` above 0, details are reused for
+    that many seconds. The endpoint serves contract size, dates and open
+    interest in one response, so the cached open interest is as old as
+    the cache entry; the default of 0 fetches every contract each call.
+    Failed fetches are not cached.
+    """
+    max_age = settings.option_info_max_age
+    if max_age:
+        with _option_info_lock:
+            hit = _option_info_cache.get(isin)
+        if hit is not None and time.monotonic() - hit[0] <= max_age:
+            return dict(hit[1])
+    info = _fetch_option_info(isin)
+    if max_age and info["OpenInterest"] is not None:
+        with _option_info_lock:
+            _option_info_cache[isin] = (time.monotonic(), info)
+    return dict(info)
+
+
 def _fetch_option_info(isin):
     """Fetch option contract details (open interest, contract size, etc.).
 
@@ -342,7 +513,7 @@ def _empty_oi():
 # ══════════════════════════════════════════════════════════════
 
 
-def list_etfs(progress=True):
+def list_etfs(progress=True, max_age=None, force_refresh=False):
     """List all ETF/fund instruments with NAV and discount/premium.
 
     Fetches ``market_watch()`` and filters to ETF instruments
@@ -352,6 +523,12 @@ def list_etfs(progress=True):
     ----------
     progress : bool, default True
         Print progress messages.
+    max_age : float, optional
+        Reuse a ``market_watch()`` snapshot up to this many seconds old
+        (default ``settings.market_watch_max_age``), so dashboards calling
+        several of these functions download the market only once.
+    force_refresh : bool, default False
+        Always download a fresh snapshot.
 
     Returns
     -------
@@ -383,7 +560,9 @@ def list_etfs(progress=True):
     if progress:
         print("Fetching market data...")
 
-    data = market_watch()
+    data = market_watch(
+        max_age=_snapshot_max_age(max_age), force_refresh=force_refresh
+    )
     stocks_df = data["stocks"]
 
     # Filter to ETFs (InstrumentType == 305)
@@ -436,7 +615,7 @@ def list_etfs(progress=True):
 # ══════════════════════════════════════════════════════════════
 
 
-def list_bonds(progress=True):
+def list_bonds(progress=True, max_age=None, force_refresh=False):
     """List all bond and treasury instruments with parsed maturity dates.
 
     Fetches ``market_watch()`` and identifies bond/treasury instruments
@@ -446,6 +625,12 @@ def list_bonds(progress=True):
     ----------
     progress : bool, default True
         Print progress messages.
+    max_age : float, optional
+        Reuse a ``market_watch()`` snapshot up to this many seconds old
+        (default ``settings.market_watch_max_age``), so dashboards calling
+        several of these functions download the market only once.
+    force_refresh : bool, default False
+        Always download a fresh snapshot.
 
     Returns
     -------
@@ -478,55 +663,15 @@ def list_bonds(progress=True):
     if progress:
         print("Fetching market data...")
 
-    data = market_watch()
+    data = market_watch(
+        max_age=_snapshot_max_age(max_age), force_refresh=force_refresh
+    )
     stocks_df = data["stocks"]
 
     if progress:
         print("Scanning for bonds and treasury instruments...")
 
-    parsed_rows = []
-    for _, row in stocks_df.iterrows():
-        name = row["Name"]
-        parsed = None
-
-        # Try treasury first (اسناد خزانه / اخزا)
-        if any(kw in name for kw in ["اسناد", "خزانه", "اخزا"]):
-            parsed = parse_treasury_name(name)
-
-        # Try bond (مرابحه, اجاره, etc.)
-        if parsed is None and any(
-            kw in name for kw in ["مرابحه", "اجاره", "سلف", "اراد", "ش.خ"]
-        ):
-            parsed = parse_bond_name(name)
-
-        if parsed:
-            days_to_mat = None
-            if parsed.get("maturity_gregorian"):
-                days_to_mat = _days_until(parsed["maturity_gregorian"])
-
-            parsed_rows.append(
-                {
-                    "InsCode": row["InsCode"],
-                    "ISIN": row["ISIN"],
-                    "Symbol": row["Symbol"],
-                    "Name": name,
-                    "BondType": parsed["bond_type"],
-                    "Ticker": parsed.get("ticker") or row["Symbol"],
-                    "MaturityJalali": parsed["maturity_jalali"],
-                    "MaturityGregorian": parsed["maturity_gregorian"],
-                    "DaysToMaturity": days_to_mat,
-                    "Last": row["Last"],
-                    "Close": row["Close"],
-                    "Yesterday": row["Yesterday"],
-                    "Volume": row["Volume"],
-                    "Value": row["Value"],
-                    "TradeCount": row["TradeCount"],
-                    "Change": row["Change"],
-                    "ChangePct": row["ChangePct"],
-                }
-            )
-
-    result = pd.DataFrame(parsed_rows)
+    result = _bonds_from_snapshot(stocks_df)
 
     if progress:
         if result.empty:
@@ -539,6 +684,160 @@ def list_bonds(progress=True):
     return result.reset_index(drop=True) if not result.empty else result
 
 
+# market_watch() columns copied to every list_bonds() row
+_BOND_QUOTE_COLUMNS = [
+    "Last",
+    "Close",
+    "Yesterday",
+    "Volume",
+    "Value",
+    "TradeCount",
+    "Change",
+    "ChangePct",
+]
+
+
+def _bonds_from_snapshot(stocks_df):
+    """Bond and treasury rows of a ``market_watch()`` frame, parsed."""
+    parsed = parse_bond_names(stocks_df["Name"])
+    matched = parsed["matched"].to_numpy()
+    if not matched.any():
+        return pd.DataFrame()
+    parsed = parsed[matched]
+    bonds_df = stocks_df[matched]
+
+    days = (
+        parsed["maturity"].to_numpy() - np.datetime64(datetime.date.today(), "D")
+    ).astype("timedelta64[D]")
+    days_to_maturity = np.where(np.isnat(days), np.nan, days.astype("float64"))
+    ticker = parsed["ticker"].to_numpy(dtype=object)
+    no_ticker = pd.isna(ticker) | (ticker == "")
+
+    columns = {
+        "InsCode": bonds_df["InsCode"].to_numpy(),
+        "ISIN": bonds_df["ISIN"].to_numpy(),
+        "Symbol": bonds_df["Symbol"].to_numpy(),
+        "Name": bonds_df["Name"].to_numpy(),
+        "BondType": parsed["bond_type"].to_numpy(dtype=object),
+        "Ticker": np.where(no_ticker, bonds_df["Symbol"].to_numpy(dtype=object), ticker),
+        "MaturityJalali": parsed["maturity_jalali"].to_numpy(dtype=object),
+        "MaturityGregorian": parsed["maturity_gregorian"].to_numpy(dtype=object),
+        "DaysToMaturity": _int_if_complete(days_to_maturity),
+    }
+    for column in _BOND_QUOTE_COLUMNS:
+        columns[column] = bonds_df[column].to_numpy()
+    return pd.DataFrame(columns)
+
+
+# Treasury bills (اخزا) repay this many Rials at maturity
+_TREASURY_FACE_VALUE = 1_000_000
+
+
+def zero_coupon_yields(price, days, face_value=_TREASURY_FACE_VALUE):
+    """Yields to maturity of zero-coupon bills, computed as arrays.
+
+    Parameters
+    ----------
+    price : array-like
+        Market prices.
+    days : array-like
+        Days to maturity.
+    face_value : float, default 1,000,000
+        Amount repaid at maturity.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(ytm, simple)``: the effective annual yield
+        ``(face / price) ** (365 / days) - 1`` and the simple annual yield
+        ``(face / price - 1) * 365 / days``. NaN where the price or the
+        days to maturity are missing or not positive.
+    """
+    price = np.asarray(price, dtype="float64")
+    days = np.asarray(days, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        valid = (price > 0) & (days > 0)
+        growth = np.where(valid, face_value / price, np.nan)
+        years = np.where(valid, days / 365.0, np.nan)
+        ytm = np.power(growth, 1.0 / years) - 1.0
+        simple = (growth - 1.0) / years
+    return ytm, simple
+
+
+def get_yield_curve(
+    price="Last", face_value=_TREASURY_FACE_VALUE, progress=True, max_age=None,
+    force_refresh=False,
+):
+    """Yield curve of the treasury bills (اخزا) from one market snapshot.
+
+    Parameters
+    ----------
+    price : str, default 'Last'
+        Price column the yields are computed from, ``'Last'`` or
+        ``'Close'``.
+    face_value : float, default 1,000,000
+        Amount repaid at maturity.
+    progress : bool, default True
+        Print progress messages.
+    max_age : float, optional
+        Reuse a ``market_watch()`` snapshot up to this many seconds old
+        (default ``settings.market_watch_max_age``), so refreshing the
+        curve every few seconds does not download the market each time.
+    force_refresh : bool, default False
+        Always download a fresh snapshot.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per unmatured treasury bill, sorted by maturity, with
+        columns ``Ticker``, ``Symbol``, ``InsCode``, ``MaturityJalali``,
+        ``MaturityGregorian``, ``DaysToMaturity``, ``Price``, ``YTM``
+        (effective annual yield), ``SimpleYield``, ``Volume`` and
+        ``Value``. Bills without a price have NaN yields.
+
+    Examples
+    --------
+    >>> curve = att.get_yield_curve()
+    >>> curve.plot(x='DaysToMaturity', y='YTM')
+    """
+    if progress:
+        print("Fetching market data...")
+    data = market_watch(
+        max_age=_snapshot_max_age(max_age), force_refresh=force_refresh
+    )
+    bonds = _bonds_from_snapshot(data["stocks"])
+    if bonds.empty:
+        if progress:
+            print("No treasury bills found.")
+        return pd.DataFrame()
+    bills = bonds[bonds["BondType"] == "treasury"]
+    days = pd.to_numeric(bills["DaysToMaturity"], errors="coerce")
+    bills = bills[(days > 0).to_numpy()]
+
+    ytm, simple = zero_coupon_yields(
+        bills[price].to_numpy(), bills["DaysToMaturity"].to_numpy(), face_value
+    )
+    curve = pd.DataFrame(
+        {
+            "Ticker": bills["Ticker"].to_numpy(),
+            "Symbol": bills["Symbol"].to_numpy(),
+            "InsCode": bills["InsCode"].to_numpy(),
+            "MaturityJalali": bills["MaturityJalali"].to_numpy(),
+            "MaturityGregorian": bills["MaturityGregorian"].to_numpy(),
+            "DaysToMaturity": bills["DaysToMaturity"].to_numpy(),
+            "Price": bills[price].to_numpy(),
+            "YTM": ytm,
+            "SimpleYield": simple,
+            "Volume": bills["Volume"].to_numpy(),
+            "Value": bills["Value"].to_numpy(),
+        }
+    )
+    curve = curve.sort_values(["DaysToMaturity", "Ticker"], kind="stable")
+    if progress:
+        print(f"Done. {len(curve)} treasury bills on the curve.")
+    return curve.reset_index(drop=True)
+
+
 # ══════════════════════════════════════════════════════════════
 #  Funds — detailed fund data from TSETMC Fund API
 # ══════════════════════════════════════════════════════════════
@@ -625,10 +924,45 @@ def list_funds(fund_type=None, progress=True):
     >>> gold = att.list_funds(fund_type='commodity')             # Gold/commodity
     >>> top = all_funds.nlargest(10, 'return_365d')              # Best annual return
     """
-    # ── Determine which fund types to fetch ───────────────────
-    all_type_ids = settings.fund_type_ids
+    types_to_fetch = _resolve_fund_types(fund_type)
+    if types_to_fetch is None:
+        return None
     type_labels = settings.fund_type_labels
 
+    # ── Fetch data from API ───────────────────────────────────
+    # Categories are requested concurrently; the rate limiter inside
+    # safe_get() paces them, so there is no sleep between requests
+    def _fetch_type(type_id):
+        label = type_labels.get(type_id, str(type_id))
+        try:
+            resp = safe_get(settings.url_fund_list.format(type_id))
+            return label, resp.json().get("funds", [])
+        except Exception as e:
+            if progress:
+                print(f"    Warning: failed to fetch {label}: {e}")
+            return label, None
+
+    if progress:
+        print(f"Fetching {len(types_to_fetch)} fund categories...", flush=True)
+    fetched = concurrent_map(
+        _fetch_type, types_to_fetch, max_workers=settings.fund_list_workers
+    )
+
+    if progress:
+        for label, funds_list in fetched:
+            if funds_list:
+                print(f"    {label} → {len(funds_list)} funds")
+
+    df = _build_funds_frame(fetched, progress)
+    if settings.fund_store and not df.empty:
+        fund_store.record_quietly(df)
+    return df
+
+
+def _resolve_fund_types(fund_type):
+    """Map the ``fund_type`` argument to a list of type IDs, or None."""
+    all_type_ids = settings.fund_type_ids
+
     if fund_type is None:
         types_to_fetch = list(all_type_ids.values())
     elif isinstance(fund_type, str):
@@ -650,85 +984,110 @@ def list_funds(fund_type=None, progress=True):
     else:
         print("fund_type must be None, a string, or a list of strings.")
         return None
+    return types_to_fetch
+
+
+# list_funds() column -> GetFunds JSON field, copied as-is
+_FUND_FIELDS = {
+    # NAV & Assets
+    "nav_redemption": "navRed",
+    "nav_subscription": "navSub",
+    "nav_statistical": "navStat",
+    "net_asset": "netAsset",
+    "units": "units",
+    # Returns
+    "return_1d": "day1Return",
+    "return_7d": "day7Return",
+    "return_30d": "day30Return",
+    "return_90d": "day90Return",
+    "return_180d": "day180Return",
+    "return_365d": "day365Return",
+    "return_inception": "dayFirstReturn",
+    # Portfolio composition
+    "pct_stock": "portfolioStock",
+    "pct_bond": "portfolioBond",
+    "pct_deposit": "portfolioDeposit",
+    "pct_cash": "portfolioCash",
+    "pct_other": "portfolioOther",
+    "pct_top5": "portfolioFiveBest",
+    # Managers
+    "manager": "manager",
+    "investment_manager": "investmentManager",
+    "custodian": "custodian",
+    "market_maker": "marketMaker",
+}
+
+_FUND_COLUMNS = [
+    "fund_name",
+    "fund_type",
+    "reg_no",
+    "nav_redemption",
+    "nav_subscription",
+    "nav_statistical",
+    "net_asset",
+    "units",
+    "inception_date",
+    "return_1d",
+    "return_7d",
+    "return_30d",
+    "return_90d",
+    "return_180d",
+    "return_365d",
+    "return_inception",
+    "pct_stock",
+    "pct_bond",
+    "pct_deposit",
+    "pct_cash",
+    "pct_other",
+    "pct_top5",
+    "manager",
+    "investment_manager",
+    "custodian",
+    "guarantor",
+    "market_maker",
+]
+
+
+def _build_funds_frame(fetched, progress=True):
+    """Build the sorted list_funds() DataFrame from GetFunds responses.
 
-    # ── Fetch data from API ───────────────────────────────────
-    all_rows = []
-    fetched = 0
-    total = len(types_to_fetch)
-
-    for type_id in types_to_fetch:
-        label = type_labels.get(type_id, str(type_id))
-        if progress:
-            fetched += 1
-            print(f"  [{fetched}/{total}] Fetching {label} funds...", flush=True)
-
-        url = settings.url_fund_list.format(type_id)
-        try:
-            resp = safe_get(url)
-            data = resp.json()
-            funds_list = data.get("funds", [])
-        except Exception as e:
-            if progress:
-                print(f"    Warning: failed to fetch {label}: {e}")
-            continue
-
-        for f in funds_list:
-            all_rows.append(
-                {
-                    "fund_name": f.get("mfName", ""),
-                    "fund_type": label,
-                    "reg_no": int(f["regNo"]) if f.get("regNo") else None,
-                    # NAV & Assets
-                    "nav_redemption": f.get("navRed"),
-                    "nav_subscription": f.get("navSub"),
-                    "nav_statistical": f.get("navStat"),
-                    "net_asset": f.get("netAsset"),
-                    "units": f.get("units"),
-                    "inception_date": (
-                        f.get("initiationDate", "")[:10]
-                        if f.get("initiationDate")
-                        else None
-                    ),
-                    # Returns
-                    "return_1d": f.get("day1Return"),
-                    "return_7d": f.get("day7Return"),
-                    "return_30d": f.get("day30Return"),
-                    "return_90d": f.get("day90Return"),
-                    "return_180d": f.get("day180Return"),
-                    "return_365d": f.get("day365Return"),
-                    "return_inception": f.get("dayFirstReturn"),
-                    # Portfolio composition
-                    "pct_stock": f.get("portfolioStock"),
-                    "pct_bond": f.get("portfolioBond"),
-                    "pct_deposit": f.get("portfolioDeposit"),
-                    "pct_cash": f.get("portfolioCash"),
-                    "pct_other": f.get("portfolioOther"),
-                    "pct_top5": f.get("portfolioFiveBest"),
-                    # Managers
-                    "manager": f.get("manager"),
-                    "investment_manager": f.get("investmentManager"),
-                    "custodian": f.get("custodian"),
-                    "guarantor": (
-                        f.get("guarantor") if f.get("guarantor") != "----" else None
-                    ),
-                    "market_maker": f.get("marketMaker"),
-                }
-            )
-
-        if progress and len(funds_list) > 0:
-            print(f"    → {len(funds_list)} funds")
-
-        # Rate-limit between requests
-        if fetched < total:
-            time.sleep(settings.rate_limit_delay)
-
-    # ── Build DataFrame ───────────────────────────────────────
-    if not all_rows:
+    Parameters
+    ----------
+    fetched : list of (str, list)
+        ``(label, funds)`` per fetched category; ``funds`` is the JSON
+        ``funds`` list, or None when the category failed.
+    """
+    fetched = [(label, funds) for label, funds in fetched if funds]
+    if not fetched:
         if progress:
             print("No funds found.")
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_rows)
+    records = [f for _, funds in fetched for f in funds]
+    labels = np.repeat(
+        np.array([label for label, _ in fetched], dtype=object),
+        [len(funds) for _, funds in fetched],
+    )
+
+    # One list per column with f.get() semantics: nested objects stay
+    # values, a missing key is None (a missing mfName is "")
+    columns = {
+        name: [f.get(key) for f in records] for name, key in _FUND_FIELDS.items()
+    }
+    columns.update(
+        fund_name=[f.get("mfName", "") for f in records],
+        fund_type=labels,
+        reg_no=[int(f["regNo"]) if f.get("regNo") else None for f in records],
+        inception_date=[
+            f["initiationDate"][:10] if f.get("initiationDate") else None
+            for f in records
+        ],
+        guarantor=[
+            f.get("guarantor") if f.get("guarantor") != "----" else None
+            for f in records
+        ],
+    )
+    df = pd.DataFrame(columns)[_FUND_COLUMNS]
 
     # Sort by fund_type then fund_name
     df = df.sort_values(["fund_type", "fund_name"], ignore_index=True)
@@ -2,12 +2,13 @@ import datetime
 import requests
 import warnings
 import pandas as pd
-from persiantools.jdatetime import JalaliDate
 
 from algotik_tse.settings import settings
 from algotik_tse.core.search import search_stock
-from algotik_tse.core.helper import date_fix
+from algotik_tse.core import jalali, intraday_store
+from algotik_tse.core.helper import date_fix, concurrent_map, combine_frames
 from algotik_tse.http_client import safe_get
+from algotik_tse.core.trading_calendar import sessions_between
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
@@ -73,7 +74,11 @@ def _validate_interval(interval):
 
 def _resolve_web_id(symbol, progress=True):
     """Search for stock and return web_id, or None on failure."""
-    web_id = search_stock(search_txt=symbol)
+    return _check_web_id(search_stock(search_txt=symbol))
+
+
+def _check_web_id(web_id):
+    """Validate a search result for intraday use, or return None."""
     if web_id is None or len(web_id) == 0:
         print("Stock Not Found, Please try again ...")
         return None
@@ -121,7 +126,11 @@ def _fetch_today_trades(web_id):
         data = resp.json()
     except (requests.exceptions.RequestException, ValueError, KeyError):
         return None
+    return _parse_today_trades(data)
 
+
+def _parse_today_trades(data):
+    """Build the trades DataFrame from a GetTrade JSON body."""
     trades = data.get("trade", [])
     if not trades:
         return None
@@ -183,15 +192,88 @@ def _fetch_historical_day(web_id, greg_date_str):
         DataFrame with columns [DateTime, Price, Volume, TradeCount].
         Volume is incremental (per snapshot), not cumulative.
     """
+    return _try_historical_day(web_id, greg_date_str)[1]
+
+
+def _try_historical_day(web_id, greg_date_str):
+    """:func:`_fetch_historical_day` that tells failures from empty days.
+
+    Returns
+    -------
+    tuple of (bool, pd.DataFrame or None)
+        ``(ok, frame)``; ``ok`` is False when the request failed (worth
+        retrying), while a day without data is ``(True, None)``.
+    """
     try:
         url = settings.url_intraday_history.format(web_id, greg_date_str)
         resp = safe_get(url)
         if resp.status_code != 200:
-            return None
+            return False, None
         data = resp.json()
     except (requests.exceptions.RequestException, ValueError, KeyError):
-        return None
+        return False, None
+    frame = _parse_historical_day(data, greg_date_str)
+    if settings.intraday_store:
+        _store_historical_day(web_id, greg_date_str, data, frame)
+    return True, frame
 
+
+def _store_historical_day(web_id, greg_date_str, data, frame):
+    """Keep a parsed day in the intraday store.
+
+    A None frame is only stored as "no trades" when the body has an empty
+    ``closingPriceHistory`` list, not when it failed to parse.
+    """
+    if frame is not None:
+        intraday_store.save(web_id, greg_date_str, frame)
+    elif data.get("closingPriceHistory") == []:
+        intraday_store.save_no_trades(web_id, greg_date_str)
+
+
+def _fetch_historical_days(web_id, date_list, max_workers=None):
+    """Fetch many historical days of one instrument, in ``date_list`` order."""
+    return _fetch_day_frames([(web_id, day) for day in date_list], max_workers)
+
+
+def _fetch_day_frames(pairs, max_workers=None):
+    """Fetch ``(web_id, day)`` pairs concurrently, in ``pairs`` order.
+
+    Days are fetched on up to ``max_workers`` threads (default
+    ``settings.intraday_workers``), paced by the rate limiter. Days whose
+    request failed are fetched again, up to
+    ``settings.intraday_day_retries`` more times, after the others; a day
+    that still fails is None like a day without data. With
+    ``settings.intraday_store``, stored days are read from disk instead.
+    """
+    workers = settings.intraday_workers if max_workers is None else max_workers
+    frames = [None] * len(pairs)
+    pending = []
+    for i, (web_id, day) in enumerate(pairs):
+        found = False
+        if settings.intraday_store:
+            found, frames[i] = intraday_store.load(web_id, day)
+        if not found:
+            pending.append(i)
+    for _ in range(1 + max(settings.intraday_day_retries, 0)):
+        if not pending:
+            break
+        results = concurrent_map(
+            lambda i: _try_historical_day(*pairs[i]),
+            pending,
+            max_workers=workers,
+        )
+        failed = []
+        for i, (ok, frame) in zip(pending, results):
+            if ok:
+                frames[i] = frame
+            else:
+                failed.append(i)
+        pending = failed
+    return frames
+
+
+def _parse_historical_day(data, greg_date_str):
+    """Build one day's snapshot DataFrame from a ClosingPriceHistory JSON body."""
     snapshots = data.get("closingPriceHistory", [])
     if not snapshots:
         return None
@@ -252,25 +334,23 @@ def _fetch_historical_day(web_id, greg_date_str):
 
 
 def _generate_date_range(start_greg, end_greg):
-    """Generate list of date strings (YYYYMMDD) between start and end (inclusive),
-    excluding Thursdays (weekday=3) and Fridays (weekday=4) — Iranian weekend."""
-    start_dt = datetime.date.fromisoformat(start_greg)
-    end_dt = datetime.date.fromisoformat(end_greg)
-    dates = []
-    current = start_dt
-    while current <= end_dt:
-        # Skip Iranian weekends: Thursday=3, Friday=4
-        if current.weekday() not in (3, 4):
-            dates.append(current.strftime("%Y%m%d"))
-        current += datetime.timedelta(days=1)
-    return dates
+    """Generate list of date strings (YYYYMMDD) of the trading sessions between
+    start and end (inclusive), skipping weekends and market holidays."""
+    return sessions_between(start_greg, end_greg).strftime("%Y%m%d").tolist()
 
 
 # ──────────────────────────────────────────────────────────────
 # PUBLIC API
 # ──────────────────────────────────────────────────────────────
 def stock_intraday(
-    symbol="شتران", interval="1min", start=None, end=None, progress=True, **kwargs
+    symbol="شتران",
+    interval="1min",
+    start=None,
+    end=None,
+    progress=True,
+    max_workers=None,
+    layout="wide",
+    **kwargs,
 ):
     """
     Get intraday trade data for a symbol and aggregate into OHLCV candles.
@@ -280,7 +360,7 @@ def stock_intraday(
     - **With dates**: fetches historical intraday snapshots using the
       ClosingPriceHistory endpoint. Supports single-day or multi-day ranges.
 
-    :param symbol:  Stock symbol name in Persian.
+    :param symbol:  Stock symbol name in Persian, or a list of symbols.
                         Default value is 'شتران'.
     :param interval:    Candle interval for resampling. Supported values:
                             'tick'  — raw tick/snapshot data (no aggregation)
@@ -299,6 +379,21 @@ def stock_intraday(
                         Default value is None.
     :param progress:    if True, show progress messages in console.
                         Default value is True.
+    :param max_workers: Concurrent day requests of a start/end range.
+                        Default value is None (settings.intraday_workers).
+                        A day whose request fails is retried
+                        (settings.intraday_day_retries) without aborting
+                        the range. For a list of symbols, every
+                        (symbol, day) pair shares the same workers.
+    :param layout:      Output of a list of symbols:
+                            'wide' — columns (column, symbol), like
+                                     get_history() with a list
+                            'long' — index (Symbol, DateTime)
+                        Candles of all symbols are aligned on the same
+                        DateTime grid; a candle without trades has NaN
+                        prices and zero Volume/TradeCount. Ticks
+                        (interval='tick') are always 'long'.
+                        Default value is 'wide'.
 
     :return: pandas DataFrame with OHLCV candles indexed by DateTime,
              or raw data if interval='tick'.
@@ -320,6 +415,11 @@ def stock_intraday(
         # Historical multi-day — 1-minute candles
         df = att.stock_intraday('شتران', interval='1min',
                                 start='1404-11-01', end='1404-11-06')
+
+        # 1-minute panel of several symbols
+        panel = att.stock_intraday(['شتران', 'فولاد', 'خودرو'],
+                                   start='1404-11-01', end='1404-11-06')
+        panel['Close']
     """
     # Backward compatibility: accept deprecated 'stock_name' keyword
     if symbol == "شتران" and "stock_name" in kwargs:
@@ -330,6 +430,11 @@ def stock_intraday(
     if resample_freq is None:
         return None
 
+    if isinstance(symbol, list):
+        return _multi_intraday(
+            symbol, interval, resample_freq, start, end, progress, max_workers, layout
+        )
+
     # ── Resolve stock ─────────────────────────────────────────────
     if progress:
         if start is not None:
@@ -346,92 +451,116 @@ def stock_intraday(
     # PATH A: Historical intraday (start/end provided)
     # ══════════════════════════════════════════════════════════════
     if start is not None:
-        # Convert dates to Gregorian
-        start_greg, end_greg = date_fix(start, end)
-        if start_greg is None:
-            print("Invalid start date: {}".format(start))
+        date_list = _historical_date_list(start, end, progress)
+        if date_list is None:
             return None
-        if end_greg is None:
-            end_greg = start_greg  # Single day
 
-        # Generate list of potential trading days
-        date_list = _generate_date_range(start_greg, end_greg)
-        if not date_list:
-            print("No trading days in the specified range.")
-            return None
+        day_frames = _fetch_historical_days(web_id, date_list, max_workers)
+        return _build_historical_intraday(
+            day_frames, date_list, symbol, interval, resample_freq, progress
+        )
 
-        if progress:
-            print(
-                "Fetching {} day(s) of intraday data...".format(len(date_list)),
-                flush=True,
-            )
+    # ══════════════════════════════════════════════════════════════
+    # PATH B: Today's live data (no start/end)
+    # ══════════════════════════════════════════════════════════════
+    return _build_today_intraday(
+        _fetch_today_trades(web_id), symbol, interval, resample_freq, progress
+    )
 
-        all_frames = []
-        fetched_days = 0
-        for i, date_str in enumerate(date_list):
-            df_day = _fetch_historical_day(web_id, date_str)
-            if df_day is not None and not df_day.empty:
-                all_frames.append(df_day)
-                fetched_days += 1
-                if progress:
-                    jdate = JalaliDate(
-                        datetime.date(
-                            int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])
-                        )
-                    )
-                    print(
-                        "  Day {}/{}: {} ({}) — {} snapshots".format(
-                            i + 1, len(date_list), date_str, jdate, len(df_day)
-                        ),
-                        flush=True,
-                    )
 
-        if not all_frames:
-            print(
-                "No intraday data found for {} in the specified date range.".format(
-                    symbol
-                )
-            )
-            return None
+def _historical_date_list(start, end, progress=True):
+    """Convert start/end to the list of candidate days, or None on error."""
+    # Convert dates to Gregorian
+    start_greg, end_greg = date_fix(start, end)
+    if start_greg is None:
+        print("Invalid start date: {}".format(start))
+        return None
+    if end_greg is None:
+        end_greg = start_greg  # Single day
 
-        df = pd.concat(all_frames, ignore_index=True)
-        df.sort_values("DateTime", inplace=True)
-        df.reset_index(drop=True, inplace=True)
+    # Generate list of potential trading days
+    date_list = _generate_date_range(start_greg, end_greg)
+    if not date_list:
+        print("No trading days in the specified range.")
+        return None
 
-        # ── Return raw snapshot data if tick requested ────────────
-        if resample_freq == "tick":
-            df.set_index("DateTime", inplace=True)
-            df.index.name = "DateTime"
+    if progress:
+        print(
+            "Fetching {} day(s) of intraday data...".format(len(date_list)),
+            flush=True,
+        )
+    return date_list
+
+
+def _build_historical_intraday(
+    day_frames, date_list, symbol, interval, resample_freq, progress=True
+):
+    """Combine per-day snapshot frames into ticks or OHLCV candles.
+
+    ``day_frames`` is aligned with ``date_list``; missing days are None.
+    """
+    all_frames = []
+    fetched_days = 0
+    for i, (date_str, df_day) in enumerate(zip(date_list, day_frames)):
+        if df_day is not None and not df_day.empty:
+            all_frames.append(df_day)
+            fetched_days += 1
             if progress:
-                print(
-                    "Historical snapshot data ready! {} snapshots across {} day(s) for {}".format(
-                        len(df), fetched_days, symbol
+                jdate = jalali.jalali_iso(
+                    datetime.date(
+                        int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])
                     )
                 )
-            return df
+                print(
+                    "  Day {}/{}: {} ({}) — {} snapshots".format(
+                        i + 1, len(date_list), date_str, jdate, len(df_day)
+                    ),
+                    flush=True,
+                )
 
-        # ── Resample into candles ─────────────────────────────────
-        df.set_index("DateTime", inplace=True)
-        ohlcv = _resample_to_candles(
-            df,
-            resample_freq,
-            price_col="Price",
-            volume_col="Volume",
-            count_col="TradeCount",
+    if not all_frames:
+        print(
+            "No intraday data found for {} in the specified date range.".format(symbol)
         )
+        return None
+
+    df = pd.concat(all_frames, ignore_index=True)
+    df.sort_values("DateTime", inplace=True)
+    df.reset_index(drop=True, inplace=True)
 
+    # ── Return raw snapshot data if tick requested ────────────
+    if resample_freq == "tick":
+        df.set_index("DateTime", inplace=True)
+        df.index.name = "DateTime"
         if progress:
             print(
-                "Historical {} candles ready! {} candles across {} day(s) for {}".format(
-                    interval, len(ohlcv), fetched_days, symbol
+                "Historical snapshot data ready! {} snapshots across {} day(s) for {}".format(
+                    len(df), fetched_days, symbol
                 )
             )
-        return ohlcv
+        return df
 
-    # ══════════════════════════════════════════════════════════════
-    # PATH B: Today's live data (no start/end)
-    # ══════════════════════════════════════════════════════════════
-    df = _fetch_today_trades(web_id)
+    # ── Resample into candles ─────────────────────────────────
+    df.set_index("DateTime", inplace=True)
+    ohlcv = _resample_to_candles(
+        df,
+        resample_freq,
+        price_col="Price",
+        volume_col="Volume",
+        count_col="TradeCount",
+    )
+
+    if progress:
+        print(
+            "Historical {} candles ready! {} candles across {} day(s) for {}".format(
+                interval, len(ohlcv), fetched_days, symbol
+            )
+        )
+    return ohlcv
+
+
+def _build_today_intraday(df, symbol, interval, resample_freq, progress=True):
+    """Turn today's trades frame into ticks or OHLCV candles."""
     if df is None:
         print("No trade data available for {} today.".format(symbol))
         return None
@@ -443,8 +572,7 @@ def stock_intraday(
         df_tick.index.name = "DateTime"
 
         try:
-            jdate = JalaliDate.today()
-            df_tick["J-Date"] = str(jdate)
+            df_tick["J-Date"] = jalali.jalali_iso(datetime.date.today())
         except Exception:
             pass
 
@@ -466,3 +594,111 @@ def stock_intraday(
         )
 
     return ohlcv
+
+
+# ──────────────────────────────────────────────────────────────
+# Multiple symbols
+# ──────────────────────────────────────────────────────────────
+def _multi_intraday(
+    symbols, interval, resample_freq, start, end, progress, max_workers, layout
+):
+    """:func:`stock_intraday` for a list of symbols."""
+    if layout not in ("wide", "long"):
+        print("please select layout between 'wide', 'long' ")
+        return None
+    workers = settings.intraday_workers if max_workers is None else max_workers
+    if progress:
+        print(
+            "Getting {}intraday data for {} symbols...".format(
+                "historical " if start is not None else "", len(symbols)
+            ),
+            flush=True,
+        )
+
+    # Resolved concurrently (from the local index if settings.symbol_index)
+    web_ids = concurrent_map(
+        lambda name: _check_web_id(search_stock(search_txt=name)),
+        symbols,
+        max_workers=workers,
+    )
+    found = [(name, web_id) for name, web_id in zip(symbols, web_ids) if web_id]
+    for name, web_id in zip(symbols, web_ids):
+        if not web_id:
+            print("{} not Found!".format(name))
+    if not found:
+        print("None of the entered stocks exist!!")
+        return None
+
+    if start is not None:
+        date_list = _historical_date_list(start, end, progress)
+        if date_list is None:
+            return None
+        frames = _fetch_day_frames(
+            [(web_id, day) for _, web_id in found for day in date_list], workers
+        )
+        days = len(date_list)
+        results = [
+            _build_historical_intraday(
+                frames[days * i: days * (i + 1)],
+                date_list,
+                name,
+                interval,
+                resample_freq,
+                progress=False,
+            )
+            for i, (name, _) in enumerate(found)
+        ]
+    else:
+        trades = concurrent_map(
+            lambda item: _fetch_today_trades(item[1]), found, max_workers=workers
+        )
+        results = [
+            _build_today_intraday(df, name, interval, resample_freq, progress=False)
+            for (name, _), df in zip(found, trades)
+        ]
+
+    df = _combine_intraday(
+        {name: df for (name, _), df in zip(found, results) if df is not None},
+        resample_freq,
+        layout,
+    )
+    if progress and df is not None:
+        print("{}/{} Completed!".format(len(symbols), len(symbols)))
+    return df
+
+
+def _combine_intraday(frames, resample_freq, layout="wide"):
+    """Combine per-symbol intraday frames on a common DateTime grid.
+
+    Parameters
+    ----------
+    frames : dict
+        Mapping of symbol to its candles (or ticks), in output order.
+    resample_freq : str
+        Resample frequency, ``'tick'`` for raw ticks/snapshots.
+    layout : str
+        ``'wide'`` (columns ``(column, symbol)``) or ``'long'`` (index
+        ``(Symbol, DateTime)``). Ticks are always long.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        None if no symbol has data.
+    """
+    if not frames:
+        print("No intraday data found for the entered symbols.")
+        return None
+    if resample_freq == "tick":
+        return pd.concat(frames, names=["Symbol"])
+
+    grid = frames[next(iter(frames))].index
+    for df in frames.values():
+        grid = grid.union(df.index)
+    aligned = {}
+    for name, df in frames.items():
+        df = df.reindex(grid)
+        df[["Volume", "TradeCount"]] = df[["Volume", "TradeCount"]].fillna(0).astype(int)
+        aligned[name] = df
+    if layout == "long":
+        return pd.concat(aligned, names=["Symbol"])
+    return combine_frames(aligned, dropna=False)
@@ -0,0 +1,124 @@
+"""Local store of historical intraday days.
+
+With ``settings.intraday_store = True``, every historical day fetched by
+:func:`algotik_tse.get_intraday` (``start``/``end`` ranges) is kept as a
+parsed frame in ``<settings.data_dir>/intraday/<InsCode>/<YYYYMMDD>.parquet``
+and read from there on later calls:
+
+- A closed day (before today, Tehran time) never changes, so its file is
+  written once and never refreshed or rewritten. The (InsCode, date) pair
+  fully identifies the contents.
+- A day whose response lists no snapshots at all is stored as an empty
+  file, so it is not requested again either. Failed requests and bodies
+  that do not parse are never stored.
+- Today's session is never stored; it always comes from the network.
+
+Parquet files need ``pyarrow``::
+
+    pip install algotik_tse[store]
+"""
+
+import os
+import shutil
+import threading
+
+import pandas as pd
+
+from algotik_tse.core.helper import storage_path
+from algotik_tse.http_cache import is_closed_day
+
+# Columns of a parsed historical day (see intraday._parse_historical_day)
+_COLUMNS = ["DateTime", "Price", "Volume", "TradeCount"]
+
+_warned = False
+
+
+def _path(code, day):
+    return storage_path("intraday", str(code), "{}.parquet".format(day))
+
+
+def _engine_missing(e):
+    global _warned
+    if not _warned:
+        print("Intraday store disabled: {}. Install with: pip install pyarrow".format(e))
+        _warned = True
+
+
+def load(code, day):
+    """Return ``(found, frame)`` for a stored day.
+
+    Parameters
+    ----------
+    code : str
+        Instrument InsCode.
+    day : str
+        Gregorian date in ``'YYYYMMDD'`` format.
+
+    Returns
+    -------
+    tuple of (bool, pd.DataFrame or None)
+        ``(False, None)`` if the day is not stored, ``(True, None)`` for a
+        stored day without trades, else ``(True, frame)``.
+    """
+    path = _path(code, day)
+    if not os.path.exists(path):
+        return False, None
+    try:
+        df = pd.read_parquet(path)
+    except ImportError as e:
+        _engine_missing(e)
+        return False, None
+    except Exception:
+        return False, None  # unreadable file: fetch again, it will be rewritten
+    return True, (df if not df.empty else None)
+
+
+def save(code, day, frame):
+    """Store the parsed *frame* of a closed *day*.
+
+    Today's session is ignored, and so is a day that is already stored.
+    """
+    if not is_closed_day(day):
+        return
+    path = _path(code, day)
+    if os.path.exists(path):
+        return
+    tmp = "{}.{}.{}.tmp".format(path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        frame[_COLUMNS].to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except ImportError as e:
+        _engine_missing(e)
+    except Exception:
+        pass
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def save_no_trades(code, day):
+    """Store a closed *day* whose response listed no trades.
+
+    Only call this when the server positively returned an empty list; a
+    failed request or an unexpected body must not be stored, or the day
+    would never be fetched again.
+    """
+    save(
+        code,
+        day,
+        pd.DataFrame(
+            {
+                "DateTime": pd.Series(dtype="datetime64[ns]"),
+                "Price": pd.Series(dtype="float64"),
+                "Volume": pd.Series(dtype="int64"),
+                "TradeCount": pd.Series(dtype="int64"),
+            }
+        ),
+    )
+
+
+def clear_intraday_store(code=None):
+    """Delete stored intraday days (of one InsCode, or all)."""
+    path = storage_path("intraday", str(code)) if code else storage_path("intraday")
+    shutil.rmtree(path, ignore_errors=True)
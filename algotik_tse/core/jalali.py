@@ -0,0 +1,170 @@
+"""Precomputed Gregorian ↔ Jalali calendar table.
+
+Converting dates one at a time with ``persiantools`` costs a few
+microseconds per row, which dominates date decoration of long or
+multi-symbol histories. This module builds, once per process, a table of
+every day from 1 Farvardin 1300 to 29/30 Esfand 1500 (1921-03-21 to
+2122-03-20) indexed by Gregorian ordinal, so whole columns are converted
+with NumPy array indexing.
+
+Dates outside the table fall back to ``persiantools``, so results are
+always identical to ``JalaliDate``.
+"""
+
+import datetime
+import threading
+
+import numpy as np
+from persiantools.jdatetime import JalaliDate
+
+from algotik_tse.settings import settings
+
+FIRST_YEAR = 1300
+LAST_YEAR = 1500
+
+_FIRST_ORDINAL = datetime.date(1921, 3, 21).toordinal()  # 1300-01-01
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+_lock = threading.Lock()
+_table = None
+
+
+def _build_table():
+    """Return ``(month_start, iso)`` for the whole covered range.
+
+    ``month_start[(jy - FIRST_YEAR) * 12 + jm - 1]`` is the offset (days
+    from 1300-01-01) of the first day of Jalali month ``jm`` of ``jy``,
+    with one extra trailing entry marking the end of the table.
+    ``iso[offset]`` is the ``'YYYY-MM-DD'`` Jalali string of that day.
+    """
+    lengths = []
+    labels = []
+    for jy in range(FIRST_YEAR, LAST_YEAR + 1):
+        esfand = 30 if JalaliDate.is_leap(jy) else 29
+        for jm, days in enumerate([31] * 6 + [30] * 5 + [esfand], start=1):
+            lengths.append(days)
+            labels.extend(
+                "{:04d}-{:02d}-{:02d}".format(jy, jm, jd) for jd in range(1, days + 1)
+            )
+    month_start = np.concatenate(([0], np.cumsum(lengths)))
+    return month_start, np.array(labels, dtype=object)
+
+
+def _get_table():
+    global _table
+    if _table is None:
+        with _lock:
+            if _table is None:
+                _table = _build_table()
+    return _table
+
+
+# ── Gregorian → Jalali ────────────────────────────────────────
+
+
+def to_jalali_iso(dates):
+    """Convert Gregorian dates to Jalali ``'YYYY-MM-DD'`` strings.
+
+    Parameters
+    ----------
+    dates : array-like of datetime64, DatetimeIndex or Series
+        Dates to convert; the time of day is ignored.
+
+    Returns
+    -------
+    np.ndarray
+        Object array of Jalali ISO strings, same length as *dates*.
+    """
+    month_start, iso = _get_table()
+    days = np.asarray(dates, dtype="datetime64[D]").astype("int64")
+    offsets = days + (_EPOCH_ORDINAL - _FIRST_ORDINAL)
+    inside = (offsets >= 0) & (offsets < len(iso))
+    if inside.all():
+        return iso[offsets]
+    result = np.empty(len(offsets), dtype=object)
+    result[inside] = iso[offsets[inside]]
+    for i in np.flatnonzero(~inside):
+        result[i] = JalaliDate(
+            datetime.date.fromordinal(int(offsets[i]) + _FIRST_ORDINAL)
+        ).isoformat()
+    return result
+
+
+def jalali_iso(date):
+    """Jalali ``'YYYY-MM-DD'`` string of one Gregorian ``datetime.date``."""
+    _, iso = _get_table()
+    offset = date.toordinal() - _FIRST_ORDINAL
+    if 0 <= offset < len(iso):
+        return iso[offset]
+    return JalaliDate(date).isoformat()
+
+
+# ── Jalali → Gregorian ────────────────────────────────────────
+
+
+def to_gregorian(jy, jm, jd):
+    """Convert a Jalali date to a Gregorian ``datetime.date``.
+
+    Raises
+    ------
+    ValueError
+        For an invalid Jalali date, like ``JalaliDate``.
+    """
+    if FIRST_YEAR <= jy <= LAST_YEAR and 1 <= jm <= 12:
+        month_start, _ = _get_table()
+        index = (jy - FIRST_YEAR) * 12 + jm - 1
+        if 1 <= jd <= month_start[index + 1] - month_start[index]:
+            return datetime.date.fromordinal(
+                _FIRST_ORDINAL + int(month_start[index]) + jd - 1
+            )
+    return JalaliDate(jy, jm, jd).to_gregorian()
+
+
+def to_gregorian_array(jy, jm, jd):
+    """Vectorized :func:`to_gregorian` over integer arrays.
+
+    Returns
+    -------
+    np.ndarray
+        ``datetime64[D]`` array; invalid Jalali dates are ``NaT``.
+    """
+    jy, jm, jd = (np.asarray(a, dtype="int64") for a in (jy, jm, jd))
+    result = np.full(jy.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+    if result.size == 0:
+        return result
+    month_start, _ = _get_table()
+    inside = (jy >= FIRST_YEAR) & (jy <= LAST_YEAR) & (jm >= 1) & (jm <= 12)
+    index = np.where(inside, (jy - FIRST_YEAR) * 12 + jm - 1, 0)
+    length = month_start[index + 1] - month_start[index]
+    valid = inside & (jd >= 1) & (jd <= length)
+    days = month_start[index] + jd - 1 + (_FIRST_ORDINAL - _EPOCH_ORDINAL)
+    result[valid] = days[valid].astype("datetime64[D]")
+    for i in np.flatnonzero(~inside):  # outside the table: persiantools
+        try:
+            result[i] = np.datetime64(
+                JalaliDate(int(jy[i]), int(jm[i]), int(jd[i])).to_gregorian(), "D"
+            )
+        except (ValueError, OverflowError):
+            pass
+    return result
+
+
+def jalali_iso_to_gregorian(text, sep="-"):
+    """Convert a ``'1402-01-05'``-style Jalali string to a ``datetime.date``."""
+    parts = text.split(sep)
+    if len(parts) != 3:
+        raise ValueError("Invalid Jalali date: {!r}".format(text))
+    return to_gregorian(int(parts[0]), int(parts[1]), int(parts[2]))
+
+
+# ── Weekday names ─────────────────────────────────────────────
+
+
+def weekday_names(weekdays, lang="en"):
+    """Map Python weekday numbers (Monday=0) to English or Persian names.
+
+    Returns an object array aligned with *weekdays*.
+    """
+    names = settings.en_weekdays if lang == "en" else settings.fa_weekdays
+    lookup = np.array([names[i] for i in range(7)], dtype=object)
+    return lookup[np.asarray(weekdays, dtype="int64")]
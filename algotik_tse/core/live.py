@@ -0,0 +1,390 @@
+"""Live intraday trades of several instruments, polled incrementally.
+
+:class:`TickStream` polls TSETMC's ``GetTrade`` endpoint for a set of
+instruments and hands out only the trades that are new since the previous
+poll. The endpoint always serves the whole day's list, so the download
+itself cannot be shortened, but only the new rows are parsed: the stream
+keeps nothing but the last trade number (``nTran``) of every instrument,
+so its memory use does not grow during the session.
+
+:class:`CandleAggregator` turns those trades into OHLCV candles as they
+arrive, updating only the open candle of every interval instead of
+resampling the whole day.
+"""
+
+import asyncio
+import time
+
+import pandas as pd
+import requests
+
+from algotik_tse.settings import settings
+from algotik_tse.http_client import safe_get
+from algotik_tse.core.helper import concurrent_map
+from algotik_tse.core.intraday import (
+    _check_web_id,
+    _parse_today_trades,
+    _validate_interval,
+)
+from algotik_tse.core.search import search_stock
+
+_TRADE_COLUMNS = ["Symbol", "TradeNo", "DateTime", "Price", "Volume"]
+_CANDLE_COLUMNS = [
+    "Symbol",
+    "Interval",
+    "DateTime",
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Volume",
+    "TradeCount",
+]
+
+
+class TickStream:
+    """Poll today's trades of several symbols, yielding only new trades.
+
+    Each poll downloads the ``GetTrade`` list of every instrument
+    (concurrently, paced by the rate limiter) and keeps the trades whose
+    ``nTran`` is above the last one seen for that instrument. Canceled
+    trades are skipped. A trade canceled after it was handed out is not
+    reported again.
+
+    Parameters
+    ----------
+    symbols : str or list of str
+        Symbol names in Persian.
+    interval : float, default 1.0
+        Seconds between polls when iterating.
+    max_workers : int, optional
+        Concurrent requests per poll (default ``settings.intraday_workers``).
+
+    Raises
+    ------
+    ValueError
+        If none of the symbols is found.
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> stream = att.TickStream(['شتران', 'فولاد', 'خودرو'], interval=1)
+    >>> for trades in stream:            # blocks between polls
+    ...     print(trades)                # only trades since the last poll
+
+    The same object is an async iterator (requires ``httpx``):
+
+    >>> async for trades in att.TickStream(['شتران', 'فولاد']):
+    ...     print(trades)
+    """
+
+    def __init__(self, symbols, interval=1.0, max_workers=None):
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        self.interval = interval
+        self.max_workers = max_workers
+        web_ids = concurrent_map(
+            lambda name: _check_web_id(search_stock(search_txt=name)),
+            symbols,
+            max_workers=self._workers(),
+        )
+        self._codes = {}  # symbol -> InsCode
+        for name, web_id in zip(symbols, web_ids):
+            if web_id:
+                self._codes[name] = web_id
+            else:
+                print("{} not Found!".format(name))
+        if not self._codes:
+            raise ValueError("None of the entered stocks exist!!")
+        self._last = dict.fromkeys(self._codes, 0)  # symbol -> last nTran
+        self._closed = False
+
+    @property
+    def symbols(self):
+        """Symbols being polled."""
+        return list(self._codes)
+
+    def last_trade_numbers(self):
+        """``{symbol: nTran}`` of the last trade seen per symbol."""
+        return dict(self._last)
+
+    def reset(self):
+        """Forget the last trade numbers; the next poll returns all of today."""
+        self._last = dict.fromkeys(self._codes, 0)
+
+    def close(self):
+        """Stop the iteration after the current poll."""
+        self._closed = True
+
+    def _workers(self):
+        if self.max_workers is None:
+            return settings.intraday_workers
+        return self.max_workers
+
+    # ── polling ───────────────────────────────────────────────
+
+    def _new_trades(self, name, data):
+        """Frame of the trades of *data* after the last seen ``nTran``."""
+        if data is None:
+            return None  # failed request: try again at the next poll
+        trades = data.get("trade") or []
+        numbers = [t.get("nTran", 0) for t in trades]
+        if not numbers:
+            return None
+        last = self._last[name]
+        if max(numbers) < last:
+            last = 0  # trade numbers restart with a new session
+        self._last[name] = max(max(numbers), last)
+        new = [t for t, n in zip(trades, numbers) if n > last]
+        df = _parse_today_trades({"trade": new}) if new else None
+        if df is None:
+            return None
+        df.insert(0, "Symbol", name)
+        return df
+
+    def _combine(self, frames):
+        frames = [df for df in frames if df is not None]
+        if not frames:
+            return pd.DataFrame(columns=_TRADE_COLUMNS)
+        df = pd.concat(frames, ignore_index=True)
+        df = df.sort_values(["DateTime", "Symbol"], kind="stable", ignore_index=True)
+        return df[_TRADE_COLUMNS]
+
+    def _fetch(self, web_id):
+        try:
+            response = safe_get(settings.url_intraday_trades.format(web_id))
+            if response.status_code != 200:
+                return None
+            return response.json()
+        except (requests.exceptions.RequestException, ValueError):
+            return None
+
+    def poll(self):
+        """Fetch every symbol once and return the trades since the last poll.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns ``Symbol``, ``TradeNo``, ``DateTime``, ``Price``,
+            ``Volume``, sorted by time; empty if nothing new was traded.
+            The first poll returns all of today's trades.
+        """
+        names = list(self._codes)
+        bodies = concurrent_map(
+            lambda name: self._fetch(self._codes[name]),
+            names,
+            max_workers=self._workers(),
+        )
+        return self._combine(
+            [self._new_trades(name, data) for name, data in zip(names, bodies)]
+        )
+
+    async def apoll(self):
+        """Async version of :meth:`poll` (requires ``httpx``)."""
+        from algotik_tse.aio.http_client import async_get, HTTPError
+
+        async def _fetch(web_id):
+            try:
+                response = await async_get(settings.url_intraday_trades.format(web_id))
+                if response.status_code != 200:
+                    return None
+                return response.json()
+            except (HTTPError, ValueError):
+                return None
+
+        names = list(self._codes)
+        bodies = await asyncio.gather(*(_fetch(self._codes[name]) for name in names))
+        return self._combine(
+            [self._new_trades(name, data) for name, data in zip(names, bodies)]
+        )
+
+    # ── iteration ─────────────────────────────────────────────
+
+    def __iter__(self):
+        self._closed = False
+        while not self._closed:
+            started = time.monotonic()
+            trades = self.poll()
+            if not trades.empty:
+                yield trades
+            time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def __aiter__(self):
+        self._closed = False
+        while not self._closed:
+            started = time.monotonic()
+            trades = await self.apoll()
+            if not trades.empty:
+                yield trades
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+class CandleAggregator:
+    """Build OHLCV candles of several intervals from live trades.
+
+    Every trade updates the open candle of each interval in constant
+    time. A candle is closed (and returned) when the first trade of a
+    later candle arrives, or by :meth:`flush`. Candles start at multiples
+    of the interval from midnight, like ``get_intraday()``, so the closed
+    candles equal the ``get_intraday()`` candles of the same trades.
+
+    Parameters
+    ----------
+    intervals : str or list of str, default '1min'
+        Candle intervals, e.g. ``['1min', '5min', '1h']`` (any interval of
+        :func:`algotik_tse.get_intraday` except ``'tick'``).
+
+    Raises
+    ------
+    ValueError
+        For an unsupported interval.
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> candles = att.CandleAggregator(['1min', '5min'])
+    >>> for trades in att.TickStream(['شتران', 'فولاد']):
+    ...     closed = candles.update_trades(trades)   # newly closed candles
+    ...     print(closed)
+    """
+
+    def __init__(self, intervals="1min"):
+        if isinstance(intervals, str):
+            intervals = [intervals]
+        self._steps = {}  # interval -> length in nanoseconds
+        for interval in intervals:
+            freq = _validate_interval(interval)
+            if freq is None or freq == "tick":
+                raise ValueError("Unsupported candle interval: {!r}".format(interval))
+            self._steps[interval] = pd.Timedelta(freq).value
+        # (symbol, interval) -> [start, open, high, low, close, volume, count]
+        self._bars = {}
+
+    @property
+    def intervals(self):
+        """Configured intervals."""
+        return list(self._steps)
+
+    def update(self, price, volume, time, symbol=None):
+        """Add one trade.
+
+        Parameters
+        ----------
+        price : float
+            Trade price.
+        volume : int
+            Trade volume.
+        time : datetime-like
+            Trade time. A trade older than the open candle is added to it.
+        symbol : str, optional
+            Instrument the trade belongs to; candles are kept per symbol.
+
+        Returns
+        -------
+        list of dict
+            The candles closed by this trade (at most one per interval),
+            with the keys of :meth:`update_trades` columns.
+        """
+        return self._add(price, volume, pd.Timestamp(time).value, symbol)
+
+    def _add(self, price, volume, t, symbol):
+        """:meth:`update` with the time in nanoseconds since the epoch."""
+        closed = []
+        for interval, step in self._steps.items():
+            start = t - t % step
+            key = (symbol, interval)
+            bar = self._bars.get(key)
+            if bar is None or start > bar[0]:
+                if bar is not None:
+                    closed.append(_candle(key, bar))
+                self._bars[key] = [start, price, price, price, price, volume, 1]
+                continue
+            if price > bar[2]:
+                bar[2] = price
+            if price < bar[3]:
+                bar[3] = price
+            bar[4] = price
+            bar[5] += volume
+            bar[6] += 1
+        return closed
+
+    def update_trades(self, trades):
+        """Add a frame of trades, in order.
+
+        Parameters
+        ----------
+        trades : pd.DataFrame
+            A :class:`TickStream` poll (``Symbol``, ``DateTime``,
+            ``Price``, ``Volume``), or ticks of one symbol from
+            ``get_intraday(interval='tick')`` (``DateTime`` index).
+
+        Returns
+        -------
+        pd.DataFrame
+            Candles closed by these trades: ``Symbol``, ``Interval``,
+            ``DateTime`` (candle start), ``Open``, ``High``, ``Low``,
+            ``Close``, ``Volume``, ``TradeCount``.
+        """
+        times = trades["DateTime"] if "DateTime" in trades.columns else trades.index
+        times = times.to_numpy().astype("datetime64[ns]").astype("int64").tolist()
+        if "Symbol" in trades.columns:
+            symbols = trades["Symbol"].tolist()
+        else:
+            symbols = [None] * len(trades)
+        closed = []
+        for price, volume, t, symbol in zip(
+            trades["Price"].tolist(), trades["Volume"].tolist(), times, symbols
+        ):
+            closed.extend(self._add(price, volume, t, symbol))
+        return _candle_frame(closed)
+
+    def current(self):
+        """The open candles, without closing them (same columns)."""
+        return _candle_frame([_candle(key, bar) for key, bar in self._bars.items()])
+
+    def flush(self, now=None):
+        """Close and return open candles.
+
+        Parameters
+        ----------
+        now : datetime-like, optional
+            Close only the candles that ended at or before *now* (e.g. for
+            symbols without new trades). None closes every open candle,
+            e.g. after the session.
+
+        Returns
+        -------
+        pd.DataFrame
+            The closed candles (same columns as :meth:`update_trades`).
+        """
+        t = None if now is None else pd.Timestamp(now).value
+        closed = []
+        for key, bar in list(self._bars.items()):
+            if t is None or bar[0] + self._steps[key[1]] <= t:
+                closed.append(_candle(key, self._bars.pop(key)))
+        return _candle_frame(closed)
+
+
+def _candle(key, bar):
+    symbol, interval = key
+    start, open_, high, low, close, volume, count = bar
+    return {
+        "Symbol": symbol,
+        "Interval": interval,
+        "DateTime": pd.Timestamp(start),
+        "Open": open_,
+        "High": high,
+        "Low": low,
+        "Close": close,
+        "Volume": volume,
+        "TradeCount": count,
+    }
+
+
+def _candle_frame(candles):
+    """Candle dicts as a frame, typed like get_intraday() candles."""
+    df = pd.DataFrame(candles, columns=_CANDLE_COLUMNS)
+    for col in ["Open", "High", "Low", "Close", "Volume", "TradeCount"]:
+        df[col] = df[col].astype(int)
+    df["DateTime"] = pd.to_datetime(df["DateTime"])
+    return df.sort_values(["DateTime", "Interval"], kind="stable", ignore_index=True)
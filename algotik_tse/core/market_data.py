@@ -7,15 +7,27 @@ Provides bulk market data from TSETMC in a single API call:
   instruments.
 - ``market_client_type()``  — Individual (حقیقی) vs institutional (حقوقی)
   trade breakdown for all instruments.
+- ``market_history()``  — Daily closing data of all instruments for the
+  last few sessions (ClosingPriceAll).
+- ``MarketWatchSession``  — Live snapshot kept current with incremental
+  MarketWatchPlus updates instead of full re-downloads.
 """
 
+import csv
+import io
+import threading
+import time
 import warnings
 
+import numpy as np
 import pandas as pd
+import requests
 
 from ..http_client import safe_get
 from ..settings import settings
 from ..exceptions import ConnectionError, DataParsingError
+from . import jalali, symbol_index, trading_calendar
+from .helper import date_fix
 
 
 # ── helpers ───────────────────────────────────────────────────
@@ -56,6 +68,132 @@ def _safe_float(val, default=0.0):
         return default
 
 
+# ── bulk field parsing ────────────────────────────────────────
+# Column-at-a-time equivalents of the per-field helpers above, used on
+# the thousands of rows of a market watch payload.
+
+
+def _split_rows(text, min_fields, exact=False, text_fields=()):
+    """Split ';'-separated, ','-delimited rows into a DataFrame of fields.
+
+    Uses the C CSV parser with ';' as line terminator, so fields keep the
+    exact text ``str.split`` would give (no quoting, no whitespace
+    trimming). Positions in *text_fields* are read as strings, the others
+    are left to the parser's numeric inference. Rows with fewer than
+    *min_fields* fields (with ``exact``: any other number of fields) are
+    dropped; empty and missing fields are NaN. Returns None when no row
+    is left.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    # Fields per row, counted on the raw bytes (',' and ';' are ASCII, so
+    # they never occur inside a multi-byte UTF-8 character)
+    raw = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    commas = np.flatnonzero(raw == ord(","))
+    ends = np.append(np.flatnonzero(raw == ord(";")), len(raw))
+    counts = np.diff(np.searchsorted(commas, ends), prepend=0) + 1
+    keep = counts == min_fields if exact else counts >= min_fields
+    if not keep.any():
+        return None
+    width = int(counts.max())
+    fields = pd.read_csv(
+        io.StringIO(text),
+        sep=",",
+        lineterminator=";",
+        header=None,
+        names=range(width),
+        dtype={position: str for position in text_fields if position < width},
+        keep_default_na=False,
+        na_values=[""],
+        quoting=csv.QUOTE_NONE,
+        skip_blank_lines=False,
+        float_precision="round_trip",  # same rounding as float()
+        engine="c",
+    )
+    # A trailing ';' leaves an empty last row that the parser does not emit
+    keep = keep[: len(fields)]
+    if keep.all():
+        return fields
+    return fields[keep].reset_index(drop=True)
+
+
+def _str_column(fields, position):
+    """Stripped text of field *position* ('' where empty or missing)."""
+    if position not in fields.columns:
+        return np.full(len(fields), "", dtype=object)
+    return fields[position].str.strip().fillna("").to_numpy(dtype=object)
+
+
+def _int_column(fields, position):
+    """Field *position* converted like :func:`_safe_int`.
+
+    Returns an int64 array, or a float64 array of truncated values when
+    some fields are float-strings (``'22964.00'``); unparseable, empty or
+    missing fields are 0. Infinite values are kept so the caller can drop
+    them.
+    """
+    if position not in fields.columns:
+        return np.zeros(len(fields), dtype="int64")
+    values = fields[position]
+    if pd.api.types.is_bool_dtype(values.dtype):  # 'True'/'False': int() fails
+        return np.zeros(len(fields), dtype="int64")
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        values = pd.to_numeric(values, errors="coerce")
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return values.to_numpy(dtype="int64")
+    values = np.trunc(values.to_numpy(dtype="float64", na_value=np.nan))
+    values[np.isnan(values)] = 0
+    return values
+
+
+# "00" … "99" for the minute and second parts of hEven
+_TWO_DIGITS = np.array(["{:02d}".format(i) for i in range(100)], dtype=object)
+
+
+def _time_column(column):
+    """hEven field → 'HH:MM:SS' like :func:`_heven_to_time_str`."""
+    column = column.fillna("")
+    result = column.to_numpy(dtype=object).copy()  # non-integers kept as-is
+    is_int = column.str.fullmatch(r"\s*[+-]?[0-9]+\s*").to_numpy(dtype=bool)
+    if is_int.any():
+        value = pd.to_numeric(column[is_int]).to_numpy(dtype="int64")
+        hours = value // 10000
+        if ((hours >= 0) & (hours < 100)).all():
+            hours = _TWO_DIGITS[hours]
+        else:
+            hours = np.array(["{:02d}".format(h) for h in hours], dtype=object)
+        result[is_int] = (
+            hours
+            + ":"
+            + _TWO_DIGITS[(value % 10000) // 100]
+            + ":"
+            + _TWO_DIGITS[value % 100]
+        )
+    return result
+
+
+def _build_frame(columns):
+    """DataFrame from parsed column arrays, with every int column as int64.
+
+    ``int()`` overflows on ``'inf'``, so the row-by-row parser skipped
+    such rows; they are dropped here as well.
+    """
+    keep = None
+    for values in columns.values():
+        if values.dtype == "float64":
+            finite = np.isfinite(values)
+            keep = finite if keep is None else keep & finite
+    if keep is None or keep.all():
+        return pd.DataFrame(
+            {
+                name: values.astype("int64") if values.dtype == "float64" else values
+                for name, values in columns.items()
+            }
+        )
+    return _build_frame({name: values[keep] for name, values in columns.items()})
+
+
 # ── backward-compat shim ─────────────────────────────────────
 
 
@@ -79,13 +217,29 @@ def market_data():
 # ══════════════════════════════════════════════════════════════
 
 
-def market_watch():
+def market_watch(max_age=0, force_refresh=False):
     """Get live market data for all instruments in one API call.
 
     Fetches comprehensive market data from the TSETMC MarketWatchInit
     endpoint, including symbol names, ISIN codes, EPS, price limits,
     and much more.
 
+    Every snapshot is kept in memory; callers that can live with slightly
+    older data pass ``max_age`` to reuse it instead of downloading the
+    multi-megabyte payload again. A call that arrives while a download is
+    in progress waits for it and returns its result instead of starting
+    another one (unless ``force_refresh``).
+
+    Parameters
+    ----------
+    max_age : float, default 0
+        Reuse the last snapshot if it is at most this many seconds old.
+        With 0, the data comes from the download in progress when the
+        call arrived, or from a new one.
+    force_refresh : bool, default False
+        Ignore ``max_age`` and in-progress downloads; the data is always
+        fetched after the call started.
+
     Returns
     -------
     dict
@@ -121,12 +275,69 @@ def market_watch():
     >>> # Filter regular stocks only
     >>> regular = data['stocks'][data['stocks']['InstrumentType'].isin([300, 303, 309])]
     """
-    url = settings.url_market_watch_init
-    response = safe_get(url)
-    if response is None:
-        raise ConnectionError(f"Failed to fetch market watch data from {url}")
+    global _snapshot, _in_flight
+    requested = time.monotonic()
+    in_flight = _in_flight
+    if max_age and not force_refresh:
+        cached = _cached_snapshot(requested - max_age)
+        if cached is not None:
+            return cached
+
+    with _snapshot_lock:
+        # Single flight: reuse a download that started while we waited,
+        # one in progress when we arrived, or one that is fresh enough
+        oldest = requested if force_refresh or not max_age else requested - max_age
+        if in_flight is not None and not force_refresh:
+            oldest = min(oldest, in_flight)
+        cached = _cached_snapshot(oldest)
+        if cached is not None:
+            return cached
+        started = time.monotonic()
+        _in_flight = started
+        try:
+            url = settings.url_market_watch_init
+            response = safe_get(url)
+            if response is None:
+                raise ConnectionError(f"Failed to fetch market watch data from {url}")
+            result = _parse_market_watch(response.text)
+            symbol_index.ingest_market_watch(result["stocks"])
+            _snapshot = (started, result)
+        finally:
+            _in_flight = None
+    return _copy_snapshot(result)
 
-    text = response.text.strip()
+
+# (monotonic time the download started, result) of the last market_watch()
+_snapshot_lock = threading.Lock()
+_snapshot = None
+# Monotonic start time of the download in progress, or None
+_in_flight = None
+
+
+def _cached_snapshot(oldest_start):
+    """Copy of the cached snapshot if its download started at/after *oldest_start*."""
+    cached = _snapshot
+    if cached is None or cached[0] < oldest_start:
+        return None
+    return _copy_snapshot(cached[1])
+
+
+def _copy_snapshot(snapshot):
+    """Shallow dict copy with its own ``stocks`` frame, so callers may edit it."""
+    return dict(snapshot, stocks=snapshot["stocks"].copy())
+
+
+def _snapshot_max_age(max_age):
+    """*max_age* argument of a snapshot consumer (None = setting)."""
+    return settings.market_watch_max_age if max_age is None else max_age
+
+
+def _parse_market_watch(text):
+    """Parse a MarketWatchInit response body into the market_watch() dict.
+
+    Shared by the blocking and the asyncio API.
+    """
+    text = text.strip()
     if not text:
         raise DataParsingError("Empty response from market watch endpoint")
 
@@ -137,12 +348,23 @@ def market_watch():
             f"'@'-separated parts, got {len(parts)}"
         )
 
-    # ── Header / market time & index (part 1) ─────────────────
+    market_time, index_value = _parse_header(parts[1])
+    stocks_df = _parse_stock_rows(parts[2] if len(parts) > 2 else "")
+
+    return {
+        "stocks": stocks_df,
+        "market_time": market_time,
+        "index_value": index_value,
+    }
+
+
+def _parse_header(header):
+    """Return ``(market_time, index_value)`` from part 1 of the payload."""
     # Format: "04/11/29 14:11:39,P,3806768.04,..."
     market_time = ""
     index_value = 0.0
     try:
-        header_text = parts[1].replace("\n", ",").replace("\r", "")
+        header_text = header.replace("\n", ",").replace("\r", "")
         header_fields = header_text.split(",")
         if header_fields:
             market_time = header_fields[0].strip()
@@ -150,8 +372,40 @@ def market_watch():
             index_value = _safe_float(header_fields[2])
     except Exception:
         pass
-
-    # ── Stocks (part 2) ───────────────────────────────────────
+    return market_time, index_value
+
+
+# (output column, field position, kind) of a MarketWatchInit instrument row,
+# in market_watch() column order; see the field list in _parse_stock_rows.
+_STOCK_FIELDS = [
+    ("InsCode", 0, "str"),
+    ("ISIN", 1, "str"),
+    ("Symbol", 2, "str"),
+    ("Name", 3, "str"),
+    ("Time", 4, "time"),
+    ("Yesterday", 5, "int"),
+    ("Close", 6, "int"),
+    ("Last", 7, "int"),
+    ("TradeCount", 8, "int"),
+    ("Volume", 9, "int"),
+    ("Value", 10, "int"),
+    ("Low", 11, "int"),
+    ("High", 12, "int"),
+    ("EPS", 14, "int"),
+    ("PriceYesterday", 13, "int"),
+    ("Flow", 17, "int"),
+    ("SectorCode", 18, "str"),
+    ("MaxAllowed", 19, "int"),
+    ("MinAllowed", 20, "int"),
+    ("BaseVolume", 21, "int"),
+    ("InstrumentType", 22, "int"),
+    ("NAV", 23, "int"),
+    ("MarketCode", 25, "str"),
+]
+
+
+def _parse_stock_rows(stock_data):
+    """Parse the ';'-separated instrument rows (part 2) into a DataFrame."""
     # MarketWatchInit record format (26 fields, ';'-separated):
     #  0: InsCode          — Instrument code (unique ID)
     #  1: ISIN             — e.g. IRO1NORI0001
@@ -178,63 +432,256 @@ def market_watch():
     # 23: NAV              — Net Asset Value (ETFs only)
     # 24: (empty)
     # 25: MarketCode       — Market identifier (N1, N2, Z1, P1, ...)
-    stock_records = []
-    stock_data = parts[2].strip() if len(parts) > 2 else ""
-    if stock_data:
-        for item in stock_data.split(";"):
-            fields = item.split(",")
-            if len(fields) < 22:
-                continue
-            try:
-                stock_records.append(
-                    {
-                        "InsCode": fields[0].strip(),
-                        "ISIN": fields[1].strip(),
-                        "Symbol": fields[2].strip(),
-                        "Name": fields[3].strip(),
-                        "Time": _heven_to_time_str(fields[4]),
-                        "Yesterday": _safe_int(fields[5]),
-                        "Close": _safe_int(fields[6]),
-                        "Last": _safe_int(fields[7]),
-                        "TradeCount": _safe_int(fields[8]),
-                        "Volume": _safe_int(fields[9]),
-                        "Value": _safe_int(fields[10]),
-                        "Low": _safe_int(fields[11]),
-                        "High": _safe_int(fields[12]),
-                        "EPS": _safe_int(fields[14]),
-                        "PriceYesterday": (
-                            _safe_int(fields[13]) if len(fields) > 13 else 0
-                        ),
-                        "Flow": _safe_int(fields[17]) if len(fields) > 17 else 0,
-                        "SectorCode": fields[18].strip() if len(fields) > 18 else "",
-                        "MaxAllowed": _safe_int(fields[19]) if len(fields) > 19 else 0,
-                        "MinAllowed": _safe_int(fields[20]) if len(fields) > 20 else 0,
-                        "BaseVolume": _safe_int(fields[21]) if len(fields) > 21 else 0,
-                        "InstrumentType": (
-                            _safe_int(fields[22]) if len(fields) > 22 else 0
-                        ),
-                        "NAV": _safe_int(fields[23]) if len(fields) > 23 else 0,
-                        "MarketCode": fields[25].strip() if len(fields) > 25 else "",
-                    }
-                )
-            except Exception:
-                continue
-
-    stocks_df = pd.DataFrame(stock_records)
+    fields = _split_rows(
+        stock_data,
+        min_fields=22,
+        text_fields=[position for _, position, kind in _STOCK_FIELDS if kind != "int"],
+    )
+    if fields is None:
+        return pd.DataFrame()
+
+    columns = {}
+    for name, position, kind in _STOCK_FIELDS:
+        if kind == "str":
+            columns[name] = _str_column(fields, position)
+        elif kind == "time":
+            columns[name] = _time_column(fields[position])
+        else:
+            columns[name] = _int_column(fields, position)
+
+    stocks_df = _build_frame(columns)
 
     if not stocks_df.empty:
-        stocks_df["Change"] = stocks_df["Close"] - stocks_df["Yesterday"]
-        stocks_df["ChangePct"] = (
-            stocks_df["Change"] / stocks_df["Yesterday"].replace(0, float("nan")) * 100
-        ).round(2)
-        # Ensure Change is int (int - int = int, but be safe)
-        stocks_df["Change"] = stocks_df["Change"].astype(int)
+        _add_change(stocks_df)
 
-    return {
-        "stocks": stocks_df,
-        "market_time": market_time,
-        "index_value": index_value,
+    return stocks_df
+
+
+def _add_change(stocks_df):
+    """(Re)compute ``Change`` and ``ChangePct`` from Close and Yesterday."""
+    stocks_df["Change"] = stocks_df["Close"] - stocks_df["Yesterday"]
+    stocks_df["ChangePct"] = (
+        stocks_df["Change"] / stocks_df["Yesterday"].replace(0, float("nan")) * 100
+    ).round(2)
+    # Ensure Change is int (int - int = int, but be safe)
+    stocks_df["Change"] = stocks_df["Change"].astype(int)
+
+
+# ══════════════════════════════════════════════════════════════
+#  MarketWatchSession — incremental MarketWatchPlus updates
+# ══════════════════════════════════════════════════════════════
+
+# MarketWatchPlus.aspx?h=<hEven>&r=<refid> answers with the same
+# '@'-separated layout as MarketWatchInit, but part 2 only holds the
+# instruments that changed since the cursor:
+#
+# - full rows (>= 22 fields): new instruments, same layout as init;
+# - update rows (10 fields): init fields 0 and 4-12, i.e.
+#   InsCode, hEven, PDrCotVal, PClosing, PLast, ZTotTran, QTotTran5J,
+#   QTotCap, PriceMin, PriceMax.
+#
+# The cursor is the latest hEven seen in any row and the reference id
+# sent as the last '@' part of every response.
+_DELTA_COLUMNS = [
+    "InsCode",
+    "Time",
+    "Yesterday",
+    "Close",
+    "Last",
+    "TradeCount",
+    "Volume",
+    "Value",
+    "Low",
+    "High",
+]
+_DELTA_FIELD_COUNT = len(_DELTA_COLUMNS)
+
+
+def _max_heven(stock_data):
+    """Largest hEven of the rows in *stock_data* (0 if none)."""
+    latest = 0
+    for item in stock_data.split(";"):
+        fields = item.split(",")
+        if len(fields) == _DELTA_FIELD_COUNT:
+            latest = max(latest, _safe_int(fields[1]))
+        elif len(fields) >= 22:
+            latest = max(latest, _safe_int(fields[4]))
+    return latest
+
+
+def _parse_delta_rows(stock_data):
+    """Parse the 10-field update rows of a MarketWatchPlus response."""
+    fields = _split_rows(
+        stock_data, _DELTA_FIELD_COUNT, exact=True, text_fields=(0, 1)
+    )
+    if fields is None:
+        return pd.DataFrame(columns=_DELTA_COLUMNS)
+    columns = {
+        "InsCode": _str_column(fields, 0),
+        "Time": _time_column(fields[1]),
     }
+    for position, name in enumerate(_DELTA_COLUMNS[2:], start=2):
+        columns[name] = _int_column(fields, position)
+    return _build_frame(columns)
+
+
+class MarketWatchSession:
+    """Live market snapshot kept up to date with MarketWatchPlus deltas.
+
+    The first :meth:`update` downloads the full ``MarketWatchInit``
+    payload; every later call polls ``MarketWatchPlus`` with the server's
+    hEven/refid cursor and applies only the rows that changed to an
+    in-memory table indexed by InsCode. This is much cheaper than calling
+    :func:`market_watch` every few seconds.
+
+    Parameters
+    ----------
+    index_symbols : bool
+        Feed the initial snapshot into the local symbol index, like
+        :func:`market_watch` does.
+
+    Examples
+    --------
+    >>> import time
+    >>> import algotik_tse as att
+    >>> session = att.MarketWatchSession()
+    >>> data = session.snapshot()        # full MarketWatchInit download
+    >>> while True:
+    ...     time.sleep(5)
+    ...     changed = session.update()   # only the changed instruments
+    ...     print(len(changed), session.market_time, session.index_value)
+    """
+
+    def __init__(self, index_symbols=True):
+        self.index_symbols = index_symbols
+        self._stocks = None  # DataFrame indexed by InsCode
+        self._columns = []
+        self._heven = 0
+        self._refid = 0
+        self.market_time = ""
+        self.index_value = 0.0
+
+    def reset(self):
+        """Forget the snapshot; the next :meth:`update` does a full init."""
+        self._stocks = None
+        self._heven = 0
+        self._refid = 0
+
+    def update(self):
+        """Fetch the changes since the last call and apply them.
+
+        Returns
+        -------
+        pd.DataFrame
+            The current rows of the instruments that changed (all rows on
+            the first call), with the same columns as
+            ``market_watch()['stocks']``.
+
+        Raises
+        ------
+        ConnectionError
+            If the HTTP request fails.
+        DataParsingError
+            If the response format is unexpected.
+        """
+        if self._stocks is None:
+            return self._init()
+
+        url = "{}?h={}&r={}".format(
+            settings.url_market_data_live, self._heven, self._refid
+        )
+        response = safe_get(url)
+        if response is None:
+            raise ConnectionError(f"Failed to fetch market watch data from {url}")
+        parts = response.text.strip().split("@")
+        if len(parts) < 3:
+            raise DataParsingError(
+                f"Unexpected market watch format: expected at least 3 "
+                f"'@'-separated parts, got {len(parts)}"
+            )
+
+        market_time, index_value = _parse_header(parts[1])
+        if market_time:
+            self.market_time, self.index_value = market_time, index_value
+        self._advance_cursor(parts)
+
+        changed = []
+        added = _parse_stock_rows(parts[2])
+        if not added.empty:
+            added = added.set_index("InsCode")
+            self._stocks = pd.concat(
+                [self._stocks.drop(added.index, errors="ignore"), added]
+            )
+            changed.append(added.index)
+
+        deltas = _parse_delta_rows(parts[2])
+        deltas = deltas[deltas["InsCode"].isin(self._stocks.index)]
+        if not deltas.empty:
+            deltas = deltas.drop_duplicates("InsCode", keep="last").set_index("InsCode")
+            columns = _DELTA_COLUMNS[1:]
+            self._stocks.loc[deltas.index, columns] = deltas[columns]
+            rows = self._stocks.loc[deltas.index]
+            _add_change(rows)
+            self._stocks.loc[deltas.index, ["Change", "ChangePct"]] = rows[
+                ["Change", "ChangePct"]
+            ]
+            changed.append(deltas.index)
+
+        if not changed:
+            return self._frame(self._stocks.iloc[:0])
+        codes = changed[0].append(changed[1:]).unique()
+        return self._frame(self._stocks.loc[codes])
+
+    def snapshot(self):
+        """Return the current snapshot in the :func:`market_watch` format.
+
+        Performs the initial download if no snapshot exists yet; does not
+        poll for changes (call :meth:`update` for that).
+        """
+        if self._stocks is None:
+            stocks = self._init()
+        else:
+            stocks = self._frame(self._stocks)
+        return {
+            "stocks": stocks,
+            "market_time": self.market_time,
+            "index_value": self.index_value,
+        }
+
+    # ── internals ─────────────────────────────────────────────
+
+    def _init(self):
+        url = settings.url_market_watch_init
+        response = safe_get(url)
+        if response is None:
+            raise ConnectionError(f"Failed to fetch market watch data from {url}")
+        result = _parse_market_watch(response.text)
+        if self.index_symbols:
+            symbol_index.ingest_market_watch(result["stocks"])
+        self.market_time = result["market_time"]
+        self.index_value = result["index_value"]
+        self._advance_cursor(response.text.strip().split("@"))
+        stocks = result["stocks"]
+        if stocks.empty:  # market closed / maintenance: retry init next time
+            return stocks
+        self._columns = list(stocks.columns)
+        self._stocks = stocks.drop_duplicates("InsCode", keep="last").set_index(
+            "InsCode"
+        )
+        return stocks
+
+    def _advance_cursor(self, parts):
+        self._heven = max(self._heven, _max_heven(parts[2]))
+        refid = parts[-1].strip() if len(parts) > 3 else ""
+        if refid.isdigit():
+            self._refid = int(refid)
+
+    def _frame(self, stocks):
+        """Return *stocks* with InsCode as a column, in market_watch() order."""
+        if "InsCode" in stocks.columns:
+            return stocks.copy()
+        df = stocks.reset_index()
+        return df[self._columns] if self._columns else df
 
 
 # ══════════════════════════════════════════════════════════════
@@ -319,3 +766,253 @@ def market_client_type():
         df["Net_N_Volume"] = df["Buy_N_Volume"] - df["Sell_N_Volume"]
 
     return df
+
+
+# ══════════════════════════════════════════════════════════════
+#  market_history()
+# ══════════════════════════════════════════════════════════════
+
+# ClosingPriceAll record format (11 fields, ';'-separated). The endpoint is
+# undocumented; this layout follows the TSETMC market-watch client, which
+# loads it for its history filters ([ih]). market_history() checks the
+# session numbers against one instrument's daily list before using them:
+#  0: InsCode          — Instrument code
+#  1: n                — Sessions back from the latest one (0 = latest)
+#  2: PClosing         — Final / closing weighted price (قیمت پایانی)
+#  3: PDrCotVal        — Last traded price (آخرین)
+#  4: ZTotTran         — Trade count
+#  5: QTotTran5J       — Volume
+#  6: QTotCap          — Value in Rials
+#  7: PriceMin         — Day's low
+#  8: PriceMax         — Day's high
+#  9: PriceYesterday   — Reference price of the session
+# 10: PriceFirst       — First traded price
+_CLOSING_PRICE_ALL_COLUMNS = [
+    "InsCode",
+    "n",
+    "Final",
+    "Close",
+    "TradeCount",
+    "Volume",
+    "Value",
+    "Low",
+    "High",
+    "Yesterday",
+    "Open",
+]
+
+
+def _parse_closing_price_all(text):
+    """Parse a ClosingPriceAll body into a frame with one row per record.
+
+    Records with fewer than 11 fields or non-numeric values are dropped.
+    """
+    text = text.strip()
+    if not text:
+        raise DataParsingError("Empty response from closing price endpoint")
+    df = pd.read_csv(
+        io.StringIO(text.replace(";", "\n")),
+        header=None,
+        names=_CLOSING_PRICE_ALL_COLUMNS,
+        usecols=range(len(_CLOSING_PRICE_ALL_COLUMNS)),
+        dtype={"InsCode": str},
+        on_bad_lines="skip",
+    )
+    numeric = _CLOSING_PRICE_ALL_COLUMNS[1:]
+    df[numeric] = df[numeric].apply(pd.to_numeric, errors="coerce")
+    df = df.dropna(subset=numeric)
+    df[numeric] = df[numeric].astype("int64")
+    df["InsCode"] = df["InsCode"].str.strip()
+    return df
+
+
+def _recent_sessions():
+    """Return recent trading-session dates, newest first.
+
+    Session dates come from the trading calendar, which is built from the
+    overall index (شاخص کل) history. They are needed even with
+    ``settings.trading_calendar = False``; the calendar is then downloaded
+    into memory only and no file is written.
+    """
+    return trading_calendar.trading_sessions(required=True)[::-1]
+
+
+def _check_sessions(df, sessions):
+    """Check that session number ``n`` of *df* is ``sessions[n]``.
+
+    The instrument with the most sessions in *df* is looked up in its own
+    daily price list (one request), which carries the real date of every
+    row. Rows are matched by (final price, volume, trade count).
+
+    Raises
+    ------
+    DataParsingError
+        If a matched row falls on another date than ``sessions[n]`` (e.g.
+        the calendar does not include the latest session yet), or if no
+        row could be matched.
+    requests.exceptions.RequestException
+        If the daily list request fails.
+    """
+    counts = df.groupby("InsCode").agg(
+        sessions=("n", "nunique"), trades=("TradeCount", "sum")
+    )
+    anchor = counts.sort_values(["sessions", "trades"], ascending=False).index[0]
+    rows = df[df["InsCode"] == anchor]
+    url = settings.url_price_history_daily.format(anchor, int(rows["n"].max()) + 1)
+    response = safe_get(url)
+    if response.status_code != 200:
+        raise DataParsingError(
+            f"Cannot verify session dates: HTTP {response.status_code} from {url}"
+        )
+    try:
+        dates = {
+            (int(r["pClosing"]), int(r["qTotTran5J"]), int(r["zTotTran"])): pd.Timestamp(
+                str(r["dEven"])
+            )
+            for r in response.json()["closingPriceDaily"]
+            if r.get("zTotTran")
+        }
+    except (ValueError, KeyError, TypeError) as e:
+        raise DataParsingError(f"Cannot verify session dates from {url}") from e
+    matched = 0
+    for n, final, volume, count in rows[["n", "Final", "Volume", "TradeCount"]].itertuples(
+        index=False
+    ):
+        day = dates.get((final, volume, count))
+        if day is None:
+            continue
+        if day != sessions[n]:
+            raise DataParsingError(
+                "ClosingPriceAll session {} is {:%Y-%m-%d}, but the trading "
+                "calendar gives {:%Y-%m-%d}; refresh it with "
+                "att.refresh_trading_calendar()".format(n, day, sessions[n])
+            )
+        matched += 1
+    if not matched:
+        raise DataParsingError(
+            "Cannot verify ClosingPriceAll session dates: no row of {} "
+            "matches its daily price list".format(anchor)
+        )
+
+
+def _print_history_cutoff(start, oldest, date_format):
+    """Tell the user that *start* is older than what ClosingPriceAll serves."""
+    if oldest is None:
+        print("No sessions returned by the closing price endpoint.")
+        return
+    if date_format == "gregorian":
+        first = oldest.strftime("%Y-%m-%d")
+    else:
+        first = jalali.to_jalali_iso([oldest])[0]
+    print(
+        "Start date {} is before the oldest session served ({}); use get_history() "
+        "for older data.".format(start, first)
+    )
+
+
+def market_history(start=None, end=None, date_format="jalali"):
+    """Get daily closing data for all instruments over recent sessions.
+
+    Uses the bulk ClosingPriceAll endpoint, which returns the last few
+    sessions of every instrument in one response, so a whole-market daily
+    update costs one request instead of one per symbol. Session numbers
+    in the response are mapped to dates with the trading calendar, and
+    the mapping is checked against the daily price list of one
+    instrument (one more request); if they disagree, the call raises
+    instead of returning mislabeled rows.
+
+    .. note::
+        This does **not** backfill history: only the few sessions
+        ClosingPriceAll currently serves are returned, whatever
+        ``start`` is, and a notice is printed when ``start`` is older
+        than the first of them. Use :func:`algotik_tse.get_history` for
+        older data.
+
+    Parameters
+    ----------
+    start, end : str, optional
+        Date range (inclusive), Jalali (``'1404-11-01'``) or Gregorian
+        (``'2026-01-21'``). Default: every session returned.
+    date_format : str
+        ``'jalali'`` (index level ``J-Date``), ``'gregorian'`` (``Date``) or
+        ``'both'`` (``Date`` index level plus a ``J-Date`` column).
+
+    Returns
+    -------
+    pd.DataFrame
+        Long format, indexed by ``(InsCode, date)`` and sorted. Columns:
+        ``Open``, ``High``, ``Low``, ``Close`` (last trade), ``Final``
+        (closing price), ``Yesterday``, ``Volume``, ``Value``,
+        ``TradeCount``.
+
+    Raises
+    ------
+    ConnectionError
+        If an HTTP request fails.
+    DataParsingError
+        If the response format is unexpected, or the session dates cannot
+        be verified.
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> df = att.get_market_history(start='1404-11-01')
+    >>> df.xs('1404-11-05', level='J-Date').head()
+    """
+    if date_format not in ("jalali", "gregorian", "both"):
+        print("please select date_format between 'jalali', 'gregorian', 'both' ")
+        return None
+
+    url = settings.url_closing_price_all
+    try:
+        response = safe_get(url)
+        sessions = _recent_sessions()
+    except requests.exceptions.RequestException as e:
+        raise ConnectionError(f"Failed to fetch closing prices from {url}") from e
+    if response.status_code != 200:
+        raise ConnectionError(
+            f"Failed to fetch closing prices from {url} (HTTP {response.status_code})"
+        )
+
+    df = _parse_closing_price_all(response.text)
+    df = df[(df["n"] >= 0) & (df["n"] < len(sessions))]
+    if len(df):
+        try:
+            _check_sessions(df, sessions)
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError("Failed to verify closing price session dates") from e
+    df["Date"] = sessions[df["n"].to_numpy()]
+
+    new_start, new_end = date_fix(start=start, end=end)
+    if new_start is not None:
+        oldest = df["Date"].min() if len(df) else None
+        if oldest is None or pd.Timestamp(new_start) < oldest:
+            _print_history_cutoff(start, oldest, date_format)
+        df = df[df["Date"] >= pd.Timestamp(new_start)]
+    if new_end is not None:
+        df = df[df["Date"] <= pd.Timestamp(new_end)]
+
+    df = df.loc[
+        :,
+        [
+            "InsCode",
+            "Date",
+            "Open",
+            "High",
+            "Low",
+            "Close",
+            "Final",
+            "Yesterday",
+            "Volume",
+            "Value",
+            "TradeCount",
+        ],
+    ]
+    df["J-Date"] = jalali.to_jalali_iso(df["Date"]) if len(df) else df["Date"]
+    level = "J-Date" if date_format == "jalali" else "Date"
+    df = df.set_index(["InsCode", level]).sort_index()
+    if date_format == "jalali":
+        df = df.drop(columns="Date")
+    elif date_format == "gregorian":
+        df = df.drop(columns="J-Date")
+    return df
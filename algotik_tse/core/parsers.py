@@ -6,7 +6,11 @@ Name string (e.g. option type, strike price, expiry date).
 """
 
 import re
-from persiantools.jdatetime import JalaliDate
+
+import numpy as np
+import pandas as pd
+
+from algotik_tse.core import jalali
 
 
 # ══════════════════════════════════════════════════════════════
@@ -69,6 +73,86 @@ def parse_option_name(name):
     }
 
 
+# Same pattern with the expiry split into year / month / day groups, for
+# Series.str.extract (anchored: parse_option_name uses re.match)
+_OPTION_NAME_PARTS_RE = (
+    r"^اختيار([خف])\s+(.+?)\s*-\s*(\d+)\s*-\s*(\d{2,4})/(\d{2})/(\d{2})"
+)
+
+# \d also matches Persian / Arabic-Indic digits, which int() accepts
+_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+
+
+def parse_option_names(names):
+    """Vectorized :func:`parse_option_name` over many names.
+
+    Parameters
+    ----------
+    names : pd.Series
+        Full option names from TSETMC.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same index as *names*, with columns ``matched`` (bool),
+        ``option_type``, ``underlying``, ``strike`` (float, NaN when not
+        matched), ``expiry_jalali``, ``expiry_gregorian`` (``datetime.date``
+        or None) and ``expiry`` (``datetime64[D]``, NaT when unknown).
+        Rows that do not match the option pattern have None/NaN fields.
+    """
+    names = pd.Series(names, dtype=object)
+    parts = names.str.strip().str.extract(_OPTION_NAME_PARTS_RE)
+    matched = parts[0].notna().to_numpy()
+    n = len(names)
+
+    def _ints(column):
+        text = parts.loc[matched, column]
+        try:
+            values = pd.to_numeric(text)
+        except ValueError:  # non-ASCII digits
+            values = pd.to_numeric(text.str.translate(_DIGITS))
+        return values.to_numpy(dtype="int64")
+
+    option_type = np.full(n, None, dtype=object)
+    underlying = np.full(n, None, dtype=object)
+    strike = np.full(n, np.nan)
+    expiry_jalali = np.full(n, None, dtype=object)
+    expiry = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+
+    if matched.any():
+        option_type[matched] = np.where(parts.loc[matched, 0] == "خ", "call", "put")
+        underlying[matched] = parts.loc[matched, 1].str.strip().to_numpy()
+        strike[matched] = _ints(2)
+
+        # Normalize 2-digit years (e.g. '04/11/29' → '1404/11/29')
+        year_text = parts.loc[matched, 3]
+        year = _ints(3)
+        short = (year_text.str.len() == 2).to_numpy()
+        year = np.where(short, np.where(year < 80, 1400 + year, 1300 + year), year)
+        year_text = year_text.where(~short, pd.Series(year, index=year_text.index).astype(str))
+        expiry_jalali[matched] = (
+            year_text + "/" + parts.loc[matched, 4] + "/" + parts.loc[matched, 5]
+        ).to_numpy()
+        expiry[matched] = jalali.to_gregorian_array(year, _ints(4), _ints(5))
+
+    expiry_gregorian = np.full(n, None, dtype=object)
+    known = ~np.isnat(expiry)
+    expiry_gregorian[known] = expiry[known].astype(object)
+
+    return pd.DataFrame(
+        {
+            "matched": matched,
+            "option_type": option_type,
+            "underlying": underlying,
+            "strike": strike,
+            "expiry_jalali": expiry_jalali,
+            "expiry_gregorian": expiry_gregorian,
+            "expiry": expiry,
+        },
+        index=names.index,
+    )
+
+
 def parse_option_symbol(symbol):
     """Determine option type from the symbol prefix character.
 
@@ -209,6 +293,101 @@ def parse_treasury_name(name):
     }
 
 
+# Keywords list_bonds() uses to pick the parser of a name
+_TREASURY_KEYWORDS = ("اسناد", "خزانه", "اخزا")
+_BOND_KEYWORDS = ("مرابحه", "اجاره", "سلف", "اراد", "ش.خ")
+
+
+def parse_bond_names(names):
+    """Vectorized bond / treasury detection over many names.
+
+    A name with a treasury keyword is parsed with
+    :func:`parse_treasury_name`; if that fails (or there is no treasury
+    keyword) a name with a bond keyword is parsed with
+    :func:`parse_bond_name`.
+
+    Parameters
+    ----------
+    names : pd.Series
+        Full instrument names from TSETMC.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same index as *names*, with columns ``matched`` (bool),
+        ``bond_type``, ``maturity_jalali``, ``maturity_gregorian``
+        (``datetime.date`` or None), ``maturity`` (``datetime64[D]``, NaT
+        when unknown) and ``ticker``. Rows that are neither have None
+        fields.
+    """
+    names = pd.Series(names, dtype=object).fillna("")
+    stripped = names.str.strip()
+    n = len(names)
+
+    def _has_any(keywords):
+        return names.str.contains("|".join(re.escape(k) for k in keywords)).to_numpy()
+
+    # Only names with a keyword are searched for a maturity; treasury
+    # first, then bonds for everything the treasury parser left
+    treasury_kw = _has_any(_TREASURY_KEYWORDS)
+    bond_kw = _has_any(_BOND_KEYWORDS)
+    searched = treasury_kw | bond_kw
+    candidates = stripped[searched]
+
+    def _first_match(*patterns):
+        found = candidates.str.extract(patterns[0])[0]
+        for pattern in patterns[1:]:
+            found = found.fillna(candidates.str.extract(pattern)[0])
+        values = np.full(n, np.nan, dtype=object)
+        values[searched] = found.to_numpy(dtype=object)
+        return pd.Series(values, index=names.index)
+
+    treasury_digits = _first_match(_TREASURY_MATURITY_RE)
+    treasury = treasury_kw & treasury_digits.notna().to_numpy()
+    bond_digits = _first_match(_BOND_MATURITY_SHKH, _BOND_MATURITY_TAIL)
+    bond = ~treasury & bond_kw & bond_digits.notna().to_numpy()
+    matched = treasury | bond
+
+    bond_type = np.full(n, None, dtype=object)
+    bond_type[bond] = "other"
+    for keyword, label in (("سلف", "salaf"), ("اجاره", "ijara"), ("مرابحه", "murabaha")):
+        bond_type[bond & stripped.str.contains(keyword).to_numpy()] = label
+    bond_type[treasury] = "treasury"
+
+    maturity_jalali = np.full(n, None, dtype=object)
+    maturity = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+    ticker = np.full(n, None, dtype=object)
+    if matched.any():
+        digits = treasury_digits.where(treasury, bond_digits)[matched].str.translate(_DIGITS)
+        yy = digits.str[:2].astype("int64").to_numpy()
+        mm = digits.str[2:4].astype("int64").to_numpy()
+        dd = digits.str[4:6].astype("int64").to_numpy()
+        year = np.where(yy < 80, 1400 + yy, 1300 + yy)
+        maturity_jalali[matched] = (
+            pd.Series(year, index=digits.index).astype(str)
+            + "/" + digits.str[2:4] + "/" + digits.str[4:6]
+        ).to_numpy(dtype=object)
+        maturity[matched] = jalali.to_gregorian_array(year, mm, dd)
+        tickers = stripped[matched].str.extract(_BOND_TICKER_RE)[0].str.strip()
+        ticker[matched] = tickers.astype(object).where(tickers.notna(), None).to_numpy()
+
+    maturity_gregorian = np.full(n, None, dtype=object)
+    known = ~np.isnat(maturity)
+    maturity_gregorian[known] = maturity[known].astype(object)
+
+    return pd.DataFrame(
+        {
+            "matched": matched,
+            "bond_type": bond_type,
+            "maturity_jalali": maturity_jalali,
+            "maturity_gregorian": maturity_gregorian,
+            "maturity": maturity,
+            "ticker": ticker,
+        },
+        index=names.index,
+    )
+
+
 # ══════════════════════════════════════════════════════════════
 #  Unified parser
 # ══════════════════════════════════════════════════════════════
@@ -286,7 +465,7 @@ def _jalali_str_to_date(jalali_str):
     try:
         parts = jalali_str.split("/")
         jy, jm, jd = int(parts[0]), int(parts[1]), int(parts[2])
-        return JalaliDate(jy, jm, jd).to_gregorian()
+        return jalali.to_gregorian(jy, jm, jd)
     except Exception:
         return None
 
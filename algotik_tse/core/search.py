@@ -1,12 +1,16 @@
 import requests
 from algotik_tse.settings import settings
 from algotik_tse.http_client import safe_get
+from algotik_tse.core import symbol_index
 
 
-def search_stock(search_txt="شتران"):
+def _local_code(search_txt):
+    """Return the id of a known index or industry index, or None.
+
+    Indices are resolved from built-in tables without any HTTP call.
+    """
     index_names = settings.index_names
     industry_index = settings.industry_index
-    stock_id = ""
     if search_txt in index_names:
         webid_dict = {
             index_names[0]: 32097828799138957,
@@ -61,20 +65,33 @@ def search_stock(search_txt="شتران"):
             industry_index[21]: 69306841376553334,
         }
         return str(industry_dict[search_txt]) + "industry"
-    else:
-        try:
-            res_search = safe_get(settings.url_search.format(search_txt)).json()[
-                "instrumentSearch"
-            ]
+    return None
+
+
+def _parse_search(data):
+    """Extract the first ``insCode`` from a GetInstrumentSearch JSON body.
 
-            if len(res_search) > 0:
-                stock_id = res_search[0]["insCode"]
-            else:
-                return None
-        except requests.exceptions.RequestException:
-            print("Connection Error!")
-            return None
-        except (ValueError, KeyError, IndexError, TypeError) as e:
-            print("Search Error: {}".format(e))
-            return None
-        return stock_id
+    Returns None when the search has no results.
+    """
+    res_search = data["instrumentSearch"]
+    if len(res_search) > 0:
+        return res_search[0]["insCode"]
+    return None
+
+
+def search_stock(search_txt="شتران"):
+    local_id = _local_code(search_txt)
+    if local_id is not None:
+        return local_id
+    if settings.symbol_index:
+        ins_code = symbol_index.lookup(search_txt)
+        if ins_code is not None:
+            return ins_code
+    try:
+        return _parse_search(safe_get(settings.url_search.format(search_txt)).json())
+    except requests.exceptions.RequestException:
+        print("Connection Error!")
+        return None
+    except (ValueError, KeyError, IndexError, TypeError) as e:
+        print("Search Error: {}".format(e))
+        return None
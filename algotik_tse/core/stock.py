@@ -1,4 +1,5 @@
 import io
+import json
 import datetime
 import requests
 import warnings
@@ -13,12 +14,768 @@ from algotik_tse.core.helper import (
     apply_date_format,
     apply_return_type,
     filter_by_date_or_values,
+    save_csv,
+    apply_ascending,
+    combine_frames,
+    concurrent_map,
 )
 from algotik_tse.http_client import safe_get
+from algotik_tse.core.adjustment import adjust_history
+from algotik_tse.core import history_store
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
 
+def _history_source(web_id):
+    """Split a ``search_stock()`` id into ``(code, kind, url)``.
+
+    ``kind`` is one of ``'stock'``, ``'index'`` or ``'industry'``.
+    """
+    if web_id[-5:] == "index":
+        web_id = web_id[:-5]
+        return web_id, "index", settings.url_index_history.format(web_id)
+    elif web_id[-8:] == "industry":
+        web_id = web_id[:-8]
+        return web_id, "industry", settings.url_industry_history.format(web_id)
+    return web_id, "stock", settings.url_price_history.format(web_id)
+
+
+def _get_stock(
+    stock_name,
+    mstart,
+    mend,
+    mvalues,
+    mtse_format,
+    mauto_adjust,
+    moutput_type,
+    mdate_format,
+    return_type=None,
+    adjust_volume=False,
+):
+    web_id = search_stock(search_txt=stock_name)
+    web_id, kind, url = _history_source(web_id)
+    content, frame = None, None
+    if kind == "stock" and settings.history_store:
+        frame = _from_store(
+            "price", web_id, url, _read_price_export, _fetch_recent_prices
+        )
+    if frame is None:
+        try:
+            content = safe_get(url).content
+        except requests.exceptions.RequestException:
+            print("Connection Error!")
+            return None
+    return _parse_history(
+        content,
+        web_id,
+        kind,
+        stock_name,
+        mstart,
+        mend,
+        mvalues,
+        mtse_format,
+        mauto_adjust,
+        moutput_type,
+        mdate_format,
+        return_type=return_type,
+        adjust_volume=adjust_volume,
+        frame=frame,
+    )
+
+
+# ── local history store ───────────────────────────────────────
+
+# GetClosingPriceDailyList field → Export-txt column
+_DAILY_LIST_COLUMNS = {
+    "priceFirst": "<FIRST>",
+    "priceMax": "<HIGH>",
+    "priceMin": "<LOW>",
+    "pClosing": "<CLOSE>",
+    "qTotCap": "<VALUE>",
+    "qTotTran5J": "<VOL>",
+    "zTotTran": "<OPENINT>",
+    "priceYesterday": "<OPEN>",
+    "pDrCotVal": "<LAST>",
+}
+
+
+def _read_price_export(content):
+    """Read an Export-txt body into the raw frame (newest session first)."""
+    return pd.read_csv(
+        io.StringIO(content.decode("utf-8")),
+        index_col="<DTYYYYMMDD>",
+        parse_dates=True,
+    )
+
+
+def _from_store(kind, web_id, url, read, fetch_recent=None):
+    """Return the raw history frame of ``web_id`` via the local store.
+
+    Serves the stored frame while it is fresh, otherwise merges the
+    sessions returned by ``fetch_recent`` or downloads the full history
+    from ``url`` with ``read``. Returns None on any failure so the caller
+    falls back to a plain download.
+    """
+    stored = history_store.load(kind, web_id)
+    if stored is not None:
+        df, updated_at = stored
+        if history_store.is_fresh(updated_at):
+            return df
+        if fetch_recent is not None:
+            recent = fetch_recent(web_id, df)
+            if recent is not None:
+                df = history_store.merge(df, recent)
+                history_store.save(kind, web_id, df)
+                return df
+    try:
+        df = read(safe_get(url).content)
+    except Exception:
+        return None
+    history_store.save(kind, web_id, df)
+    return df
+
+
+def _fetch_recent_prices(web_id, stored):
+    """Download the sessions since the last stored one as Export-txt rows.
+
+    Returns None when an incremental update is not possible: a gap longer
+    than ``settings.history_store_max_gap`` days, a failed request, or a
+    last stored session that the new data does not reproduce exactly
+    (TSETMC revised it), in which case the full history is re-downloaded.
+    """
+    last = stored.index.max()
+    # A session per calendar day is an upper bound, plus the overlap day
+    days = (pd.Timestamp.now().normalize() - last.normalize()).days + 1
+    if days > settings.history_store_max_gap:
+        return None
+    try:
+        response = safe_get(settings.url_price_history_daily.format(web_id, days))
+        rows = response.json()["closingPriceDaily"]
+        recent = pd.DataFrame(rows)
+        recent.index = pd.DatetimeIndex(
+            pd.to_datetime(recent["dEven"].astype(str), format="%Y%m%d"),
+            name=stored.index.name,
+        ).astype(stored.index.dtype)
+        recent = recent.rename(columns=_DAILY_LIST_COLUMNS)
+        recent["<TICKER>"] = stored["<TICKER>"].iloc[0]
+        recent["<PER>"] = stored["<PER>"].iloc[0]
+        recent = recent.loc[:, list(stored.columns)].astype(stored.dtypes.to_dict())
+    except (requests.exceptions.RequestException, ValueError, KeyError, TypeError):
+        return None
+    recent = recent.sort_index(ascending=False)
+    if last not in recent.index:
+        return None
+    overlap = ["<CLOSE>", "<OPEN>", "<LAST>"]
+    if not recent.loc[[last], overlap].equals(stored.loc[[last], overlap]):
+        return None
+    return recent
+
+
+def _parse_history(
+    content,
+    web_id,
+    kind,
+    stock_name,
+    mstart,
+    mend,
+    mvalues,
+    mtse_format,
+    mauto_adjust,
+    moutput_type,
+    mdate_format,
+    return_type=None,
+    adjust_volume=False,
+    frame=None,
+):
+    """Build the price-history DataFrame from a raw response body.
+
+    Shared by the blocking and the asyncio API so both return identical
+    frames. ``web_id`` and ``kind`` come from :func:`_history_source`.
+    For stocks, ``frame`` may hold the already-read export (e.g. from the
+    local history store) instead of ``content``.
+    """
+    new_start, new_end = date_fix(start=mstart, end=mend)
+    if new_start is not None or new_end is not None:
+        mvalues = 0
+    if kind == "industry":
+        industry_name = {
+            "32453344048876642": "Basic Metals",
+            "70077233737515808": "Cement",
+            "20213770409093165": "Automobile",
+            "33626672012415176": "Chemical",
+            "24733701189547084": "Communication",
+            "25163959460949732": "Other Financial",
+            "59288237226302898": "Textiles",
+            "57616105980228781": "Tile and Ceramic",
+            "25766336681098389": "Publishing",
+            "62691002126902464": "Mines",
+            "69306841376553334": "Leather Products",
+        }
+        try:
+            data = {
+                "<TICKER>": [],
+                "<DTYYYYMMDD>": [],
+                "<HIGH>": [],
+                "<LOW>": [],
+                "<CLOSE>": [],
+                "<PER>": [],
+            }
+            fopen = json.loads(content)
+            day_dict = {
+                value["dEven"]: {
+                    "Close": value["xNivInuClMresIbs"],
+                    "High": value["xNivInuPhMresIbs"],
+                    "Low": value["xNivInuPbMresIbs"],
+                }
+                for value in fopen["indexB2"]
+            }
+            for key, value in day_dict.items():
+                data["<TICKER>"].append(industry_name[web_id])
+                date_str = str(key)
+                date_iso = date_str[:4] + "-" + date_str[4:6] + "-" + date_str[6:]
+                data["<DTYYYYMMDD>"].append(datetime.date.fromisoformat(date_iso))
+                data["<HIGH>"].append(value["High"])
+                data["<LOW>"].append(value["Low"])
+                data["<CLOSE>"].append(value["Close"])
+                data["<PER>"].append("D")
+
+            df = pd.DataFrame(
+                data,
+                columns=data.keys(),
+                index=pd.DatetimeIndex(data["<DTYYYYMMDD>"]),
+            )
+            df.index.names = ["<DTYYYYMMDD>"]
+            df.drop(columns=["<DTYYYYMMDD>"], inplace=True)
+
+            if mvalues is not None or mstart is not None or mend is not None:
+                df = filter_by_date_or_values(df, mvalues, new_start, new_end)
+
+            if mtse_format:
+                return df
+            else:
+                df.index.rename("Date_base", inplace=True)
+                df.drop(["<TICKER>", "<PER>"], axis=1, inplace=True)
+                df.rename(
+                    columns={"<HIGH>": "High", "<LOW>": "Low", "<CLOSE>": "Close"},
+                    inplace=True,
+                )
+                df = df.loc[
+                    :,
+                    [
+                        "High",
+                        "Low",
+                        "Close",
+                    ],
+                ]
+                df = add_date_columns(df, stock_name)
+
+                df = apply_date_format(df, mdate_format)
+                if df is None:
+                    return None
+                if moutput_type == "standard":
+                    df = df.loc[
+                        :,
+                        [
+                            "High",
+                            "Low",
+                            "Close",
+                        ],
+                    ]
+                elif moutput_type == "full":
+                    pass
+                else:
+                    print("output_type should select between 'standard' or 'full'")
+                    return None
+
+                df = apply_return_type(df, return_type, default_price="Close")
+                if df is None:
+                    return None
+
+                return df
+        except Exception as e:
+            print("Error processing industry data: {}".format(e))
+            return None
+    if kind == "index":
+        index_names = {
+            "32097828799138957": "Overall Index",
+            "67130298613737946": "Total Equal Weighted Index",
+            "5798407779416661": "Total Price Index",
+            "8384385859414435": "Equal Weighted Price Index",
+            "49579049405614711": "Free Float Index",
+            "62752761908615603": "OTC Main Board Index",
+            "71704845530629737": "OTC Secondary Board Index",
+            "43754960038275285": "Industry Index",
+            "10523825119011581": "Top 30 Index",
+            "46342955726788357": "Top 50 Index",
+        }
+        try:
+            data = {
+                "<TICKER>": [],
+                "<DTYYYYMMDD>": [],
+                "<FIRST>": [],
+                "<HIGH>": [],
+                "<LOW>": [],
+                "<CLOSE>": [],
+                "<VOL>": [],
+                "<PER>": [],
+                "<OPEN>": [],
+                "<LAST>": [],
+            }
+            fopen = content.decode("utf-8").split(";")
+            for dt in fopen:
+                dts = dt.split(",")
+                data["<TICKER>"].append(index_names[web_id])
+                date_iso = dts[0][:4] + "-" + dts[0][4:6] + "-" + dts[0][6:]
+                data["<DTYYYYMMDD>"].append(datetime.date.fromisoformat(date_iso))
+                data["<FIRST>"].append(float(dts[3]))
+                data["<HIGH>"].append(float(dts[1]))
+                data["<LOW>"].append(float(dts[2]))
+                data["<CLOSE>"].append(float(dts[6]))
+                data["<VOL>"].append(float(dts[5]))
+                data["<PER>"].append("D")
+                data["<OPEN>"].append(float(dts[3]))
+                data["<LAST>"].append(float(dts[4]))
+
+            df = pd.DataFrame(
+                data,
+                columns=data.keys(),
+                index=pd.DatetimeIndex(data["<DTYYYYMMDD>"]),
+            )
+            df.index.names = ["<DTYYYYMMDD>"]
+            df.drop(columns=["<DTYYYYMMDD>"], inplace=True)
+
+            if mvalues is not None or mstart is not None or mend is not None:
+                df = filter_by_date_or_values(df, mvalues, new_start, new_end)
+
+            if mtse_format:
+                return df
+            else:
+                df.index.rename("Date_base", inplace=True)
+                df.drop(["<TICKER>", "<PER>", "<OPEN>"], axis=1, inplace=True)
+                df.rename(
+                    columns={
+                        "<FIRST>": "Open",
+                        "<HIGH>": "High",
+                        "<LOW>": "Low",
+                        "<CLOSE>": "Adj Close",
+                        "<VOL>": "Volume",
+                        "<LAST>": "Close",
+                    },
+                    inplace=True,
+                )
+                df = df.loc[
+                    :,
+                    [
+                        "Open",
+                        "High",
+                        "Low",
+                        "Close",
+                        "Adj Close",
+                        "Volume",
+                    ],
+                ]
+                df = add_date_columns(df, stock_name)
+
+                if mauto_adjust:
+                    df.drop("Adj Close", axis=1, inplace=True)
+                    df = apply_date_format(df, mdate_format)
+                    if df is None:
+                        return None
+                    if moutput_type == "standard":
+                        df = df.loc[:, ["Open", "High", "Low", "Close", "Volume"]]
+                    elif moutput_type == "full":
+                        pass
+                    else:
+                        print(
+                            "output_type should select between 'standard' or 'full'"
+                        )
+                        return None
+                else:
+                    df = apply_date_format(df, mdate_format)
+                    if df is None:
+                        return None
+                    if moutput_type == "standard":
+                        df = df.loc[
+                            :,
+                            ["Open", "High", "Low", "Close", "Adj Close", "Volume"],
+                        ]
+                    elif moutput_type == "full":
+                        pass
+                    else:
+                        print(
+                            "output_type should select between 'standard' or 'full'"
+                        )
+                        return None
+
+                price = "Close" if mauto_adjust else "Adj Close"
+                df = apply_return_type(df, return_type, default_price=price)
+                if df is None:
+                    return None
+
+                return df
+        except Exception as e:
+            print("Error processing index data: {}".format(e))
+            return None
+    else:
+        try:
+            df = frame if frame is not None else _read_price_export(content)
+            df = df[::-1]
+            if mvalues is not None or mstart is not None or mend is not None:
+                df = filter_by_date_or_values(df, mvalues, new_start, new_end)
+
+            if mtse_format:
+                return df
+            else:
+                df.index.rename("Date_base", inplace=True)
+                df.drop(["<TICKER>", "<PER>"], axis=1, inplace=True)
+                df.rename(
+                    columns={
+                        "<FIRST>": "Open",
+                        "<HIGH>": "High",
+                        "<LOW>": "Low",
+                        "<CLOSE>": "Final",
+                        "<VALUE>": "Value",
+                        "<VOL>": "Volume",
+                        "<OPENINT>": "No.",
+                        "<OPEN>": "Yesterday-Final",
+                        "<LAST>": "Close",
+                    },
+                    inplace=True,
+                )
+                df = df.loc[
+                    :,
+                    [
+                        "Open",
+                        "High",
+                        "Low",
+                        "Close",
+                        "Final",
+                        "Volume",
+                        "Yesterday-Final",
+                        "No.",
+                        "Value",
+                    ],
+                ]
+                df = adjust_history(df)
+                df = add_date_columns(df, stock_name)
+                if mauto_adjust:
+                    if adjust_volume:
+                        df = df.loc[
+                            :,
+                            [
+                                "Adj Open",
+                                "Adj High",
+                                "Adj Low",
+                                "Adj Close",
+                                "Adj Final",
+                                "Volume",
+                                "Adj Volume",
+                                "No.",
+                                "Value",
+                                "Date",
+                                "J-Date",
+                                "Weekday",
+                                "Weekday_fa",
+                                "Ticker",
+                            ],
+                        ]
+                    else:
+                        df = df.loc[
+                            :,
+                            [
+                                "Adj Open",
+                                "Adj High",
+                                "Adj Low",
+                                "Adj Close",
+                                "Adj Final",
+                                "Volume",
+                                "No.",
+                                "Value",
+                                "Date",
+                                "J-Date",
+                                "Weekday",
+                                "Weekday_fa",
+                                "Ticker",
+                            ],
+                        ]
+                    df.rename(
+                        columns={
+                            "Adj Open": "Open",
+                            "Adj High": "High",
+                            "Adj Low": "Low",
+                            "Adj Close": "Close",
+                            "Adj Final": "Final",
+                        },
+                        inplace=True,
+                    )
+                    df = apply_date_format(df, mdate_format)
+                    if df is None:
+                        return None
+                    if moutput_type == "standard":
+                        df = df.loc[:, ["Open", "High", "Low", "Close", "Volume"]]
+                    elif moutput_type == "full":
+                        pass
+                    else:
+                        print(
+                            "output_type should select between 'standard' or 'full'"
+                        )
+                        return None
+                else:
+                    if adjust_volume:
+                        df = df.loc[
+                            :,
+                            [
+                                "Open",
+                                "High",
+                                "Low",
+                                "Close",
+                                "Final",
+                                "Adj Close",
+                                "Volume",
+                                "Adj Volume",
+                                "No.",
+                                "Value",
+                                "Date",
+                                "J-Date",
+                                "Weekday",
+                                "Weekday_fa",
+                                "Ticker",
+                            ],
+                        ]
+                    else:
+                        df = df.loc[
+                            :,
+                            [
+                                "Open",
+                                "High",
+                                "Low",
+                                "Close",
+                                "Final",
+                                "Adj Close",
+                                "Volume",
+                                "No.",
+                                "Value",
+                                "Date",
+                                "J-Date",
+                                "Weekday",
+                                "Weekday_fa",
+                                "Ticker",
+                            ],
+                        ]
+                    df = apply_date_format(df, mdate_format)
+                    if df is None:
+                        return None
+                    if moutput_type == "standard":
+                        df = df.loc[
+                            :,
+                            ["Open", "High", "Low", "Close", "Adj Close", "Volume"],
+                        ]
+                    elif moutput_type == "full":
+                        pass
+                    else:
+                        print(
+                            "output_type should select between 'standard' or 'full'"
+                        )
+                        return None
+
+                price = "Close" if mauto_adjust else "Adj Close"
+                df = apply_return_type(df, return_type, default_price=price)
+                if df is None:
+                    return None
+                return df
+        except Exception as e:
+            print("Stock Not Found or data error: {}".format(e))
+            return None
+
+
+def _get_stock_RI(
+    stock_name, mstart, mend, mvalues, mtse_format, moutput_type, mdate_format
+):
+    web_id = search_stock(search_txt=stock_name)
+    if web_id[-5:] == "index" or web_id[-8:] == "industry":
+        print("{} is an index, Please enter a valid stock name!".format(stock_name))
+        return None
+    url = settings.url_client_type.format(web_id)
+    content, frame = None, None
+    if settings.history_store:
+        frame = _from_store("client_type", web_id, url, _read_client_type)
+    if frame is None:
+        try:
+            content = safe_get(url).content
+        except requests.exceptions.RequestException:
+            print("Connection Error!")
+            return None
+    return _parse_client_type(
+        content,
+        stock_name,
+        mstart,
+        mend,
+        mvalues,
+        mtse_format,
+        moutput_type,
+        mdate_format,
+        frame=frame,
+    )
+
+
+def _read_client_type(content, stock_name=""):
+    """Read a clienttype.aspx body into the raw frame (response order)."""
+    fopen = content.decode("utf-8").split(";")
+    data = {
+        "<DTYYYYMMDD>": [],
+        "<TICKER>": [],
+        "<N_BUY_RETAIL>": [],
+        "<N_BUY_INSTITUTIONAL>": [],
+        "<N_SELL_RETAIL>": [],
+        "<N_SELL_INSTITUTIONAL>": [],
+        "<VOL_BUY_RETAIL>": [],
+        "<VOL_BUY_INSTITUTIONAL>": [],
+        "<VOL_SELL_RETAIL>": [],
+        "<VOL_SELL_INSTITUTIONAL>": [],
+        "<VAL_BUY_RETAIL>": [],
+        "<VAL_BUY_INSTITUTIONAL>": [],
+        "<VAL_SELL_RETAIL>": [],
+        "<VAL_SELL_INSTITUTIONAL>": [],
+        "<PER>": [],
+    }
+
+    for dt in fopen:
+        dts = dt.split(",")
+        date_iso = dts[0][:4] + "-" + dts[0][4:6] + "-" + dts[0][6:]
+        data["<DTYYYYMMDD>"].append(datetime.date.fromisoformat(date_iso))
+        data["<TICKER>"].append(stock_name)
+        data["<N_BUY_RETAIL>"].append(int(dts[1]))
+        data["<N_BUY_INSTITUTIONAL>"].append(int(dts[2]))
+        data["<N_SELL_RETAIL>"].append(int(dts[3]))
+        data["<N_SELL_INSTITUTIONAL>"].append(int(dts[4]))
+        data["<VOL_BUY_RETAIL>"].append(int(dts[5]))
+        data["<VOL_BUY_INSTITUTIONAL>"].append(int(dts[6]))
+        data["<VOL_SELL_RETAIL>"].append(int(dts[7]))
+        data["<VOL_SELL_INSTITUTIONAL>"].append(int(dts[8]))
+        data["<VAL_BUY_RETAIL>"].append(int(dts[9]))
+        data["<VAL_BUY_INSTITUTIONAL>"].append(int(dts[10]))
+        data["<VAL_SELL_RETAIL>"].append(int(dts[11]))
+        data["<VAL_SELL_INSTITUTIONAL>"].append(int(dts[12]))
+        data["<PER>"].append("D")
+
+    df = pd.DataFrame(
+        data, columns=data.keys(), index=pd.DatetimeIndex(data["<DTYYYYMMDD>"])
+    )
+    df.index.names = ["<DTYYYYMMDD>"]
+    df.drop(columns=["<DTYYYYMMDD>"], inplace=True)
+    return df
+
+
+def _parse_client_type(
+    content,
+    stock_name,
+    mstart,
+    mend,
+    mvalues,
+    mtse_format,
+    moutput_type,
+    mdate_format,
+    frame=None,
+):
+    """Build the retail/institutional DataFrame from a raw response body.
+
+    Shared by the blocking and the asyncio API. ``frame`` may hold the
+    already-read rows (e.g. from the local history store) instead of
+    ``content``.
+    """
+    new_start, new_end = date_fix(start=mstart, end=mend)
+    if new_start is not None or new_end is not None:
+        mvalues = 0
+    try:
+        if frame is not None:
+            df = frame.copy()
+            df["<TICKER>"] = stock_name
+        else:
+            df = _read_client_type(content, stock_name)
+
+        df = df[::-1]
+        if mvalues is not None or mstart is not None or mend is not None:
+            df = filter_by_date_or_values(df, mvalues, new_start, new_end)
+
+        if mtse_format:
+            return df
+        else:
+            df.index.rename("Date_base", inplace=True)
+            df.drop(["<TICKER>", "<PER>"], axis=1, inplace=True)
+            df.rename(
+                columns={
+                    "<N_BUY_RETAIL>": "N_buy_retail",
+                    "<N_BUY_INSTITUTIONAL>": "N_buy_institutional",
+                    "<N_SELL_RETAIL>": "N_sell_retail",
+                    "<N_SELL_INSTITUTIONAL>": "N_sell_institutional",
+                    "<VOL_BUY_RETAIL>": "Vol_buy_retail",
+                    "<VOL_BUY_INSTITUTIONAL>": "Vol_buy_institutional",
+                    "<VOL_SELL_RETAIL>": "Vol_sell_retail",
+                    "<VOL_SELL_INSTITUTIONAL>": "Vol_sell_institutional",
+                    "<VAL_BUY_RETAIL>": "Val_buy_retail",
+                    "<VAL_BUY_INSTITUTIONAL>": "Val_buy_institutional",
+                    "<VAL_SELL_RETAIL>": "Val_sell_retail",
+                    "<VAL_SELL_INSTITUTIONAL>": "Val_sell_institutional",
+                },
+                inplace=True,
+            )
+
+            df["Per_capita_buy_retail"] = round(
+                df["Val_buy_retail"] / df["N_buy_retail"]
+            )
+            df["Per_capita_sell_retail"] = round(
+                df["Val_sell_retail"] / df["N_sell_retail"]
+            )
+            df["Per_capita_buy_institutional"] = round(
+                df["Val_buy_institutional"] / df["N_buy_institutional"]
+            )
+            df["Per_capita_sell_institutional"] = round(
+                df["Val_sell_institutional"] / df["N_sell_institutional"]
+            )
+            df["Power_retail"] = round(
+                df["Per_capita_buy_retail"] / df["Per_capita_sell_retail"], 3
+            )
+            df["Power_institutional"] = round(
+                df["Per_capita_buy_institutional"]
+                / df["Per_capita_sell_institutional"],
+                3,
+            )
+
+            df = add_date_columns(df, stock_name)
+            df.fillna(value=0, inplace=True)
+
+            df = apply_date_format(df, mdate_format)
+            if df is None:
+                return None
+            if moutput_type == "standard":
+                df = df.loc[
+                    :,
+                    [
+                        "N_buy_retail",
+                        "N_buy_institutional",
+                        "N_sell_retail",
+                        "N_sell_institutional",
+                        "Vol_buy_retail",
+                        "Vol_buy_institutional",
+                        "Vol_sell_retail",
+                        "Vol_sell_institutional",
+                        "Val_buy_retail",
+                        "Val_buy_institutional",
+                        "Val_sell_retail",
+                        "Val_sell_institutional",
+                    ],
+                ]
+            elif moutput_type == "full":
+                pass
+            else:
+                print("output_type should select between 'standard' or 'full'")
+                return None
+            return df
+    except Exception as e:
+        print("Stock Not Found or data error: {}".format(e))
+        return None
+
+
 def stock(
     symbol="",
     start=None,
@@ -35,6 +792,7 @@ def stock(
     return_type=None,
     ascending=True,
     save_path=None,
+    max_workers=None,
     **kwargs
 ):
     """
@@ -104,6 +862,10 @@ def stock(
                                 with both return 'simple_returns' and 'log_returns' in complete mode in output.
                             if return_type=['simple', 'Close', 5], you get simple return in 5 day on Close.
                                 with this 'returns' in complete mode in output.
+    :param max_workers:     number of symbols fetched in parallel when a list of
+                                symbols is given. requests still share the rate
+                                limit from settings.rate_limit_delay.
+                            Default value is None (use settings.max_workers).
 
     :return: pandas dataframe or None
     """
@@ -126,491 +888,6 @@ def stock(
     tse_format = raw
     multi_stock_drop = dropna
 
-    def _get_stock(
-        stock_name,
-        mstart,
-        mend,
-        mvalues,
-        mtse_format,
-        mauto_adjust,
-        moutput_type,
-        mdate_format,
-    ):
-        web_id = search_stock(search_txt=stock_name)
-        _price_base_url = settings.url_price_history
-        isIndex = False
-        isIndustry = False
-        if web_id[-5:] == "index":
-            web_id = web_id[:-5]
-            _price_base_url = settings.url_index_history
-            isIndex = True
-        elif web_id[-8:] == "industry":
-            web_id = web_id[:-8]
-            _price_base_url = settings.url_industry_history
-            isIndustry = True
-        new_start, new_end = date_fix(start=mstart, end=mend)
-        if new_start is not None or new_end is not None:
-            mvalues = 0
-        if isIndustry:
-            industry_name = {
-                "32453344048876642": "Basic Metals",
-                "70077233737515808": "Cement",
-                "20213770409093165": "Automobile",
-                "33626672012415176": "Chemical",
-                "24733701189547084": "Communication",
-                "25163959460949732": "Other Financial",
-                "59288237226302898": "Textiles",
-                "57616105980228781": "Tile and Ceramic",
-                "25766336681098389": "Publishing",
-                "62691002126902464": "Mines",
-                "69306841376553334": "Leather Products",
-            }
-            try:
-                data = {
-                    "<TICKER>": [],
-                    "<DTYYYYMMDD>": [],
-                    "<HIGH>": [],
-                    "<LOW>": [],
-                    "<CLOSE>": [],
-                    "<PER>": [],
-                }
-                fopen = safe_get(_price_base_url.format(web_id)).json()
-                day_dict = {
-                    value["dEven"]: {
-                        "Close": value["xNivInuClMresIbs"],
-                        "High": value["xNivInuPhMresIbs"],
-                        "Low": value["xNivInuPbMresIbs"],
-                    }
-                    for value in fopen["indexB2"]
-                }
-                for key, value in day_dict.items():
-                    data["<TICKER>"].append(industry_name[web_id])
-                    date_str = str(key)
-                    date_iso = date_str[:4] + "-" + date_str[4:6] + "-" + date_str[6:]
-                    data["<DTYYYYMMDD>"].append(datetime.date.fromisoformat(date_iso))
-                    data["<HIGH>"].append(value["High"])
-                    data["<LOW>"].append(value["Low"])
-                    data["<CLOSE>"].append(value["Close"])
-                    data["<PER>"].append("D")
-
-                df = pd.DataFrame(
-                    data,
-                    columns=data.keys(),
-                    index=pd.DatetimeIndex(data["<DTYYYYMMDD>"]),
-                )
-                df.index.names = ["<DTYYYYMMDD>"]
-                df.drop(columns=["<DTYYYYMMDD>"], inplace=True)
-
-                if mvalues is not None or mstart is not None or mend is not None:
-                    df = filter_by_date_or_values(df, mvalues, new_start, new_end)
-
-                if mtse_format:
-                    return df
-                else:
-                    df.index.rename("Date_base", inplace=True)
-                    df.drop(["<TICKER>", "<PER>"], axis=1, inplace=True)
-                    df.rename(
-                        columns={"<HIGH>": "High", "<LOW>": "Low", "<CLOSE>": "Close"},
-                        inplace=True,
-                    )
-                    df = df.loc[
-                        :,
-                        [
-                            "High",
-                            "Low",
-                            "Close",
-                        ],
-                    ]
-                    df = add_date_columns(df, stock_name)
-
-                    df = apply_date_format(df, mdate_format)
-                    if df is None:
-                        return None
-                    if moutput_type == "standard":
-                        df = df.loc[
-                            :,
-                            [
-                                "High",
-                                "Low",
-                                "Close",
-                            ],
-                        ]
-                    elif moutput_type == "full":
-                        pass
-                    else:
-                        print("output_type should select between 'standard' or 'full'")
-                        return None
-
-                    df = apply_return_type(df, return_type, default_price="Close")
-                    if df is None:
-                        return None
-
-                    return df
-            except requests.exceptions.RequestException:
-                print("Connection Error!")
-                return None
-            except Exception as e:
-                print("Error processing industry data: {}".format(e))
-                return None
-        if isIndex:
-            index_names = {
-                "32097828799138957": "Overall Index",
-                "67130298613737946": "Total Equal Weighted Index",
-                "5798407779416661": "Total Price Index",
-                "8384385859414435": "Equal Weighted Price Index",
-                "49579049405614711": "Free Float Index",
-                "62752761908615603": "OTC Main Board Index",
-                "71704845530629737": "OTC Secondary Board Index",
-                "43754960038275285": "Industry Index",
-                "10523825119011581": "Top 30 Index",
-                "46342955726788357": "Top 50 Index",
-            }
-            try:
-                data = {
-                    "<TICKER>": [],
-                    "<DTYYYYMMDD>": [],
-                    "<FIRST>": [],
-                    "<HIGH>": [],
-                    "<LOW>": [],
-                    "<CLOSE>": [],
-                    "<VOL>": [],
-                    "<PER>": [],
-                    "<OPEN>": [],
-                    "<LAST>": [],
-                }
-                fopen = safe_get(_price_base_url.format(web_id)).text.split(";")
-                for dt in fopen:
-                    dts = dt.split(",")
-                    data["<TICKER>"].append(index_names[web_id])
-                    date_iso = dts[0][:4] + "-" + dts[0][4:6] + "-" + dts[0][6:]
-                    data["<DTYYYYMMDD>"].append(datetime.date.fromisoformat(date_iso))
-                    data["<FIRST>"].append(float(dts[3]))
-                    data["<HIGH>"].append(float(dts[1]))
-                    data["<LOW>"].append(float(dts[2]))
-                    data["<CLOSE>"].append(float(dts[6]))
-                    data["<VOL>"].append(float(dts[5]))
-                    data["<PER>"].append("D")
-                    data["<OPEN>"].append(float(dts[3]))
-                    data["<LAST>"].append(float(dts[4]))
-
-                df = pd.DataFrame(
-                    data,
-                    columns=data.keys(),
-                    index=pd.DatetimeIndex(data["<DTYYYYMMDD>"]),
-                )
-                df.index.names = ["<DTYYYYMMDD>"]
-                df.drop(columns=["<DTYYYYMMDD>"], inplace=True)
-
-                if mvalues is not None or mstart is not None or mend is not None:
-                    df = filter_by_date_or_values(df, mvalues, new_start, new_end)
-
-                if mtse_format:
-                    return df
-                else:
-                    df.index.rename("Date_base", inplace=True)
-                    df.drop(["<TICKER>", "<PER>", "<OPEN>"], axis=1, inplace=True)
-                    df.rename(
-                        columns={
-                            "<FIRST>": "Open",
-                            "<HIGH>": "High",
-                            "<LOW>": "Low",
-                            "<CLOSE>": "Adj Close",
-                            "<VOL>": "Volume",
-                            "<LAST>": "Close",
-                        },
-                        inplace=True,
-                    )
-                    df = df.loc[
-                        :,
-                        [
-                            "Open",
-                            "High",
-                            "Low",
-                            "Close",
-                            "Adj Close",
-                            "Volume",
-                        ],
-                    ]
-                    df = add_date_columns(df, stock_name)
-
-                    if mauto_adjust:
-                        df.drop("Adj Close", axis=1, inplace=True)
-                        df = apply_date_format(df, mdate_format)
-                        if df is None:
-                            return None
-                        if moutput_type == "standard":
-                            df = df.loc[:, ["Open", "High", "Low", "Close", "Volume"]]
-                        elif moutput_type == "full":
-                            pass
-                        else:
-                            print(
-                                "output_type should select between 'standard' or 'full'"
-                            )
-                            return None
-                    else:
-                        df = apply_date_format(df, mdate_format)
-                        if df is None:
-                            return None
-                        if moutput_type == "standard":
-                            df = df.loc[
-                                :,
-                                ["Open", "High", "Low", "Close", "Adj Close", "Volume"],
-                            ]
-                        elif moutput_type == "full":
-                            pass
-                        else:
-                            print(
-                                "output_type should select between 'standard' or 'full'"
-                            )
-                            return None
-
-                    price = "Close" if mauto_adjust else "Adj Close"
-                    df = apply_return_type(df, return_type, default_price=price)
-                    if df is None:
-                        return None
-
-                    return df
-            except requests.exceptions.RequestException:
-                print("Connection Error!")
-                return None
-            except Exception as e:
-                print("Error processing index data: {}".format(e))
-                return None
-        else:
-            try:
-                fopen = safe_get(_price_base_url.format(web_id)).content
-                df = pd.read_csv(
-                    io.StringIO(fopen.decode("utf-8")),
-                    index_col="<DTYYYYMMDD>",
-                    parse_dates=True,
-                )
-                df = df[::-1]
-                if mvalues is not None or mstart is not None or mend is not None:
-                    df = filter_by_date_or_values(df, mvalues, new_start, new_end)
-
-                if mtse_format:
-                    return df
-                else:
-                    df.index.rename("Date_base", inplace=True)
-                    df.drop(["<TICKER>", "<PER>"], axis=1, inplace=True)
-                    df.rename(
-                        columns={
-                            "<FIRST>": "Open",
-                            "<HIGH>": "High",
-                            "<LOW>": "Low",
-                            "<CLOSE>": "Final",
-                            "<VALUE>": "Value",
-                            "<VOL>": "Volume",
-                            "<OPENINT>": "No.",
-                            "<OPEN>": "Yesterday-Final",
-                            "<LAST>": "Close",
-                        },
-                        inplace=True,
-                    )
-                    df = df.loc[
-                        :,
-                        [
-                            "Open",
-                            "High",
-                            "Low",
-                            "Close",
-                            "Final",
-                            "Volume",
-                            "Yesterday-Final",
-                            "No.",
-                            "Value",
-                        ],
-                    ]
-                    df["Final+1"] = df["Final"].shift(1)
-                    df["pos"] = df.apply(
-                        lambda x: (
-                            x["Yesterday-Final"]
-                            if (
-                                (x["Yesterday-Final"] != 0)
-                                and (x["Yesterday-Final"] != 1000)
-                            )
-                            else (
-                                x["Yesterday-Final"]
-                                if (pd.isnull(x["Final+1"]))
-                                else x["Final+1"]
-                            )
-                        ),
-                        axis=1,
-                    )
-                    df["Yesterday-Final"] = df["pos"]
-                    df.drop(columns=["Final+1", "pos"], inplace=True)
-                    df["coef"] = (df["Yesterday-Final"].shift(-1) / df["Final"]).fillna(
-                        1.0
-                    )
-                    df["Adj coef"] = df.iloc[::-1]["coef"].cumprod().iloc[::-1]
-                    df["Adj Vol coef"] = 1 / df["Adj coef"]
-                    df["Adj Close"] = (df["Close"] * df["Adj coef"]).apply(
-                        lambda x: int(x)
-                    )
-                    df["Adj Open"] = (df["Open"] * df["Adj coef"]).apply(
-                        lambda x: int(x)
-                    )
-                    df["Adj High"] = (df["High"] * df["Adj coef"]).apply(
-                        lambda x: int(x)
-                    )
-                    df["Adj Low"] = (df["Low"] * df["Adj coef"]).apply(lambda x: int(x))
-                    df["Adj Final"] = (df["Final"] * df["Adj coef"]).apply(
-                        lambda x: int(x)
-                    )
-                    df["Adj Volume"] = (df["Volume"] * df["Adj Vol coef"]).apply(
-                        lambda x: int(x)
-                    )
-                    df.drop(columns=["coef", "Adj coef", "Adj Vol coef"], inplace=True)
-                    df = add_date_columns(df, stock_name)
-                    if mauto_adjust:
-                        if adjust_volume:
-                            df = df.loc[
-                                :,
-                                [
-                                    "Adj Open",
-                                    "Adj High",
-                                    "Adj Low",
-                                    "Adj Close",
-                                    "Adj Final",
-                                    "Volume",
-                                    "Adj Volume",
-                                    "No.",
-                                    "Value",
-                                    "Date",
-                                    "J-Date",
-                                    "Weekday",
-                                    "Weekday_fa",
-                                    "Ticker",
-                                ],
-                            ]
-                        else:
-                            df = df.loc[
-                                :,
-                                [
-                                    "Adj Open",
-                                    "Adj High",
-                                    "Adj Low",
-                                    "Adj Close",
-                                    "Adj Final",
-                                    "Volume",
-                                    "No.",
-                                    "Value",
-                                    "Date",
-                                    "J-Date",
-                                    "Weekday",
-                                    "Weekday_fa",
-                                    "Ticker",
-                                ],
-                            ]
-                        df.rename(
-                            columns={
-                                "Adj Open": "Open",
-                                "Adj High": "High",
-                                "Adj Low": "Low",
-                                "Adj Close": "Close",
-                                "Adj Final": "Final",
-                            },
-                            inplace=True,
-                        )
-                        df = apply_date_format(df, mdate_format)
-                        if df is None:
-                            return None
-                        if moutput_type == "standard":
-                            df = df.loc[:, ["Open", "High", "Low", "Close", "Volume"]]
-                        elif moutput_type == "full":
-                            pass
-                        else:
-                            print(
-                                "output_type should select between 'standard' or 'full'"
-                            )
-                            return None
-                    else:
-                        if adjust_volume:
-                            df = df.loc[
-                                :,
-                                [
-                                    "Open",
-                                    "High",
-                                    "Low",
-                                    "Close",
-                                    "Final",
-                                    "Adj Close",
-                                    "Volume",
-                                    "Adj Volume",
-                                    "No.",
-                                    "Value",
-                                    "Date",
-                                    "J-Date",
-                                    "Weekday",
-                                    "Weekday_fa",
-                                    "Ticker",
-                                ],
-                            ]
-                        else:
-                            df = df.loc[
-                                :,
-                                [
-                                    "Open",
-                                    "High",
-                                    "Low",
-                                    "Close",
-                                    "Final",
-                                    "Adj Close",
-                                    "Volume",
-                                    "No.",
-                                    "Value",
-                                    "Date",
-                                    "J-Date",
-                                    "Weekday",
-                                    "Weekday_fa",
-                                    "Ticker",
-                                ],
-                            ]
-                        df = apply_date_format(df, mdate_format)
-                        if df is None:
-                            return None
-                        if moutput_type == "standard":
-                            df = df.loc[
-                                :,
-                                ["Open", "High", "Low", "Close", "Adj Close", "Volume"],
-                            ]
-                        elif moutput_type == "full":
-                            pass
-                        else:
-                            print(
-                                "output_type should select between 'standard' or 'full'"
-                            )
-                            return None
-
-                    price = "Close" if mauto_adjust else "Adj Close"
-                    df = apply_return_type(df, return_type, default_price=price)
-                    if df is None:
-                        return None
-                    return df
-            except requests.exceptions.RequestException:
-                print("Connection Error!")
-                return None
-            except Exception as e:
-                print("Stock Not Found or data error: {}".format(e))
-                return None
-
-    import os
-
-    def _save_csv(df, filename):
-        """Save DataFrame to CSV, respecting save_path."""
-        if save_path:
-            os.makedirs(save_path, exist_ok=True)
-            filepath = os.path.join(save_path, filename)
-        else:
-            filepath = filename
-        df.to_csv(filepath, encoding="utf-8-sig")
-
-    def _apply_ascending(df):
-        """Sort by index ascending/descending based on user preference."""
-        if df is not None and not ascending:
-            return df.iloc[::-1]
-        return df
-
     if symbol == "":
         symbol = "شتران"
         if progress:
@@ -625,14 +902,16 @@ def stock(
             mauto_adjust=auto_adjust,
             moutput_type=output_type,
             mdate_format=date_format,
+            return_type=return_type,
+            adjust_volume=adjust_volume,
         )
         if progress and df is not None:
             print("1/1: Completed!")
         if save_to_file and df is not None:
             if progress:
                 print("Saving to file: {}.csv".format(symbol))
-            _save_csv(df, symbol + ".csv")
-        return _apply_ascending(df)
+            save_csv(df, symbol + ".csv", save_path)
+        return apply_ascending(df, ascending)
     else:
         if isinstance(symbol, str):
             if progress:
@@ -647,19 +926,22 @@ def stock(
                 mauto_adjust=auto_adjust,
                 moutput_type=output_type,
                 mdate_format=date_format,
+                return_type=return_type,
+                adjust_volume=adjust_volume,
             )
             if progress and df is not None:
                 print("1/1: Completed!")
             if save_to_file and df is not None:
                 if progress:
                     print("Saving to file: {}.csv".format(symbol))
-                _save_csv(df, symbol + ".csv")
-            return _apply_ascending(df)
+                save_csv(df, symbol + ".csv", save_path)
+            return apply_ascending(df, ascending)
         elif isinstance(symbol, list):
-            n = 1
             df_dict = {}
             file_name_str = ""
-            for stk in symbol:
+
+            def _fetch_one(item):
+                n, stk = item
                 if progress:
                     print(
                         "{}/{}: Getting historical price of {}".format(
@@ -676,13 +958,22 @@ def stock(
                     mauto_adjust=auto_adjust,
                     moutput_type=output_type,
                     mdate_format=date_format,
+                    return_type=return_type,
+                    adjust_volume=adjust_volume,
                 )
+                return stk, df
+
+            # Fetch in parallel (if requested), then assemble in input order
+            workers = settings.max_workers if max_workers is None else max_workers
+            fetched = concurrent_map(
+                _fetch_one, enumerate(symbol, start=1), max_workers=workers
+            )
+            for stk, df in fetched:
                 if df is not None:
                     file_name_str += "-" + stk
                     df_dict[stk] = df
                 else:
                     print("{} not Found!".format(stk))
-                n += 1
             if progress:
                 print("{}/{} Completed!".format(len(symbol), len(symbol)))
 
@@ -694,24 +985,15 @@ def stock(
                 if save_to_file and df is not None:
                     if progress:
                         print("Saving to file: {}.csv".format(file_name_str[1:]))
-                    _save_csv(df, file_name_str[1:] + ".csv")
-                return _apply_ascending(df)
+                    save_csv(df, file_name_str[1:] + ".csv", save_path)
+                return apply_ascending(df, ascending)
             else:
-                df = pd.concat(df_dict, axis=1)
-                multi_assets_columns = df.columns
-                reversed_multi_assets_columns = []
-                for column_index in multi_assets_columns:
-                    reversed_multi_assets_columns.append(column_index[::-1])
-                new_index = pd.MultiIndex.from_tuples(reversed_multi_assets_columns)
-                df.columns = new_index
-
-                if multi_stock_drop:
-                    df.dropna(inplace=True)
+                df = combine_frames(df_dict, dropna=multi_stock_drop)
                 if save_to_file and df is not None:
                     if progress:
                         print("Saving to file: {}.csv".format(file_name_str[1:]))
-                    _save_csv(df, file_name_str[1:] + ".csv")
-                return _apply_ascending(df)
+                    save_csv(df, file_name_str[1:] + ".csv", save_path)
+                return apply_ascending(df, ascending)
 
 
 def stock_RI(
@@ -727,6 +1009,7 @@ def stock_RI(
     dropna=True,
     ascending=True,
     save_path=None,
+    max_workers=None,
     **kwargs
 ):
     """
@@ -779,6 +1062,10 @@ def stock_RI(
     :param multi_stock_drop:if True, when you enter stocks list, it will delete
                                 rows of none data (dropna) in combined historical df.
                             Default value is True.
+    :param max_workers:     number of symbols fetched in parallel when a list of
+                                symbols is given. requests still share the rate
+                                limit from settings.rate_limit_delay.
+                            Default value is None (use settings.max_workers).
 
     :return: pandas dataframe or None
     """
@@ -801,164 +1088,6 @@ def stock_RI(
     tse_format = raw
     multi_stock_drop = dropna
 
-    def _get_stock_RI(
-        stock_name, mstart, mend, mvalues, mtse_format, moutput_type, mdate_format
-    ):
-        web_id = search_stock(search_txt=stock_name)
-        client_type_base_url = settings.url_client_type
-        if web_id[-5:] == "index" or web_id[-8:] == "industry":
-            print("{} is an index, Please enter a valid stock name!".format(stock_name))
-            return None
-        new_start, new_end = date_fix(start=mstart, end=mend)
-        if new_start is not None or new_end is not None:
-            mvalues = 0
-        try:
-            fopen = safe_get(client_type_base_url.format(web_id)).text.split(";")
-            data = {
-                "<DTYYYYMMDD>": [],
-                "<TICKER>": [],
-                "<N_BUY_RETAIL>": [],
-                "<N_BUY_INSTITUTIONAL>": [],
-                "<N_SELL_RETAIL>": [],
-                "<N_SELL_INSTITUTIONAL>": [],
-                "<VOL_BUY_RETAIL>": [],
-                "<VOL_BUY_INSTITUTIONAL>": [],
-                "<VOL_SELL_RETAIL>": [],
-                "<VOL_SELL_INSTITUTIONAL>": [],
-                "<VAL_BUY_RETAIL>": [],
-                "<VAL_BUY_INSTITUTIONAL>": [],
-                "<VAL_SELL_RETAIL>": [],
-                "<VAL_SELL_INSTITUTIONAL>": [],
-                "<PER>": [],
-            }
-
-            for dt in fopen:
-                dts = dt.split(",")
-                date_iso = dts[0][:4] + "-" + dts[0][4:6] + "-" + dts[0][6:]
-                data["<DTYYYYMMDD>"].append(datetime.date.fromisoformat(date_iso))
-                data["<TICKER>"].append(stock_name)
-                data["<N_BUY_RETAIL>"].append(int(dts[1]))
-                data["<N_BUY_INSTITUTIONAL>"].append(int(dts[2]))
-                data["<N_SELL_RETAIL>"].append(int(dts[3]))
-                data["<N_SELL_INSTITUTIONAL>"].append(int(dts[4]))
-                data["<VOL_BUY_RETAIL>"].append(int(dts[5]))
-                data["<VOL_BUY_INSTITUTIONAL>"].append(int(dts[6]))
-                data["<VOL_SELL_RETAIL>"].append(int(dts[7]))
-                data["<VOL_SELL_INSTITUTIONAL>"].append(int(dts[8]))
-                data["<VAL_BUY_RETAIL>"].append(int(dts[9]))
-                data["<VAL_BUY_INSTITUTIONAL>"].append(int(dts[10]))
-                data["<VAL_SELL_RETAIL>"].append(int(dts[11]))
-                data["<VAL_SELL_INSTITUTIONAL>"].append(int(dts[12]))
-                data["<PER>"].append("D")
-
-            df = pd.DataFrame(
-                data, columns=data.keys(), index=pd.DatetimeIndex(data["<DTYYYYMMDD>"])
-            )
-            df.index.names = ["<DTYYYYMMDD>"]
-            df.drop(columns=["<DTYYYYMMDD>"], inplace=True)
-
-            df = df[::-1]
-            if mvalues is not None or mstart is not None or mend is not None:
-                df = filter_by_date_or_values(df, mvalues, new_start, new_end)
-
-            if mtse_format:
-                return df
-            else:
-                df.index.rename("Date_base", inplace=True)
-                df.drop(["<TICKER>", "<PER>"], axis=1, inplace=True)
-                df.rename(
-                    columns={
-                        "<N_BUY_RETAIL>": "N_buy_retail",
-                        "<N_BUY_INSTITUTIONAL>": "N_buy_institutional",
-                        "<N_SELL_RETAIL>": "N_sell_retail",
-                        "<N_SELL_INSTITUTIONAL>": "N_sell_institutional",
-                        "<VOL_BUY_RETAIL>": "Vol_buy_retail",
-                        "<VOL_BUY_INSTITUTIONAL>": "Vol_buy_institutional",
-                        "<VOL_SELL_RETAIL>": "Vol_sell_retail",
-                        "<VOL_SELL_INSTITUTIONAL>": "Vol_sell_institutional",
-                        "<VAL_BUY_RETAIL>": "Val_buy_retail",
-                        "<VAL_BUY_INSTITUTIONAL>": "Val_buy_institutional",
-                        "<VAL_SELL_RETAIL>": "Val_sell_retail",
-                        "<VAL_SELL_INSTITUTIONAL>": "Val_sell_institutional",
-                    },
-                    inplace=True,
-                )
-
-                df["Per_capita_buy_retail"] = round(
-                    df["Val_buy_retail"] / df["N_buy_retail"]
-                )
-                df["Per_capita_sell_retail"] = round(
-                    df["Val_sell_retail"] / df["N_sell_retail"]
-                )
-                df["Per_capita_buy_institutional"] = round(
-                    df["Val_buy_institutional"] / df["N_buy_institutional"]
-                )
-                df["Per_capita_sell_institutional"] = round(
-                    df["Val_sell_institutional"] / df["N_sell_institutional"]
-                )
-                df["Power_retail"] = round(
-                    df["Per_capita_buy_retail"] / df["Per_capita_sell_retail"], 3
-                )
-                df["Power_institutional"] = round(
-                    df["Per_capita_buy_institutional"]
-                    / df["Per_capita_sell_institutional"],
-                    3,
-                )
-
-                df = add_date_columns(df, stock_name)
-                df.fillna(value=0, inplace=True)
-
-                df = apply_date_format(df, mdate_format)
-                if df is None:
-                    return None
-                if moutput_type == "standard":
-                    df = df.loc[
-                        :,
-                        [
-                            "N_buy_retail",
-                            "N_buy_institutional",
-                            "N_sell_retail",
-                            "N_sell_institutional",
-                            "Vol_buy_retail",
-                            "Vol_buy_institutional",
-                            "Vol_sell_retail",
-                            "Vol_sell_institutional",
-                            "Val_buy_retail",
-                            "Val_buy_institutional",
-                            "Val_sell_retail",
-                            "Val_sell_institutional",
-                        ],
-                    ]
-                elif moutput_type == "full":
-                    pass
-                else:
-                    print("output_type should select between 'standard' or 'full'")
-                    return None
-                return df
-        except requests.exceptions.RequestException:
-            print("Connection Error!")
-            return None
-        except Exception as e:
-            print("Stock Not Found or data error: {}".format(e))
-            return None
-
-    import os
-
-    def _save_csv_ri(df, filename):
-        """Save DataFrame to CSV, respecting save_path."""
-        if save_path:
-            os.makedirs(save_path, exist_ok=True)
-            filepath = os.path.join(save_path, filename)
-        else:
-            filepath = filename
-        df.to_csv(filepath, encoding="utf-8-sig")
-
-    def _apply_ascending_ri(df):
-        """Sort by index ascending/descending based on user preference."""
-        if df is not None and not ascending:
-            return df.iloc[::-1]
-        return df
-
     if symbol == "":
         symbol = "شتران"
         if progress:
@@ -978,8 +1107,8 @@ def stock_RI(
         if save_to_file and df is not None:
             if progress:
                 print("Saving to file: {}-حقیقی-حقوقی.csv".format(symbol))
-            _save_csv_ri(df, symbol + "-حقیقی-حقوقی.csv")
-        return _apply_ascending_ri(df)
+            save_csv(df, symbol + "-حقیقی-حقوقی.csv", save_path)
+        return apply_ascending(df, ascending)
     else:
         if isinstance(symbol, str):
             if progress:
@@ -1001,13 +1130,14 @@ def stock_RI(
             if save_to_file and df is not None:
                 if progress:
                     print("Saving to file: {}-حقیقی-حقوقی.csv".format(symbol))
-                _save_csv_ri(df, symbol + "-حقیقی-حقوقی.csv")
-            return _apply_ascending_ri(df)
+                save_csv(df, symbol + "-حقیقی-حقوقی.csv", save_path)
+            return apply_ascending(df, ascending)
         elif isinstance(symbol, list):
-            n = 1
             df_dict = {}
             file_name_str = ""
-            for stk in symbol:
+
+            def _fetch_one_ri(item):
+                n, stk = item
                 if progress:
                     print(
                         "{}/{}: Getting historical retail/institutional of {}".format(
@@ -1024,12 +1154,19 @@ def stock_RI(
                     moutput_type=output_type,
                     mdate_format=date_format,
                 )
+                return stk, df
+
+            # Fetch in parallel (if requested), then assemble in input order
+            workers = settings.max_workers if max_workers is None else max_workers
+            fetched = concurrent_map(
+                _fetch_one_ri, enumerate(symbol, start=1), max_workers=workers
+            )
+            for stk, df in fetched:
                 if df is not None:
                     file_name_str += "-" + stk
                     df_dict[stk] = df
                 else:
                     print("{} not Found!".format(stk))
-                n += 1
             if progress:
                 print("{}/{} Completed!".format(len(symbol), len(symbol)))
 
@@ -1045,19 +1182,10 @@ def stock_RI(
                                 file_name_str[1:]
                             )
                         )
-                    _save_csv_ri(df, file_name_str[1:] + "-حقیقی-حقوقی.csv")
-                return _apply_ascending_ri(df)
+                    save_csv(df, file_name_str[1:] + "-حقیقی-حقوقی.csv", save_path)
+                return apply_ascending(df, ascending)
             else:
-                df = pd.concat(df_dict, axis=1)
-                multi_assets_columns = df.columns
-                reversed_multi_assets_columns = []
-                for column_index in multi_assets_columns:
-                    reversed_multi_assets_columns.append(column_index[::-1])
-                new_index = pd.MultiIndex.from_tuples(reversed_multi_assets_columns)
-                df.columns = new_index
-
-                if multi_stock_drop:
-                    df.dropna(inplace=True)
+                df = combine_frames(df_dict, dropna=multi_stock_drop)
                 if save_to_file and df is not None:
                     if progress:
                         print(
@@ -1065,8 +1193,8 @@ def stock_RI(
                                 file_name_str[1:]
                             )
                         )
-                    _save_csv_ri(df, file_name_str[1:] + "-حقیقی-حقوقی.csv")
-                return _apply_ascending_ri(df)
+                    save_csv(df, file_name_str[1:] + "-حقیقی-حقوقی.csv", save_path)
+                return apply_ascending(df, ascending)
 
 
 def stock_RL(
@@ -1082,6 +1210,7 @@ def stock_RL(
     dropna=True,
     ascending=True,
     save_path=None,
+    max_workers=None,
     **kwargs
 ):
     # Backward compat
@@ -1106,6 +1235,7 @@ def stock_RL(
         dropna=dropna,
         ascending=ascending,
         save_path=save_path,
+        max_workers=max_workers,
     )
 
 
@@ -5,6 +5,7 @@ import pandas as pd
 from persiantools import characters
 from algotik_tse.settings import settings
 from algotik_tse.http_client import safe_get
+from algotik_tse.core import symbol_index
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
@@ -331,6 +332,8 @@ def stocklist(
             ],
         ]
 
+        symbol_index.ingest_stocklist(df_final)
+
         if output == "dataframe":
             if progress:
                 print(
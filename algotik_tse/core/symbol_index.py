@@ -0,0 +1,192 @@
+"""Local symbol → InsCode index.
+
+Resolving a ticker with ``GetInstrumentSearch`` costs one HTTP request per
+call. This module keeps a persisted dictionary built in bulk from
+``market_watch()`` (one request for every listed instrument) so that
+:func:`algotik_tse.core.search.search_stock` can answer from memory.
+
+- Lookups are O(1) dict hits; a miss returns None and the caller falls
+  back to the network search.
+- The index is stored as JSON at ``settings.symbol_index_path`` (default
+  ``~/.algotik_tse/symbol_index.json``) and rebuilt when it is older than
+  ``settings.symbol_index_max_age`` seconds.
+- Every ``market_watch()`` / ``stocklist()`` call feeds its rows into the
+  index, so it stays fresh for free in sessions that already use them.
+
+The index is opt-in (``settings.symbol_index = True``): building it
+downloads the whole market watch and writes the index file.
+"""
+
+import json
+import os
+import threading
+import time
+
+from persiantools import characters
+
+from algotik_tse.settings import settings
+from algotik_tse.core.helper import storage_path
+
+# Wait this long before retrying a failed build, so an offline session
+# does not attempt a full market download on every lookup.
+_BUILD_RETRY_DELAY = 300
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()  # one market download at a time
+_symbols = None  # {normalized symbol: InsCode}
+_built_at = 0.0
+_loaded_path = None
+_last_build_attempt = 0.0
+
+
+def _normalize(symbol):
+    return characters.ar_to_fa(str(symbol)).replace("\u200c", "").strip()
+
+
+def _index_path():
+    if settings.symbol_index_path:
+        return settings.symbol_index_path
+    return storage_path("symbol_index.json")
+
+
+# ── persistence ───────────────────────────────────────────────
+
+
+def _load():
+    """Load the persisted index into memory (call with ``_lock`` held)."""
+    global _symbols, _built_at, _loaded_path
+    path = _index_path()
+    if _symbols is not None and _loaded_path == path:
+        return
+    _symbols, _built_at, _loaded_path = {}, 0.0, path
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _symbols = dict(data["symbols"])
+        _built_at = float(data["built_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+
+def _save():
+    """Write the in-memory index to disk atomically (call with ``_lock`` held)."""
+    path = _index_path()
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"built_at": _built_at, "symbols": _symbols}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# ── building ──────────────────────────────────────────────────
+
+
+def ingest(pairs, complete=False):
+    """Add ``(symbol, ins_code)`` pairs to the index.
+
+    Parameters
+    ----------
+    pairs : iterable of tuple
+        ``(symbol, ins_code)``. A symbol that maps to more than one
+        InsCode is ambiguous and left out of the index, so it keeps
+        resolving through the online search.
+    complete : bool
+        True when *pairs* lists the whole market (``market_watch``): the
+        index is replaced and its age reset. False merges the entries
+        into the existing index.
+    """
+    global _symbols, _built_at
+    fresh = {}
+    ambiguous = set()
+    for symbol, ins_code in pairs:
+        key = _normalize(symbol)
+        if not key or not ins_code:
+            continue
+        if fresh.setdefault(key, str(ins_code)) != str(ins_code):
+            ambiguous.add(key)
+    for key in ambiguous:
+        del fresh[key]
+    if not fresh and not ambiguous:
+        return
+    with _lock:
+        _load()
+        if complete:
+            _symbols = fresh
+            _built_at = time.time()
+        else:
+            for key in ambiguous:
+                _symbols.pop(key, None)
+            _symbols.update(fresh)
+        _save()
+
+
+def ingest_market_watch(stocks):
+    """Feed a ``market_watch()['stocks']`` DataFrame into the index."""
+    if not settings.symbol_index or stocks is None or len(stocks) == 0:
+        return
+    ingest(zip(stocks["Symbol"], stocks["InsCode"]), complete=True)
+
+
+def ingest_stocklist(df):
+    """Feed a ``stocklist()`` DataFrame (indexed by symbol) into the index."""
+    if not settings.symbol_index or df is None or len(df) == 0:
+        return
+    ingest(zip(df.index, df["instrument_id"]))
+
+
+def refresh_symbol_index():
+    """Rebuild the index from a fresh ``market_watch()`` download.
+
+    Returns
+    -------
+    int or None
+        Number of indexed symbols, or None if the download failed.
+    """
+    global _last_build_attempt
+    from algotik_tse.core.market_data import market_watch
+
+    _last_build_attempt = time.time()
+    try:
+        stocks = market_watch()["stocks"]
+    except Exception:
+        return None
+    if not settings.symbol_index:  # otherwise market_watch() already ingested it
+        ingest(zip(stocks["Symbol"], stocks["InsCode"]), complete=True)
+    with _lock:
+        return len(_symbols)
+
+
+# ── lookup ────────────────────────────────────────────────────
+
+
+def lookup(symbol, build=True):
+    """Return the InsCode of *symbol* from the local index, or None.
+
+    Parameters
+    ----------
+    symbol : str
+        Ticker in Persian (Arabic letters are normalized).
+    build : bool
+        Rebuild a missing or stale index before looking up. With False the
+        index is only read from memory/disk and never downloaded.
+    """
+    if build and _is_stale():
+        with _build_lock:
+            # Another thread may have rebuilt the index while we waited
+            if (
+                _is_stale()
+                and time.time() - _last_build_attempt > _BUILD_RETRY_DELAY
+            ):
+                refresh_symbol_index()
+    with _lock:
+        _load()
+        return _symbols.get(_normalize(symbol))
+
+
+def _is_stale():
+    with _lock:
+        _load()
+        return time.time() - _built_at > settings.symbol_index_max_age
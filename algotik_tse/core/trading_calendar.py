@@ -0,0 +1,246 @@
+"""Trading calendar derived from the overall index history.
+
+The overall index (شاخص کل, InsCode ``32097828799138957``) has a row for
+every session the market was open, so its history is the list of real
+session dates, public holidays and market closures included. The dates
+are downloaded once, kept in memory and refreshed after the next market
+open/close boundary, like the ``"session"`` cache TTL.
+
+The calendar is opt-in: with ``settings.trading_calendar = True``,
+:func:`is_session`, :func:`sessions_between` and ``get_intraday()`` use
+it and the dates are also kept in
+``<settings.data_dir>/trading_calendar.json``. Otherwise they follow the
+weekday rule and nothing is written to disk;
+``get_market_history()``, which cannot work without real session dates,
+then downloads them into memory only.
+
+Days after the last known session (today before the index row appears,
+or future dates) and every day when the history cannot be loaded fall
+back to the weekday rule: Saturday to Wednesday are sessions.
+"""
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from algotik_tse.settings import settings
+from algotik_tse.exceptions import ConnectionError, DataParsingError
+from algotik_tse.http_client import safe_get
+from algotik_tse.http_cache import next_session_boundary
+from algotik_tse.core.helper import date_fix, storage_path
+
+OVERALL_INDEX_CODE = "32097828799138957"
+
+# Saturday .. Wednesday in numpy's busday weekmask (Monday first)
+_WEEKMASK = "1110011"
+
+_lock = threading.Lock()
+_sessions = None  # ascending datetime64[D] array
+_expires = 0.0  # time.time() after which the sessions are reloaded
+
+
+def _path():
+    return storage_path("trading_calendar.json")
+
+
+def _parse_index_history(text):
+    """Session dates of an IndexFinancial response, ascending."""
+    dates = [row.split(",", 1)[0] for row in text.strip().split(";") if row]
+    parsed = pd.to_datetime(pd.Series(dates, dtype=object), format="%Y%m%d", errors="coerce")
+    return np.unique(parsed.dropna().to_numpy().astype("datetime64[D]"))
+
+
+def _download():
+    response = safe_get(settings.url_index_history.format(OVERALL_INDEX_CODE))
+    if response.status_code != 200:
+        raise ConnectionError(
+            "Failed to fetch the index history (HTTP {})".format(response.status_code)
+        )
+    sessions = _parse_index_history(response.text)
+    if sessions.size == 0:
+        raise DataParsingError("The index history has no sessions")
+    return sessions
+
+
+def _load_file():
+    """``(sessions, updated_at)`` from the calendar file, or None."""
+    path = _path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            dates = json.load(f)["sessions"]
+        updated_at = os.path.getmtime(path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    sessions = np.array(
+        [np.datetime64("{}-{}-{}".format(d[:4], d[4:6], d[6:8]), "D") for d in dates]
+    )
+    return sessions, updated_at
+
+
+def _save_file(sessions):
+    path = _path()
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        dates = [d.strftime("%Y%m%d") for d in sessions.astype(object)]
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"sessions": dates}, f)
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def trading_sessions(refresh=False, required=False):
+    """All known session dates, oldest first.
+
+    Parameters
+    ----------
+    refresh : bool, default False
+        Download the index history even if the stored calendar is fresh.
+    required : bool, default False
+        Raise when the calendar cannot be loaded instead of returning
+        None.
+
+    Returns
+    -------
+    pd.DatetimeIndex or None
+        Session dates, or None if the index history is unavailable and
+        nothing is stored.
+
+    Raises
+    ------
+    requests.exceptions.RequestException, ConnectionError, DataParsingError
+        With ``required=True``, when the download fails and there is no
+        stored calendar (or always, with ``refresh=True``).
+    """
+    sessions = _get_sessions(refresh, required)
+    if sessions is None:
+        return None
+    return pd.DatetimeIndex(sessions.astype("datetime64[ns]"), name="Date")
+
+
+def _get_sessions(refresh=False, required=False):
+    global _sessions, _expires
+    now = time.time()
+    # After a failed download, retry at the next boundary unless required
+    if not refresh and now < _expires and (_sessions is not None or not required):
+        return _sessions
+    with _lock:
+        if not refresh and now < _expires and (_sessions is not None or not required):
+            return _sessions
+        # The file is only used when the user opted in to the calendar
+        persist = settings.trading_calendar
+        stored = None if refresh or not persist else _load_file()
+        if stored is not None and next_session_boundary(stored[1]) > now:
+            _sessions, _expires = stored[0], next_session_boundary(stored[1])
+            return _sessions
+        try:
+            sessions = _download()
+        except Exception:
+            if required and (refresh or (stored is None and _sessions is None)):
+                raise
+            # Keep serving what we have until the next boundary
+            if stored is not None and _sessions is None:
+                _sessions = stored[0]
+            _expires = next_session_boundary(now)
+            return _sessions
+        if persist:
+            _save_file(sessions)
+        _sessions, _expires = sessions, next_session_boundary(now)
+        return _sessions
+
+
+def _to_day(date):
+    """``datetime64[D]`` of a date, Timestamp or Jalali/Gregorian string."""
+    if isinstance(date, str):
+        date = date_fix(start=date)[0]
+    return np.datetime64(pd.Timestamp(date).date(), "D")
+
+
+def _weekday_sessions(start, end):
+    """Saturday–Wednesday days in ``[start, end]`` (datetime64[D])."""
+    if end < start:
+        return np.array([], dtype="datetime64[D]")
+    days = np.arange(start, end + 1, dtype="datetime64[D]")
+    return days[np.is_busday(days, weekmask=_WEEKMASK)]
+
+
+def is_session(date):
+    """True if the market had (or, by the weekday rule, will have) a session.
+
+    Parameters
+    ----------
+    date : str, datetime.date or pd.Timestamp
+        Jalali (``'1404-11-06'``) or Gregorian (``'2026-01-26'``) date.
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> att.settings.trading_calendar = True
+    >>> att.is_session('1404-01-02')    # Nowruz
+    False
+    """
+    day = _to_day(date)
+    sessions = _get_sessions() if settings.trading_calendar else None
+    if sessions is None or day > sessions[-1]:
+        return bool(np.is_busday(day, weekmask=_WEEKMASK))
+    i = np.searchsorted(sessions, day)
+    return bool(i < len(sessions) and sessions[i] == day)
+
+
+def sessions_between(start, end):
+    """Session dates in ``[start, end]`` (inclusive), oldest first.
+
+    Parameters
+    ----------
+    start, end : str, datetime.date or pd.Timestamp
+        Jalali or Gregorian dates.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        Known sessions from the index history; days after the last known
+        session follow the weekday rule.
+
+    Examples
+    --------
+    >>> import algotik_tse as att
+    >>> att.sessions_between('1404-11-01', '1404-11-30')
+    """
+    start, end = _to_day(start), _to_day(end)
+    sessions = _get_sessions() if settings.trading_calendar else None
+    if sessions is None:
+        days = _weekday_sessions(start, end)
+    else:
+        last = sessions[-1]
+        lo = np.searchsorted(sessions, start, side="left")
+        hi = np.searchsorted(sessions, end, side="right")
+        known = sessions[lo:hi]
+        days = np.concatenate(
+            [known, _weekday_sessions(max(start, last + 1), end)]
+        )
+    return pd.DatetimeIndex(days.astype("datetime64[ns]"), name="Date")
+
+
+def refresh_trading_calendar():
+    """Download the session dates now.
+
+    They are stored in ``<settings.data_dir>/trading_calendar.json`` when
+    ``settings.trading_calendar`` is True.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        All known session dates.
+
+    Raises
+    ------
+    requests.exceptions.RequestException, ConnectionError, DataParsingError
+        When the download fails; the stored calendar is kept.
+    """
+    return trading_sessions(refresh=True, required=True)
@@ -0,0 +1,229 @@
+"""Opt-in on-disk cache for HTTP response bodies.
+
+Used by :func:`algotik_tse.http_client.safe_get` and the asyncio client
+when ``settings.cache_enabled`` is True. Entries are keyed by URL and
+stored one file per URL under ``settings.cache_dir`` (default
+``<settings.data_dir>/cache``). The total size is
+capped at ``settings.cache_max_size_mb``, and the least recently used
+entries are evicted first.
+
+How long a response stays fresh depends on its endpoint family, set in
+``settings.cache_ttls``. That setting maps a URL substring to a TTL:
+
+- ``int`` / ``float``: seconds.
+- ``"session"``: until the next trading-session boundary (market open or
+  post-close on Saturday–Wednesday, Tehran time), when daily data changes.
+- ``"closed_day"``: forever if the 8-digit date in the URL is before
+  today, otherwise ``"session"``. Used for per-day endpoints.
+- ``"forever"``: never expires (only size-based eviction).
+
+URLs that match no family are never cached, so live endpoints such as
+MarketWatch or today's trades always reach the server.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+# Tehran is UTC+03:30 (no daylight saving since 2022)
+_TEHRAN_TZ = datetime.timezone(datetime.timedelta(hours=3, minutes=30))
+_TRADING_WEEKDAYS = (5, 6, 0, 1, 2)  # Saturday .. Wednesday
+_SESSION_BOUNDARIES = (datetime.time(9, 0), datetime.time(13, 30))
+_URL_DATE_RE = re.compile(r"(?<!\d)(\d{8})(?!\d)")
+
+_lock = threading.Lock()
+_total_size = None  # bytes on disk; scanned lazily on first write
+_sized_dir = None  # directory _total_size refers to
+
+
+# ── TTL resolution ────────────────────────────────────────────
+
+
+def _cache_dir():
+    from algotik_tse.settings import settings
+
+    if settings.cache_dir:
+        return settings.cache_dir
+    base = settings.data_dir or os.path.join(os.path.expanduser("~"), ".algotik_tse")
+    return os.path.join(base, "cache")
+
+
+def _ttl_for(url):
+    """Return the TTL rule of the first endpoint family matching *url*."""
+    from algotik_tse.settings import settings
+
+    for pattern, ttl in settings.cache_ttls.items():
+        if pattern in url:
+            return ttl
+    return None
+
+
+def next_session_boundary(now=None):
+    """Return the next market open/close instant (epoch seconds) after *now*."""
+    now = now if now is not None else time.time()
+    local = datetime.datetime.fromtimestamp(now, _TEHRAN_TZ)
+    day = local.date()
+    for _ in range(8):
+        if day.weekday() in _TRADING_WEEKDAYS:
+            for boundary in _SESSION_BOUNDARIES:
+                moment = datetime.datetime.combine(day, boundary, _TEHRAN_TZ)
+                if moment > local:
+                    return moment.timestamp()
+        day += datetime.timedelta(days=1)
+    return now  # unreachable: a trading day always occurs within a week
+
+
+def is_closed_day(day, now=None):
+    """True if the ``'YYYYMMDD'`` date *day* is before today in Tehran."""
+    now = now if now is not None else time.time()
+    return day < datetime.datetime.fromtimestamp(now, _TEHRAN_TZ).strftime("%Y%m%d")
+
+
+def _expires_at(url, ttl, now):
+    """Absolute expiry (epoch seconds) for *url*, None meaning never."""
+    if ttl == "forever":
+        return None
+    if ttl == "closed_day":
+        match = _URL_DATE_RE.search(url)
+        if match and is_closed_day(match.group(1), now):
+            return None
+        ttl = "session"
+    if ttl == "session":
+        return next_session_boundary(now)
+    return now + float(ttl)
+
+
+# ── storage ───────────────────────────────────────────────────
+
+
+def _path(url):
+    return os.path.join(_cache_dir(), hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+
+def _scan_size(directory):
+    total = 0
+    if os.path.isdir(directory):
+        for entry in os.scandir(directory):
+            if entry.is_file():
+                total += entry.stat().st_size
+    return total
+
+
+def get(url):
+    """Return ``(status_code, headers, content)`` for a fresh entry, else None."""
+    path = _path(url)
+    try:
+        with open(path, "rb") as f:
+            meta = json.loads(f.readline())
+            content = f.read()
+    except (OSError, ValueError):
+        return None
+    if meta.get("url") != url:
+        return None
+    expires = meta.get("expires")
+    if expires is not None and expires <= time.time():
+        return None
+    try:
+        os.utime(path)  # mark as recently used for LRU eviction
+    except OSError:
+        pass
+    return meta["status"], meta["headers"], content
+
+
+def put(url, status_code, headers, content):
+    """Store a response body if *url* belongs to a cached endpoint family.
+
+    Only ``200`` responses are stored. Returns True when the entry was
+    written.
+    """
+    global _total_size, _sized_dir
+    from algotik_tse.settings import settings
+
+    ttl = _ttl_for(url)
+    if ttl is None or status_code != 200:
+        return False
+
+    meta = {
+        "url": url,
+        "status": status_code,
+        "headers": {
+            k: v for k, v in headers.items() if k.lower() in ("content-type",)
+        },
+        "expires": _expires_at(url, ttl, time.time()),
+    }
+    directory = _cache_dir()
+    path = _path(url)
+    tmp = "{}.{}.{}.tmp".format(path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(directory, exist_ok=True)
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8") + b"\n")
+            f.write(content)
+        new_size = os.path.getsize(tmp)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+    with _lock:
+        if _total_size is None or _sized_dir != directory:
+            _total_size = _scan_size(directory)
+            _sized_dir = directory
+        else:
+            _total_size += new_size - old_size
+        if _total_size > settings.cache_max_size_mb * 1024 * 1024:
+            _evict(directory, keep=path)
+    return True
+
+
+def _evict(directory, keep=None):
+    """Delete least recently used entries until the cache fits its cap.
+
+    Must be called with ``_lock`` held.
+    """
+    global _total_size
+    from algotik_tse.settings import settings
+
+    limit = settings.cache_max_size_mb * 1024 * 1024
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= limit:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+    _total_size = total
+
+
+def clear_cache():
+    """Delete every cached HTTP response."""
+    global _total_size, _sized_dir
+    directory = _cache_dir()
+    with _lock:
+        if os.path.isdir(directory):
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+        _total_size = 0
+        _sized_dir = directory
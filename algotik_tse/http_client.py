@@ -3,26 +3,32 @@
 This module provides a `safe_get` function that wraps `requests.get` with:
 - Automatic retry on transient failures (429, 500, 502, 503, 504)
 - Configurable timeout (from settings.timeout)
-- Rate limiting between requests (from settings.rate_limit_delay)
+- Per-host token-bucket rate limiting (settings.rate_limits,
+  settings.rate_limit_delay, settings.rate_limit_burst)
 - Configurable SSL verification (from settings.ssl_verify)
-- Connection pooling via requests.Session
+- Connection pooling via requests.Session (thread-safe, shared by workers)
+- Optional on-disk response cache (settings.cache_enabled, see http_cache)
 
 All defaults are read from `algotik_tse.settings.settings` at call time,
 so changes to settings take effect immediately.
 """
 
 import time
+import threading
 import requests
 from requests.adapters import HTTPAdapter
 import urllib3
 
+from algotik_tse import http_cache
+from algotik_tse.rate_limiter import limiter
+
 try:
     from urllib3.util.retry import Retry
 except ImportError:
     Retry = None
 
 _session = None
-_last_request_time = 0
+_session_lock = threading.Lock()
 
 
 def _get_session():
@@ -33,8 +39,18 @@ def _get_session():
 
     from algotik_tse.settings import settings
 
-    _session = requests.Session()
-    _session.headers.update(settings.headers)
+    with _session_lock:
+        if _session is not None:
+            return _session
+        _session = _build_session(settings)
+    return _session
+
+
+def _build_session(settings):
+    """Build a new Session with retry and connection-pool settings."""
+    session = requests.Session()
+    session.headers.update(settings.headers)
+    pool_size = max(10, settings.max_workers or 1)
 
     if Retry is not None:
         try:
@@ -44,13 +60,17 @@ def _get_session():
                 status_forcelist=[429, 500, 502, 503, 504],
                 allowed_methods=["GET"],
             )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            _session.mount("http://", adapter)
-            _session.mount("https://", adapter)
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
         except Exception:
             pass  # Fallback to default session without retry
 
-    return _session
+    return session
 
 
 def safe_get(url, **kwargs):
@@ -77,14 +97,19 @@ def safe_get(url, **kwargs):
     requests.exceptions.RequestException
         After all retries are exhausted.
     """
-    global _last_request_time
     from algotik_tse.settings import settings
 
-    # Rate limiting: ensure minimum delay between consecutive requests
-    if settings.rate_limit_delay > 0:
-        elapsed = time.time() - _last_request_time
-        if elapsed < settings.rate_limit_delay:
-            time.sleep(settings.rate_limit_delay - elapsed)
+    use_cache = settings.cache_enabled and "params" not in kwargs
+    if use_cache:
+        cached = http_cache.get(url)
+        if cached is not None:
+            return _cached_response(url, *cached)
+
+    # Rate limiting: one token bucket per host, shared by all threads
+    # and the asyncio client.
+    wait = limiter.reserve(url)
+    if wait > 0:
+        time.sleep(wait)
 
     # Apply defaults from settings (caller can override any of these)
     kwargs.setdefault("headers", settings.headers)
@@ -97,7 +122,20 @@ def safe_get(url, **kwargs):
 
     session = _get_session()
     response = session.get(url, **kwargs)
-    _last_request_time = time.time()
+    if use_cache:
+        http_cache.put(url, response.status_code, response.headers, response.content)
+    return response
+
+
+def _cached_response(url, status_code, headers, content):
+    """Build a ``requests.Response`` from a cache entry."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = content
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
     return response
 
 
@@ -105,14 +143,16 @@ def reset_session():
     """Reset the HTTP session.
 
     Call this after changing retry-related settings (``max_retries``,
-    ``retry_backoff_factor``) to rebuild the session with new values.
-    Changes to ``ssl_verify``, ``timeout``, and ``rate_limit_delay``
+    ``retry_backoff_factor``) or ``max_workers`` to rebuild the session
+    with new values.
+    Changes to ``ssl_verify``, ``timeout`` and the rate-limit settings
     take effect immediately without needing a reset.
     """
     global _session
-    if _session is not None:
-        try:
-            _session.close()
-        except Exception:
-            pass
-    _session = None
+    with _session_lock:
+        if _session is not None:
+            try:
+                _session.close()
+            except Exception:
+                pass
+        _session = None
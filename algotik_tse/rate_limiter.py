@@ -0,0 +1,117 @@
+"""Per-host token-bucket rate limiting.
+
+Every host (``cdn.tsetmc.com``, ``old.tsetmc.com``, ``api.tgju.org``, ...)
+gets its own bucket, so throttling one service does not slow down requests
+to another. Buckets hand out *reservations*: a caller takes a token and is
+told how long to wait for it, then sleeps outside the lock with
+``time.sleep`` (threads) or ``asyncio.sleep`` (the asyncio API).
+
+The pace of each host is read from settings at call time:
+
+- ``settings.rate_limits[host] = (rate, burst)`` — requests per second and
+  bucket size for that host. A rate of ``None`` or ``0`` disables limiting.
+- Hosts without an entry use ``1 / settings.rate_limit_delay`` requests per
+  second with a burst of ``settings.rate_limit_burst``.
+"""
+
+import time
+import threading
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second.
+    burst : int
+        Maximum number of tokens the bucket holds (requests allowed
+        back-to-back after an idle period).
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def configure(self, rate, burst):
+        """Change rate/burst in place, keeping the current fill level."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self.burst = max(1, int(burst))
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self):
+        """Take one token and return the seconds to wait before using it.
+
+        The token count may go negative: each concurrent caller is queued
+        behind the previous one instead of all waking up at once.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """A registry of :class:`TokenBucket` objects keyed by URL host."""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _limits_for(host):
+        """Return ``(rate, burst)`` for *host*, or None when unlimited."""
+        from algotik_tse.settings import settings
+
+        if host in settings.rate_limits:
+            limit = settings.rate_limits[host]
+            if not limit or not limit[0]:
+                return None
+            rate, burst = limit
+        else:
+            if settings.rate_limit_delay <= 0:
+                return None
+            rate, burst = 1.0 / settings.rate_limit_delay, settings.rate_limit_burst
+        return float(rate), max(1, int(burst))
+
+    def _bucket(self, host, rate, burst):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+                return bucket
+        if bucket.rate != rate or bucket.burst != burst:
+            bucket.configure(rate, burst)
+        return bucket
+
+    def reserve(self, url):
+        """Reserve a request slot for *url*'s host; return seconds to wait."""
+        host = urlsplit(url).hostname or ""
+        limits = self._limits_for(host)
+        if limits is None:
+            return 0.0
+        return self._bucket(host, *limits).reserve()
+
+    def reset(self):
+        """Forget all buckets (every host starts with a full bucket)."""
+        with self._lock:
+            self._buckets.clear()
+
+
+# Shared by safe_get and the asyncio client
+limiter = HostRateLimiter()
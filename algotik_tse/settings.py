@@ -83,6 +83,9 @@ class Settings:
         self.url_price_history = (
             "http://old.tsetmc.com/tsev2/data/Export-txt.aspx?t=i&a=1&b=0&i={}"
         )
+        self.url_price_history_daily = (
+            "https://cdn.tsetmc.com/api/ClosingPrice/GetClosingPriceDailyList/{}/{}"
+        )
         self.url_index_history = (
             "http://old.tsetmc.com/tsev2/chart/data/IndexFinancial.aspx?i={}&t=ph"
         )
@@ -223,6 +226,58 @@ class Settings:
         self.max_retries = 3  # Number of retries on transient HTTP errors
         self.retry_backoff_factor = 0.3  # Exponential backoff factor between retries
         self.rate_limit_delay = 0.3  # Minimum seconds between consecutive requests
+        self.rate_limit_burst = 1  # Requests allowed back-to-back per host after idling
+        # Per-host overrides: {host: (requests_per_second, burst)}; rate None/0 = unlimited
+        self.rate_limits = {}
+        self.max_workers = 1  # Parallel workers for multi-symbol calls (1 = serial)
+        self.market_watch_max_age = 10  # Seconds list_options/etfs/bonds reuse a snapshot
+        self.option_info_workers = 4  # Parallel contract requests of get_options_chain(fetch_oi=True)
+        self.option_info_max_age = 0  # Seconds option details (incl. open interest) are reused; 0 = always fetch
+        self.fund_list_workers = 4  # Parallel fund category requests of list_funds()
+        self.intraday_workers = 4  # Parallel day requests of historical stock_intraday()
+        self.intraday_day_retries = 2  # Extra attempts for a historical intraday day that failed
+
+        # ── Local Storage Settings ────────────────────────────────────
+        self.data_dir = None  # Base directory for local data (None = ~/.algotik_tse)
+        self.symbol_index = False  # Resolve symbols from a local symbol→InsCode index
+        self.symbol_index_path = None  # None = <data_dir>/symbol_index.json
+        self.symbol_index_max_age = 86400  # Rebuild the symbol index after (seconds)
+        self.history_store = False  # Keep daily history in local Parquet files
+        self.history_store_max_gap = 180  # Longer gaps (days) re-download in full
+        self.intraday_store = False  # Keep closed intraday days in local Parquet files
+        self.fund_store = False  # Record every list_funds() snapshot in local Parquet files
+        self.fund_store_max_segments = 32  # Merge fund store files of a tier beyond this many
+        # Skip market holidays using the overall index sessions (downloaded and
+        # kept in <data_dir>/trading_calendar.json). get_market_history() always
+        # needs the session dates; with False it downloads them into memory only.
+        self.trading_calendar = False
+
+        # ── HTTP Cache Settings (opt-in) ──────────────────────────────
+        self.cache_enabled = False  # Cache response bodies on disk
+        self.cache_dir = None  # Cache directory (None = <data_dir>/cache)
+        self.cache_max_size_mb = 512  # Size cap; least recently used entries go first
+        # Endpoint family (URL substring) -> TTL: seconds, "session" (until the
+        # next market open/close), "closed_day" (forever for past dates) or
+        # "forever". URLs matching no family are never cached.
+        self.cache_ttls = {
+            "GetInstrumentSearch": 3 * 86400,
+            "GetInstrumentInfo": 3 * 86400,
+            "Partree=15131M": 3 * 86400,  # old instrument detail page
+            "ParTree=151114": "session",  # full stock list
+            "GetInstrumentStatistic": "session",
+            "GetInstrumentShareChange": "session",
+            "GetInstrumentShareHolderLast": "session",
+            "api/Shareholder/": "closed_day",
+            "Export-txt": "session",
+            "IndexFinancial": "session",
+            "GetIndexB2History": "session",
+            "clienttype.aspx": "session",
+            "GetClosingPriceHistory": "closed_day",
+            "summary-table-data": 3600,  # TGJU currency/coin history
+        }
+
+        # ── Option Analytics Settings ─────────────────────────────────
+        self.risk_free_rate = 0.30  # Annual rate (continuous) used by option_greeks()
 
 
 settings = Settings()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark the vectorized price-adjustment engine.
+
+Compares :func:`algotik_tse.core.adjustment.adjust_history` with the
+row-wise pandas implementation it replaced, on synthetic 20-year daily
+histories with periodic capital increases, and checks that both produce
+identical columns.
+
+Usage:
+    python benchmarks/bench_adjustment.py [--years 20] [--symbols 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from algotik_tse.core.adjustment import adjust_history  # noqa: E402
+
+SESSIONS_PER_YEAR = 243
+
+
+def make_history(n, seed):
+    """Synthetic oldest-to-newest history with splits and placeholder prices."""
+    rng = np.random.default_rng(seed)
+    final = np.empty(n)
+    reference = np.empty(n)
+    prev = 1000.0
+    for i in range(n):
+        c = round(prev * (1 + rng.uniform(-0.05, 0.05)))
+        reference[i] = prev
+        if i % 250 == 125:  # capital increase: reference drops by half
+            c = round(c / 2)
+            reference[i] = round(prev / 2)
+        if i % 400 == 7:  # placeholder reference price
+            reference[i] = rng.choice([0, 1000])
+        final[i] = c
+        prev = c
+    return pd.DataFrame(
+        {
+            "Open": final * 1.01,
+            "High": final * 1.05,
+            "Low": final * 0.95,
+            "Close": final * 1.001,
+            "Final": final.astype("int64"),
+            "Volume": rng.integers(1_000, 10_000_000, n),
+            "Yesterday-Final": reference.astype("int64"),
+        },
+        index=pd.date_range("2005-01-01", periods=n, freq="D"),
+    )
+
+
+def legacy_adjust(df):
+    """The previous row-wise implementation from ``core/stock.py``."""
+    df["Final+1"] = df["Final"].shift(1)
+    df["pos"] = df.apply(
+        lambda x: (
+            x["Yesterday-Final"]
+            if ((x["Yesterday-Final"] != 0) and (x["Yesterday-Final"] != 1000))
+            else (x["Yesterday-Final"] if (pd.isnull(x["Final+1"])) else x["Final+1"])
+        ),
+        axis=1,
+    )
+    df["Yesterday-Final"] = df["pos"]
+    df.drop(columns=["Final+1", "pos"], inplace=True)
+    df["coef"] = (df["Yesterday-Final"].shift(-1) / df["Final"]).fillna(1.0)
+    df["Adj coef"] = df.iloc[::-1]["coef"].cumprod().iloc[::-1]
+    df["Adj Vol coef"] = 1 / df["Adj coef"]
+    for column in ("Close", "Open", "High", "Low", "Final"):
+        df["Adj " + column] = (df[column] * df["Adj coef"]).apply(lambda x: int(x))
+    df["Adj Volume"] = (df["Volume"] * df["Adj Vol coef"]).apply(lambda x: int(x))
+    df.drop(columns=["coef", "Adj coef", "Adj Vol coef"], inplace=True)
+    return df
+
+
+def run(func, frames):
+    start = time.perf_counter()
+    results = [func(df.copy()) for df in frames]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--symbols", type=int, default=50)
+    args = parser.parse_args()
+
+    n = args.years * SESSIONS_PER_YEAR
+    frames = [make_history(n, seed) for seed in range(args.symbols)]
+
+    legacy_time, legacy = run(legacy_adjust, frames)
+    fast_time, fast = run(adjust_history, frames)
+
+    for old, new in zip(legacy, fast):
+        pd.testing.assert_frame_equal(old, new)
+
+    print("{} histories x {} sessions".format(args.symbols, n))
+    print("  row-wise apply : {:8.3f} s".format(legacy_time))
+    print("  vectorized     : {:8.3f} s".format(fast_time))
+    print("  speedup        : {:8.1f}x (outputs identical)".format(legacy_time / fast_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark the bulk MarketWatchInit instrument-row parser.
+
+Compares :func:`algotik_tse.core.market_data._parse_stock_rows` with the
+per-row dict builder it replaced, on a synthetic payload mixing stocks,
+options and rows with float-strings, and checks that both produce the
+same DataFrame.
+
+Usage:
+    python benchmarks/bench_market_watch.py [--rows 8000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from algotik_tse.core.market_data import (  # noqa: E402
+    _add_change,
+    _heven_to_time_str,
+    _parse_stock_rows,
+    _safe_int,
+)
+
+
+def make_rows(n, seed=1):
+    """Synthetic part 2 of a MarketWatchInit response (';'-separated rows)."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        y = rnd.randint(1000, 50000)
+        close = "{}.00".format(y + 7) if i % 3 == 0 else str(y + 7)
+        fields = [
+            str(10**16 + i), "IRO1X{:07d}".format(i), "نماد{}".format(i),
+            "شرکت نمونه {}".format(i), str(rnd.choice([90019, 122959, 123000])),
+            str(y), close, str(y - 3), str(rnd.randint(0, 500)),
+            str(rnd.randint(0, 10**7)), str(rnd.randint(0, 10**12)),
+            str(y - 60), str(y + 60), str(y), str(rnd.choice([0, 123, -4, ""])),
+            "1", "0", str(rnd.randint(1, 4)), "27", str(y + 300), str(y - 300),
+            str(rnd.randint(1, 10**6)), rnd.choice(["300", "311", "305"]),
+            "0", "", rnd.choice(["N1", "N2", "Z1"]),
+        ]
+        if i % 50 == 7:
+            fields = fields[:23]  # rows without NAV / market code
+        rows.append(",".join(fields))
+    return ";".join(rows)
+
+
+def legacy_parse(stock_data):
+    """The previous per-row implementation from ``core/market_data.py``."""
+    records = []
+    for item in stock_data.strip().split(";"):
+        f = item.split(",")
+        if len(f) < 22:
+            continue
+        try:
+            records.append(
+                {
+                    "InsCode": f[0].strip(),
+                    "ISIN": f[1].strip(),
+                    "Symbol": f[2].strip(),
+                    "Name": f[3].strip(),
+                    "Time": _heven_to_time_str(f[4]),
+                    "Yesterday": _safe_int(f[5]),
+                    "Close": _safe_int(f[6]),
+                    "Last": _safe_int(f[7]),
+                    "TradeCount": _safe_int(f[8]),
+                    "Volume": _safe_int(f[9]),
+                    "Value": _safe_int(f[10]),
+                    "Low": _safe_int(f[11]),
+                    "High": _safe_int(f[12]),
+                    "EPS": _safe_int(f[14]),
+                    "PriceYesterday": _safe_int(f[13]),
+                    "Flow": _safe_int(f[17]),
+                    "SectorCode": f[18].strip(),
+                    "MaxAllowed": _safe_int(f[19]),
+                    "MinAllowed": _safe_int(f[20]),
+                    "BaseVolume": _safe_int(f[21]),
+                    "InstrumentType": _safe_int(f[22]) if len(f) > 22 else 0,
+                    "NAV": _safe_int(f[23]) if len(f) > 23 else 0,
+                    "MarketCode": f[25].strip() if len(f) > 25 else "",
+                }
+            )
+        except Exception:
+            continue
+    df = pd.DataFrame(records)
+    if not df.empty:
+        _add_change(df)
+    return df
+
+
+def run(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(text)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=8000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = make_rows(args.rows)
+    legacy_time, legacy = run(legacy_parse, text, args.repeat)
+    fast_time, fast = run(_parse_stock_rows, text, args.repeat)
+
+    pd.testing.assert_frame_equal(legacy, fast)
+
+    print("{} instrument rows".format(args.rows))
+    print("  per-row dicts  : {:8.4f} s".format(legacy_time))
+    print("  bulk parser    : {:8.4f} s".format(fast_time))
+    print("  speedup        : {:8.1f}x (outputs identical)".format(legacy_time / fast_time))
+
+
+if __name__ == "__main__":
+    main()
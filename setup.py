@@ -25,6 +25,11 @@ requirements = [
     "openpyxl>=3.0.0",
 ]
 
+extras_requirements = {
+    "async": ["httpx>=0.23.0"],
+    "store": ["pyarrow>=10.0.0"],
+}
+
 test_requirements = [
     "pytest>=7.0",
 ]
@@ -51,6 +56,7 @@ setup(
     ],
     description="A comprehensive Python library for fetching Tehran Stock Exchange (TSETMC) and currency/coin market data.",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="GNU General Public License v3",
     long_description=read_readme() + "\n\n" + read_history(),
     long_description_content_type="text/markdown",
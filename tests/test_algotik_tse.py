@@ -775,6 +775,586 @@ def test_list_funds_invalid():
     return pd.DataFrame({"status": ["PASS - returned None as expected"]})
 
 
+# ─── 91. stock() — multi-stock with parallel workers ────────
+def test_stock_multi_parallel():
+    """max_workers>1 must return the same frame as the serial loop."""
+    symbols = ["شتران", "فملی", "فولاد"]
+    serial = att.stock(symbol=symbols, limit=20, progress=False)
+    parallel = att.stock(symbol=symbols, limit=20, progress=False, max_workers=3)
+    assert serial.equals(parallel), "parallel result differs from serial"
+    return parallel
+
+
+# ─── 92. aio.get_history: same frames as the blocking API ────
+def test_aio_get_history():
+    """The asyncio API must return the same frame as the blocking one."""
+    import asyncio
+    from algotik_tse import aio
+
+    symbols = ["شتران", "فملی"]
+    sync_df = att.get_history(symbols, limit=20, progress=False)
+
+    async def _run():
+        try:
+            return await aio.get_history(symbols, limit=20, progress=False)
+        finally:
+            await aio.aclose()
+
+    async_df = asyncio.run(_run())
+    assert sync_df.equals(async_df), "async result differs from sync"
+    return async_df
+
+
+# ─── 93. Per-host token-bucket rate limiter ──────────────────
+def test_rate_limiter_per_host():
+    """Each host has its own token bucket; unlimited hosts never wait."""
+    from algotik_tse.rate_limiter import HostRateLimiter
+
+    saved = (settings.rate_limit_delay, settings.rate_limit_burst, settings.rate_limits)
+    try:
+        settings.rate_limit_delay = 0.5
+        settings.rate_limit_burst = 1
+        settings.rate_limits = {"api.tgju.org": None}
+        limiter = HostRateLimiter()
+        waits = [limiter.reserve("https://cdn.tsetmc.com/api/x") for _ in range(3)]
+        assert waits[0] == 0 and waits[1] > 0.4 and waits[2] > 0.9, waits
+        assert limiter.reserve("http://old.tsetmc.com/x") == 0, "hosts share a bucket"
+        assert all(limiter.reserve("https://api.tgju.org/x") == 0 for _ in range(5))
+    finally:
+        settings.rate_limit_delay, settings.rate_limit_burst, settings.rate_limits = saved
+    return waits
+
+
+# ─── 94. On-disk HTTP cache round trip ───────────────────────
+def test_http_cache_roundtrip():
+    """Cached responses are served from disk and match the live body."""
+    import tempfile
+    from algotik_tse import http_cache
+    from algotik_tse.http_client import safe_get
+
+    saved = (settings.cache_enabled, settings.cache_dir)
+    try:
+        settings.cache_enabled = True
+        settings.cache_dir = tempfile.mkdtemp(prefix="att-cache-")
+        url = settings.url_search.format("شتران")
+        live = safe_get(url)
+        cached = safe_get(url)
+        assert getattr(cached, "from_cache", False), "second call not cached"
+        assert cached.content == live.content
+        assert http_cache.get(settings.url_market_watch_init) is None
+        att.clear_cache()
+        assert http_cache.get(url) is None
+    finally:
+        settings.cache_enabled, settings.cache_dir = saved
+    return cached.json()
+
+
+# ─── 95. Local symbol index ──────────────────────────────────
+def test_symbol_index():
+    """Symbols resolve from the local index with the same InsCode as search."""
+    from algotik_tse.core import symbol_index
+
+    count = att.refresh_symbol_index()
+    assert count and count > 500, "index too small: {}".format(count)
+    code = symbol_index.lookup("فملی")
+    assert code is not None, "فملی missing from index"
+    return "{} symbols, فملی={}".format(count, code)
+
+
+# ─── 96. Local Parquet history store ─────────────────────────
+def test_history_store():
+    """Stored history must give the same frame as a fresh download."""
+    import tempfile
+
+    saved = (settings.history_store, settings.data_dir)
+    try:
+        fresh = att.get_history("فملی", output_type="full", progress=False)
+        fresh_ri = att.get_client_type("فملی", progress=False)
+        settings.history_store = True
+        settings.data_dir = tempfile.mkdtemp(prefix="att-store-")
+        first = att.get_history("فملی", output_type="full", progress=False)
+        stored = att.get_history("فملی", output_type="full", progress=False)
+        assert first.equals(fresh), "store download differs from plain download"
+        assert stored.equals(fresh), "stored history differs from download"
+        ri = att.get_client_type("فملی", progress=False)
+        assert ri.equals(fresh_ri), "store client type differs from plain download"
+        stored_ri = att.get_client_type("فملی", progress=False)
+        assert stored_ri.equals(fresh_ri), "stored client type differs from download"
+        att.clear_history_store()
+    finally:
+        settings.history_store, settings.data_dir = saved
+    return stored.tail()
+
+
+# ─── 97. Bulk market history (ClosingPriceAll) ──────────────
+def test_market_history():
+    """One request returns daily rows of every instrument for recent sessions."""
+    df = att.get_market_history()
+    assert isinstance(df, pd.DataFrame), "Expected DataFrame"
+    assert len(df) > 0, "Empty DataFrame"
+    assert df.index.names == ["InsCode", "J-Date"], df.index.names
+    for col in ["Open", "High", "Low", "Close", "Final", "Volume", "Value"]:
+        assert col in df.columns, "Missing column: {}".format(col)
+    log("  sessions: {}".format(df.index.get_level_values("J-Date").nunique()))
+    log("  instruments: {}".format(df.index.get_level_values("InsCode").nunique()))
+    return df.head()
+
+
+# ─── 98. MarketWatchSession incremental updates ─────────────
+def test_market_watch_session():
+    """Init once, then apply MarketWatchPlus deltas to the snapshot."""
+    session = att.MarketWatchSession()
+    first = session.update()
+    assert not first.empty, "Initial snapshot is empty"
+    changed = session.update()
+    assert list(changed.columns) == list(first.columns), "Column mismatch"
+    snap = session.snapshot()["stocks"]
+    assert snap["InsCode"].is_unique, "Duplicate InsCode in snapshot"
+    assert len(snap) >= len(first)
+    log("  initial rows: {}, changed on poll: {}".format(len(first), len(changed)))
+    log("  cursor: h={} r={}".format(session._heven, session._refid))
+    return changed.head()
+
+
+# ─── 99. Shared market_watch snapshot ───────────────────────
+def test_shared_market_snapshot():
+    """list_* functions reuse one snapshot within max_age."""
+    from algotik_tse.core import market_data
+
+    first = att.get_market_snapshot()
+    started = market_data._snapshot[0]
+    att.list_etfs(progress=False, max_age=60)
+    att.list_bonds(progress=False, max_age=60)
+    assert market_data._snapshot[0] == started, "snapshot was downloaded again"
+    att.list_etfs(progress=False, force_refresh=True)
+    assert market_data._snapshot[0] > started, "force_refresh did not download"
+    cached = att.get_market_snapshot(max_age=60)
+    assert cached["stocks"].shape[1] == first["stocks"].shape[1]
+    return cached["stocks"].head(3)
+
+
+# ─── 100. Concurrent open-interest fetch ─────────────────────
+def test_options_chain_oi_concurrent():
+    """fetch_oi runs concurrently, reports progress and caches contracts."""
+    seen = []
+    chain = att.get_options_chain(
+        "اهرم",
+        fetch_oi=True,
+        progress=False,
+        max_workers=4,
+        progress_callback=lambda done, total: seen.append((done, total)),
+    )
+    calls = chain["calls"]
+    assert "OpenInterest" in calls.columns, "Missing OpenInterest"
+    total = len(calls) + len(chain["puts"])
+    assert seen and seen[-1] == (total, total), "Progress did not reach the end"
+    started = time.time()
+    again = att.get_options_chain("اهرم", fetch_oi=True, progress=False)
+    log("  contracts: {}, cached refetch: {:.2f}s".format(total, time.time() - started))
+    assert len(again["calls"]) == len(calls)
+    return calls[["Symbol", "Strike", "OpenInterest", "ContractSize"]].head()
+
+
+# ─── 101. Bulk option-name parser ────────────────────────────
+def test_parse_option_names_bulk():
+    """parse_option_names must agree with parse_option_name row by row."""
+    from algotik_tse.core.parsers import parse_option_name, parse_option_names
+
+    stocks = att.get_market_snapshot(max_age=60)["stocks"]
+    names = stocks.loc[stocks["InstrumentType"].isin([311, 312]), "Name"]
+    bulk = parse_option_names(names)
+    for name, (_, row) in zip(names, bulk.iterrows()):
+        single = parse_option_name(name)
+        assert bool(row["matched"]) == (single is not None), name
+        if single:
+            assert row["strike"] == single["strike"], name
+            assert row["expiry_jalali"] == single["expiry_jalali"], name
+            assert row["expiry_gregorian"] == single["expiry_gregorian"], name
+    log("  names parsed: {} ({} matched)".format(len(bulk), int(bulk["matched"].sum())))
+    return bulk.head()
+
+
+# ─── 102. All option chains in one pass ──────────────────────
+def test_all_option_chains():
+    """Every chain must match get_options_chain() for that underlying."""
+    chains = att.get_all_option_chains(progress=False, max_age=60)
+    assert isinstance(chains, dict) and chains, "No chains returned"
+    name = max(chains, key=lambda u: len(chains[u]["calls"]) + len(chains[u]["puts"]))
+    single = att.get_options_chain(name, progress=False, max_age=60)
+    assert chains[name]["calls"].equals(single["calls"]), "calls differ"
+    assert chains[name]["puts"].equals(single["puts"]), "puts differ"
+    assert chains[name]["underlying_price"] == single["underlying_price"]
+    frame = att.get_all_option_chains(progress=False, max_age=60, as_frame=True)
+    assert frame.index.names == ["Underlying", "ExpiryJalali", "Strike", "OptionType"]
+    log("  underlyings: {}, contracts: {}".format(len(chains), len(frame)))
+    return frame.head()
+
+
+# ─── 103. Option implied volatility and greeks ───────────────
+def test_option_greeks():
+    """Greeks on a live chain; IV solver round-trips synthetic prices."""
+    import numpy as np
+    from algotik_tse.core.analytics import black_scholes
+
+    vol = np.array([0.2, 0.45, 0.8, 1.2])
+    strike = np.array([8000, 10000, 12000, 10000])
+    kind = np.array(["call", "put", "call", "put"])
+    prices = black_scholes(10000, strike, 60 / 365, 0.3, vol, kind)
+    solved = att.implied_volatility(prices, 10000, strike, 60 / 365, 0.3, kind)
+    assert np.allclose(solved, vol, atol=1e-6), "IV round trip failed: {}".format(solved)
+
+    chain = att.option_greeks(att.get_options_chain("اهرم", progress=False))
+    for side in ("calls", "puts"):
+        df = chain[side]
+        if df.empty:
+            continue
+        for col in ("IV", "Delta", "Gamma", "Vega", "Theta"):
+            assert col in df.columns, "{} missing from {}".format(col, side)
+        delta = df["Delta"].dropna()
+        assert ((delta >= -1) & (delta <= 1)).all(), "Delta out of range"
+    log("  IV solved: {}/{} calls".format(
+        chain["calls"]["IV"].notna().sum() if "IV" in chain["calls"] else 0,
+        len(chain["calls"])))
+    return chain["calls"].head()
+
+
+# ─── 104. Treasury bill yield curve ──────────────────────────
+def test_yield_curve():
+    """Yield curve rows are unmatured treasuries with consistent yields."""
+    import numpy as np
+
+    curve = att.get_yield_curve(progress=False, max_age=60)
+    bonds = att.list_bonds(progress=False, max_age=60)
+    bills = bonds[(bonds["BondType"] == "treasury")]
+    assert len(curve) <= len(bills), "Curve has more rows than treasury bills"
+    if curve.empty:
+        return curve
+    assert (curve["DaysToMaturity"] > 0).all(), "Matured bill on the curve"
+    assert curve["DaysToMaturity"].is_monotonic_increasing, "Curve not sorted"
+    priced = curve[curve["Price"] > 0]
+    growth = 1_000_000 / priced["Price"]
+    years = priced["DaysToMaturity"] / 365
+    assert np.allclose(priced["YTM"], growth ** (1 / years) - 1), "YTM mismatch"
+    log("  bills on curve: {}".format(len(curve)))
+    return curve.head()
+
+
+# ─── 105. list_funds: concurrent category fetch ──────────────
+def test_list_funds_concurrent():
+    """A multi-type fetch returns the same funds as one call per type."""
+    types = ["equity", "mixed", "commodity"]
+    combined = att.list_funds(fund_type=types, progress=False)
+    parts = [att.list_funds(fund_type=t, progress=False) for t in types]
+    expected = sum(len(p) for p in parts)
+    assert len(combined) == expected, "{} funds, expected {}".format(len(combined), expected)
+    assert set(combined["fund_type"]) <= set(types), "Unexpected fund types"
+    log("  funds: {}".format(len(combined)))
+    return combined.head()
+
+
+# ─── 106. Fund NAV history from recorded snapshots ───────────
+def test_fund_nav_history():
+    """Recorded list_funds() snapshots are read back per fund."""
+    import tempfile
+
+    old_dir = att.settings.data_dir
+    att.settings.data_dir = tempfile.mkdtemp()
+    try:
+        funds = att.list_funds(fund_type="equity", progress=False)
+        written = att.record_fund_snapshot(funds)
+        assert written == funds["reg_no"].notna().sum(), "Not every fund recorded"
+        assert att.record_fund_snapshot(funds) == 0, "Unchanged funds recorded again"
+        reg_no = int(funds["reg_no"].dropna().iloc[0])
+        nav = att.get_fund_nav_history(reg_no)
+        assert len(nav) == 1, "Expected one recorded day"
+        row = funds[funds["reg_no"] == reg_no].iloc[0]
+        assert nav["nav_redemption"].iloc[0] == row["nav_redemption"], "NAV mismatch"
+        log("  recorded funds: {}".format(written))
+        return nav
+    finally:
+        att.clear_fund_store()
+        att.settings.data_dir = old_dir
+
+
+# ─── 107. Historical intraday: concurrent day fetch ──────────
+def test_intraday_concurrent_days():
+    """Concurrent and serial day fetches return the same candles."""
+    kwargs = dict(interval="5min", start="1404-11-01", end="1404-11-10", progress=False)
+    serial = att.get_intraday("شتران", max_workers=1, **kwargs)
+    parallel = att.get_intraday("شتران", max_workers=4, **kwargs)
+    assert serial is not None and parallel is not None, "No intraday data"
+    assert serial.equals(parallel), "Concurrent fetch differs from serial fetch"
+    assert parallel.index.is_monotonic_increasing, "Candles out of order"
+    log("  candles: {}".format(len(parallel)))
+    return parallel.head()
+
+
+# ─── 108. Trading calendar from the overall index sessions ───
+def test_trading_calendar():
+    """Holidays are skipped; sessions match the overall index history."""
+    assert att.is_session("1404-01-02"), "Weekday rule not used by default"
+    old = att.settings.trading_calendar
+    att.settings.trading_calendar = True
+    try:
+        sessions = att.refresh_trading_calendar()
+        assert sessions is not None and len(sessions) > 1000, "Too few sessions"
+        assert sessions.is_monotonic_increasing, "Sessions out of order"
+        assert not att.is_session("1404-01-02"), "Nowruz marked as a session"
+        assert not att.is_session("1404-11-09"), "Thursday marked as a session"
+        days = att.sessions_between("1404-01-01", "1404-01-31")
+        assert len(days) < 22, "Farvardin holidays not skipped"
+        index = att.get_history(
+            "شاخص کل", start="1404-01-01", end="1404-01-31", date_format="gregorian"
+        )
+        assert set(index.index) <= set(days), "Index session missing from the calendar"
+        log("  sessions: {}, Farvardin 1404: {}".format(len(sessions), len(days)))
+        return days
+    finally:
+        att.settings.trading_calendar = old
+
+
+# ─── 109. Historical intraday: local day store ───────────────
+def test_intraday_store():
+    """Stored past days are served from disk, identical to a download."""
+    import tempfile
+
+    old_dir, old_store = att.settings.data_dir, att.settings.intraday_store
+    att.settings.data_dir = tempfile.mkdtemp()
+    att.settings.intraday_store = True
+    try:
+        kwargs = dict(interval="5min", start="1404-11-01", end="1404-11-10", progress=False)
+        downloaded = att.get_intraday("شتران", **kwargs)
+        assert downloaded is not None, "No intraday data"
+        start = time.time()
+        stored = att.get_intraday("شتران", **kwargs)
+        elapsed = time.time() - start
+        assert stored.equals(downloaded), "Stored days differ from the download"
+        log("  candles: {}, from store in {:.3f}s".format(len(stored), elapsed))
+        return stored.head()
+    finally:
+        att.clear_intraday_store()
+        att.settings.data_dir, att.settings.intraday_store = old_dir, old_store
+
+
+# ─── 110. Multi-symbol intraday panel ────────────────────────
+def test_intraday_multi_symbol():
+    """A list of symbols returns candles aligned on one DateTime grid."""
+    symbols = ["شتران", "فولاد"]
+    kwargs = dict(interval="5min", start="1404-11-01", end="1404-11-05", progress=False)
+    panel = att.get_intraday(symbols, **kwargs)
+    assert panel is not None, "No intraday panel"
+    assert set(panel.columns.get_level_values(1)) == set(symbols), "Missing symbols"
+    single = att.get_intraday("فولاد", **kwargs)
+    close = panel[("Close", "فولاد")].dropna()
+    assert (close == single["Close"]).all(), "Panel differs from the single-symbol call"
+    long = att.get_intraday(symbols, layout="long", **kwargs)
+    assert list(long.index.names) == ["Symbol", "DateTime"], "Bad long index"
+    assert len(long) == len(panel) * len(symbols), "Symbols not on a common grid"
+    log("  grid: {} candles x {} symbols".format(len(panel), len(symbols)))
+    return panel.head()
+
+
+# ─── 111. TickStream: only new trades per poll ───────────────
+def test_tick_stream():
+    """A second poll returns only trades after the first poll's last nTran."""
+    stream = att.TickStream(["شتران", "فولاد"])
+    first = stream.poll()
+    last = stream.last_trade_numbers()
+    second = stream.poll()
+    assert set(first.columns) == {"Symbol", "TradeNo", "DateTime", "Price", "Volume"}
+    for symbol, trades in second.groupby("Symbol"):
+        assert (trades["TradeNo"] > last[symbol]).all(), "Old trades returned again"
+    log("  first poll: {} trades, second poll: {}".format(len(first), len(second)))
+    return first.tail()
+
+
+# ─── 112. CandleAggregator: incremental candles ──────────────
+def test_candle_aggregator():
+    """Candles built trade by trade equal get_intraday() candles."""
+    ticks = att.get_intraday("شتران", interval="tick", progress=False)
+    if ticks is None:
+        log("  no trades today, skipped")
+        return None
+    candles = att.CandleAggregator(["1min", "5min"])
+    closed = pd.concat([candles.update_trades(ticks), candles.flush()], ignore_index=True)
+    for interval in ["1min", "5min"]:
+        expected = att.get_intraday("شتران", interval=interval, progress=False)
+        # The last candle may have traded again between the two requests
+        got = closed[closed["Interval"] == interval].set_index("DateTime").iloc[:-1]
+        expected = expected.reindex(got.index)
+        assert (got["Close"] == expected["Close"]).all(), "{} candles differ".format(interval)
+    log("  candles: {}".format(len(closed)))
+    return closed.tail()
+
+
+# ─── 113. list_funds frame equals the row-by-row build ───────
+def test_funds_frame_matches_rows():
+    """_build_funds_frame() equals the original per-fund dict build."""
+    from algotik_tse.core.instruments import _build_funds_frame, _FUND_FIELDS
+
+    funds = [
+        {
+            "mfName": "ب",
+            "regNo": "11378",
+            "navRed": 1200.5,
+            "units": 10,
+            "initiationDate": "2019-05-01T00:00:00",
+            "manager": {"name": "x"},
+            "guarantor": "----",
+            "custodian": "حسابرس",
+        },
+        {
+            "mfName": None,
+            "regNo": 0,
+            "navRed": None,
+            "manager": "شرکت",
+            "guarantor": "بانک",
+            "initiationDate": "",
+        },
+        {"regNo": 11400, "navRed": 980, "units": 3, "marketMaker": "الف"},
+        {"mfName": "الف", "regNo": "", "custodian": None},
+    ]
+    fetched = [("equity", funds[:2]), ("mixed", funds[2:])]
+
+    rows = []
+    for label, items in fetched:
+        for f in items:
+            row = {"fund_name": f.get("mfName", ""), "fund_type": label}
+            row["reg_no"] = int(f["regNo"]) if f.get("regNo") else None
+            row.update({name: f.get(key) for name, key in _FUND_FIELDS.items()})
+            row["inception_date"] = (
+                f["initiationDate"][:10] if f.get("initiationDate") else None
+            )
+            row["guarantor"] = f.get("guarantor") if f.get("guarantor") != "----" else None
+            rows.append(row)
+    expected = pd.DataFrame(rows)
+    got = _build_funds_frame(fetched, progress=False)
+    expected = expected[got.columns].sort_values(["fund_type", "fund_name"], ignore_index=True)
+    pd.testing.assert_frame_equal(got, expected, check_exact=True)
+    assert {"name": "x"} in got["manager"].tolist(), "Nested objects must stay values"
+    assert got["fund_name"].isna().sum() == 1, "Null mfName should stay None"
+    log("  funds: {}".format(len(got)))
+    return got
+
+
+# ─── 114. Symbol index: ambiguous symbols fall back to search ─
+def test_symbol_index_ambiguous():
+    """A symbol listed under two InsCodes is not answered from the index."""
+    import tempfile
+    from algotik_tse.core import symbol_index
+
+    old_path = att.settings.symbol_index_path
+    att.settings.symbol_index_path = os.path.join(tempfile.mkdtemp(), "index.json")
+    try:
+        symbol_index.ingest(
+            [
+                ("فولاد", "46348559193224090"),
+                ("وبملت", "778253364357513"),
+                ("وبملت", "1111111111111111"),
+            ],
+            complete=True,
+        )
+        assert symbol_index.lookup("فولاد", build=False) == "46348559193224090"
+        assert symbol_index.lookup("وبملت", build=False) is None, "Ambiguous symbol indexed"
+        symbol_index.ingest([("فولاد", "46348559193224090"), ("فولاد", "3")])
+        assert symbol_index.lookup("فولاد", build=False) is None, "Conflict not dropped"
+        return "ok"
+    finally:
+        att.settings.symbol_index_path = old_path
+
+
+# ─── 115. market_history: session dates are verified ─────────
+def test_market_history_session_check():
+    """ClosingPriceAll rows are not dated with a calendar that is out of step."""
+    from unittest import mock
+    from algotik_tse.core import market_data
+    from algotik_tse.exceptions import DataParsingError
+
+    payload = {
+        "closingPriceDaily": [
+            {"dEven": 20260120, "pClosing": 1000.0, "qTotTran5J": 900.0, "zTotTran": 50},
+            {"dEven": 20260119, "pClosing": 995.0, "qTotTran5J": 800.0, "zTotTran": 40},
+        ]
+    }
+
+    class _Response:
+        status_code = 200
+
+        def json(self):
+            return payload
+
+    rows = market_data._parse_closing_price_all(
+        "111,0,1000,1001,50,900,9000,990,1010,995,998;"
+        "111,1,995,996,40,800,8000,990,1000,990,991"
+    )
+    sessions = pd.DatetimeIndex(["2026-01-18", "2026-01-19", "2026-01-20"])[::-1]
+    with mock.patch.object(market_data, "safe_get", lambda url: _Response()):
+        market_data._check_sessions(rows, sessions)
+        try:
+            market_data._check_sessions(rows, sessions[1:])  # one session behind
+        except DataParsingError:
+            return "ok"
+    raise AssertionError("Out-of-step calendar accepted")
+
+
+# ─── 116. market_watch: in-flight download is shared ─────────
+def test_market_watch_in_flight():
+    """max_age=0 calls arriving during a download share it (offline)."""
+    import threading
+    from unittest import mock
+    from algotik_tse.core import market_data
+
+    downloads = []
+
+    def slow_get(url):
+        downloads.append(url)
+        time.sleep(0.3)
+        return mock.Mock(text="")
+
+    def parse(text):
+        return {"stocks": pd.DataFrame(), "market_time": "", "index_value": None}
+
+    with mock.patch.object(market_data, "safe_get", slow_get), mock.patch.object(
+        market_data, "_parse_market_watch", parse
+    ):
+        first = threading.Thread(target=market_data.market_watch)
+        first.start()
+        time.sleep(0.1)
+        market_data.market_watch()  # arrives while the first download runs
+        first.join()
+        assert len(downloads) == 1, "In-flight download not shared"
+        market_data.market_watch()
+        assert len(downloads) == 2, "max_age=0 reused a finished download"
+    return "ok"
+
+
+# ─── 117. Fund store: tiered compaction ──────────────────────
+def test_fund_store_tiers():
+    """Compaction merges one tier at a time and keeps every row (offline)."""
+    import tempfile
+    from algotik_tse.core import fund_store
+
+    old_dir, old_max = att.settings.data_dir, att.settings.fund_store_max_segments
+    att.settings.data_dir = tempfile.mkdtemp()
+    att.settings.fund_store_max_segments = 3
+    try:
+        funds = pd.DataFrame({"reg_no": [1, 2], "fund_name": ["a", "b"], "fund_type": "equity"})
+        for col in fund_store._VALUE_COLUMNS:
+            funds[col] = 1.0
+        for i in range(22):
+            funds["nav_redemption"] = float(i)
+            att.record_fund_snapshot(funds)
+        tiers = sorted(fund_store._tier(path) for path in fund_store._segments())
+        assert tiers == [0, 0, 1, 2], "Unexpected tiers {}".format(tiers)
+        nav = att.get_fund_nav_history(1, date_format="gregorian")
+        assert len(nav) == 1 and nav["nav_redemption"].iloc[0] == 21.0, "Last row lost"
+        assert len(pd.read_parquet(fund_store._segments())) == 44, "Rows lost in compaction"
+        return "ok"
+    finally:
+        att.clear_fund_store()
+        att.settings.data_dir, att.settings.fund_store_max_segments = old_dir, old_max
+
+
 # ──────────────────────────────────────────────────────────────
 # MAIN
 # ──────────────────────────────────────────────────────────────
@@ -896,6 +1476,33 @@ if __name__ == "__main__":
         (88, "NEW: list_funds(multi types)", test_list_funds_multi),
         (89, "NEW: list_funds nav & returns", test_list_funds_nav_data),
         (90, "NEW: list_funds invalid type", test_list_funds_invalid),
+        (91, "NEW: stock(multi, max_workers=3)", test_stock_multi_parallel),
+        (92, "NEW: aio.get_history(multi)", test_aio_get_history),
+        (93, "NEW: per-host token-bucket rate limiter", test_rate_limiter_per_host),
+        (94, "NEW: on-disk HTTP cache", test_http_cache_roundtrip),
+        (95, "NEW: local symbol index", test_symbol_index),
+        (96, "NEW: local Parquet history store", test_history_store),
+        (97, "NEW: get_market_history (bulk)", test_market_history),
+        (98, "NEW: MarketWatchSession (deltas)", test_market_watch_session),
+        (99, "NEW: shared market snapshot", test_shared_market_snapshot),
+        (100, "NEW: options chain OI (concurrent)", test_options_chain_oi_concurrent),
+        (101, "NEW: bulk option-name parser", test_parse_option_names_bulk),
+        (102, "NEW: get_all_option_chains", test_all_option_chains),
+        (103, "NEW: option_greeks / implied_volatility", test_option_greeks),
+        (104, "NEW: get_yield_curve", test_yield_curve),
+        (105, "NEW: list_funds concurrent categories", test_list_funds_concurrent),
+        (106, "NEW: record_fund_snapshot / get_fund_nav_history", test_fund_nav_history),
+        (107, "NEW: get_intraday concurrent historical days", test_intraday_concurrent_days),
+        (108, "NEW: trading calendar (is_session / sessions_between)", test_trading_calendar),
+        (109, "NEW: get_intraday local day store", test_intraday_store),
+        (110, "NEW: get_intraday multi-symbol panel", test_intraday_multi_symbol),
+        (111, "NEW: TickStream incremental polling", test_tick_stream),
+        (112, "NEW: CandleAggregator incremental candles", test_candle_aggregator),
+        (113, "NEW: list_funds frame matches the row-by-row build", test_funds_frame_matches_rows),
+        (114, "NEW: symbol index drops ambiguous symbols", test_symbol_index_ambiguous),
+        (115, "market_history session check (offline)", test_market_history_session_check),
+        (116, "market_watch shares in-flight download (offline)", test_market_watch_in_flight),
+        (117, "Fund store tiered compaction (offline)", test_fund_store_tiers),
     ]
 
     total_start = time.time()